@@ -1,6 +1,7 @@
 from decimal import Decimal, InvalidOperation
 import sys
 import numpy as np
+import scipy.sparse as sp
 
 from PySide6.QtWidgets import (
     QApplication,
@@ -14,23 +15,29 @@ from PySide6.QtWidgets import (
     QStackedWidget,
     QLabel,
     QLineEdit,
-    QTableWidget,
-    QTableWidgetItem,
+    QComboBox,
+    QTableView,
+    QFileDialog,
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QAbstractTableModel, QModelIndex
 
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
 from tasks.task1 import solve_task as solve_task_1
 from tasks.task2 import solve_task as solve_task_2
+from tasks.task2 import METHOD_LABELS, basin_map, plot_basin_map
 from tasks.task3 import solve_task as solve_task_3
-from tasks.task4 import solve_task as solve_task_4
+from tasks.task3 import sweep_omega as sweep_omega_3
+from tasks.task4 import MATRIX_FILE_TYPES, PowerSession, load_matrix
 from tasks.task5 import solve_task as solve_task_5
 from tasks.task6 import solve_task as solve_task_6
 from tasks.task7 import solve_task as solve_task_7
 from tasks.task8 import solve_task as solve_task_8
 
+# Rows of the task 5 comparison table shown in the console
+TASK5_PREVIEW_ROWS = 200
+
 
 class MplCanvas(FigureCanvas):
     def __init__(self, parent=None, width=5, height=4, dpi=100):
@@ -45,6 +52,8 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.setWindowTitle("Math Tasks App")
         self.resize(1100, 800)
+        # Warm-starts task 4 from the last eigenvector while the matrix is edited
+        self.task4_session = PowerSession()
 
         central_widget = QWidget()
         main_layout = QVBoxLayout(central_widget)
@@ -78,12 +87,18 @@ class MainWindow(QMainWindow):
             elif task_number == 2:
                 input_widget = Task2InputWidget()
                 input_widget.solveRequested.connect(self.solve_task2)
+                input_widget.basinRequested.connect(self.show_basin_map_task2)
             elif task_number == 3:
                 input_widget = Task3InputWidget()
                 input_widget.solveRequested.connect(self.solve_task_3)
+                input_widget.sweepRequested.connect(self.sweep_omega_task_3)
             elif task_number == 4:
                 input_widget = Task4InputWidget()
                 input_widget.solveRequested.connect(self.solve_task4)
+                # Cell edits change the matrix in place: drop its factorizations
+                input_widget.matrix_model.dataChanged.connect(
+                    lambda *args: self.task4_session.matrix_edited()
+                )
             elif task_number == 5:
                 input_widget = Task5InputWidget()
                 input_widget.solveRequested.connect(self.solve_task_5)
@@ -171,24 +186,32 @@ class MainWindow(QMainWindow):
         # Retrieve the Matplotlib canvas for the plot
         canvas = self.plot_stack.widget(0)
         # Execute the task
-        results = solve_task_1(n, a, b, c, axes=canvas.axes)
+        results = solve_task_1(n, a, b, c, axes=canvas.axes, cross_check=True)
 
         if results["approx_root_graph"] is None:
             console.append(
                 "Graphical method did not find a root on the interval. No results to display."
             )
         else:
-            console.append(
-                f"Approximatly root (graphical method): {results['approx_root_graph']}"
-            )
-            console.append(
-                f"Accurate root (bisection method, {results['iterations']} iterations): {results['approx_root_bis']}"
-            )
-            console.append(f"Absolute error: {results['abs_error']}")
+            for k in range(len(results["roots_bis"])):
+                console.append(f"Root #{k + 1}:")
+                console.append(
+                    f"Approximatly root (graphical method): {results['roots_graph'][k]}"
+                )
+                console.append(
+                    f"Accurate root (bisection method, {results['iterations_all'][k]} iterations): {results['roots_bis'][k]}"
+                )
+                console.append(f"Absolute error: {results['abs_errors'][k]}")
+                console.append(
+                    f"Distance to exact root (closed form): {results['exact_errors'][k]}"
+                )
+        console.append(f"Exact roots (closed form): {results['roots_exact']}")
         console.append("-" * 40)
         canvas.draw()
 
-    def solve_task2(self, n1_text, n2_text, a_text, b_text, c_text, d_text, tol_text):
+    def solve_task2(
+        self, n1_text, n2_text, a_text, b_text, c_text, d_text, tol_text, methods
+    ):
         """Обработка нажатия кнопки Solve для задачи 2."""
         console = self.console_stack.widget(1)
         try:
@@ -213,38 +236,80 @@ class MainWindow(QMainWindow):
         canvas = self.plot_stack.widget(1)
 
         # Вызываем функцию решения (solve_task_2) и получаем результаты
-        results = solve_task_2(n1, n2, a, b, c, d, tol, axes=canvas.axes)
+        try:
+            results = solve_task_2(
+                n1, n2, a, b, c, d, tol, axes=canvas.axes, methods=methods
+            )
+        except ValueError as error:
+            console.append(f"Error: {error}")
+            return
 
         # Выводим результаты в консоль:
-        console.append(f"Exact root (via np.roots): {results['exact_root']}")
-        console.append(
-            f"Bisection method root: {results['bisection_root']} (Iterations: {results['bisection_iterations']})"
-        )
+        console.append(f"Exact root (closed form): {results['exact_root']}")
+        for method, result in results["methods"].items():
+            console.append(
+                f"{METHOD_LABELS[method]} method root: {result['root']} "
+                f"(Iterations: {result['iteration_count']}, "
+                f"function evaluations: {result['function_evaluations']})"
+            )
+            # Выводим конечную абсолютную ошибку (последнее значение в массиве)
+            final_error = (
+                result["absolute_errors"][-1]
+                if len(result["absolute_errors"])
+                else "N/A"
+            )
+            console.append(
+                f"Final absolute error ({METHOD_LABELS[method]}): {final_error}"
+            )
+        console.append("-" * 40)
+
+        # Обновляем график
+        canvas.draw()
+
+    def show_basin_map_task2(self, n1_text, n2_text, a_text, b_text, c_text, d_text):
+        """Строит карту бассейнов притяжения метода Ньютона для задачи 2."""
+        console = self.console_stack.widget(1)
+        try:
+            n1 = float(n1_text)
+            n2 = float(n2_text)
+            a = float(a_text)
+            b = float(b_text)
+            c = float(c_text)
+            d = float(d_text)
+        except ValueError:
+            console.append(
+                "Error: invalid input. Please enter valid numbers for n1, n2, a, b, c, d."
+            )
+            return
+
+        # Квадратная область комплексной плоскости над интервалом [n1, n2]
+        half_width = (n2 - n1) / 2.0
         console.append(
-            f"Newton-Raphson method root: {results['newton_root']} (Iterations: {results['newton_iterations']})"
-        )
-        # Выводим конечные абсолютные ошибки (последние значения в списках)
-        final_bis_error = (
-            results["bisection_absolute_errors"][-1]
-            if results["bisection_absolute_errors"]
-            else "N/A"
+            f"Computing Newton basins on Re in [{n1}, {n2}], Im in [{-half_width}, {half_width}]"
         )
-        final_newton_error = (
-            results["newton_absolute_errors"][-1]
-            if results["newton_absolute_errors"]
-            else "N/A"
-        )
-        console.append(f"Final absolute error (Bisection): {final_bis_error}")
-        console.append(f"Final absolute error (Newton-Raphson): {final_newton_error}")
+
+        canvas = self.plot_stack.widget(1)
+        try:
+            results = basin_map(a, b, c, d, (n1, n2), (-half_width, half_width))
+        except ValueError as error:
+            console.append(f"Error: {error}")
+            return
+        plot_basin_map(results, axes=canvas.axes)
+
+        total = results["root_index"].size
+        for k, root in enumerate(results["roots"]):
+            share = np.count_nonzero(results["root_index"] == k) / total
+            console.append(f"Root {k + 1} = {root}: {share:.1%} of start points")
+        share = np.count_nonzero(results["root_index"] < 0) / total
+        console.append(f"Not converged: {share:.1%} of start points")
         console.append("-" * 40)
 
-        # Обновляем график
         canvas.draw()
 
     def solve_task_3(self, omega_text, a_text, b_text, c_text):
         console = self.console_stack.widget(2)
         try:
-            omega = float(omega_text)
+            omega = "auto" if omega_text in ("", "auto") else float(omega_text)
             a = float(a_text)
             b = float(b_text)
             c = float(c_text)
@@ -260,31 +325,100 @@ class MainWindow(QMainWindow):
         canvas = self.plot_stack.widget(2)
         results = solve_task_3(omega, a, b, c, axes=canvas.axes)
 
+        if omega == "auto":
+            console.append(f"Automatically chosen omega: {results['omega']}")
         console.append(f"Number of iterations: {results['iterations']}")
         console.append("Approximate solution using the relaxation method:")
         console.append(f"x = {results['x']}, y = {results['y']}, z = {results['z']}")
 
         canvas.draw()
 
-    def solve_task4(self, matrix):
-        console = self.console_stack.widget(3)
+    def sweep_omega_task_3(self, a_text, b_text, c_text):
+        console = self.console_stack.widget(2)
         try:
-            matrix = np.array(matrix, dtype=float)
+            a = float(a_text)
+            b = float(b_text)
+            c = float(c_text)
         except ValueError:
-            console.append("Error: invalid matrix input.")
+            console.append(
+                "Error: invalid input. Please enter valid numbers for a, b, c."
+            )
             return
 
-        console.append("Solving power method task")
+        console.append("Omega sweep of the relaxation method:")
+        results = sweep_omega_3(a, b, c)
+        console.append(
+            "{:<10} {:<12} {:<10}".format("omega", "iterations", "converged")
+        )
+        for omega, iterations, converged in zip(
+            results["omegas"], results["iterations"], results["converged"]
+        ):
+            console.append(f"{omega:<10.2f} {iterations:<12} {str(converged):<10}")
+        console.append(f"Best omega: {results['best_omega']}")
+        console.append("-" * 40)
+
+    def solve_task4(self, matrix, shift_text=""):
+        console = self.console_stack.widget(3)
+        if not (isinstance(matrix, np.ndarray) or sp.issparse(matrix)):
+            try:
+                matrix = np.array(matrix, dtype=float)
+            except ValueError:
+                console.append("Error: invalid matrix input.")
+                return
+        shift = None
+        if shift_text:
+            try:
+                shift = float(shift_text)
+            except ValueError:
+                console.append("Error: invalid shift. Please enter a number.")
+                return
+
+        console.append(
+            "Solving power method task"
+            if shift is None
+            else f"Solving shifted inverse iteration task (shift {shift})"
+        )
         console.append("Matrix A:")
         console.append(str(matrix))
 
         canvas = self.plot_stack.widget(3)
-        results = solve_task_4(matrix, axes=canvas.axes)
+        if shift is not None:
+            try:
+                results = self.task4_session.solve_shifted(
+                    shift, matrix, axes=canvas.axes
+                )
+            except (TypeError, ValueError, RuntimeError) as error:
+                console.append(f"Error: {error}")
+                return
+            console.append(f"Eigenvalue closest to {shift}: {results['lambda_approx']}")
+            console.append(f"Corresponding eigenvector (normalized):")
+            console.append(str(results["eigenvector"]))
+            console.append(f"Number of iterations: {len(results['iter_numbers'])}")
+            console.append(
+                f"Residual norm ||Ax - lambda x||: {results['residual_norm']}"
+            )
+            if results["reused"]:
+                console.append("Reused the LU factorization of this shift")
+            console.append("-" * 40)
+            canvas.draw()
+            return
+
+        results = self.task4_session.solve(matrix, axes=canvas.axes)
 
         console.append(f"Approximate largest eigenvalue: {results['lambda_approx']}")
         console.append(f"Corresponding eigenvector (normalized):")
         console.append(str(results["eigenvector"]))
         console.append(f"Number of iterations: {len(results['iter_numbers'])}")
+        if results["warm_start"]:
+            console.append(
+                f"Warm start from the previous eigenvector saved "
+                f"{results['iterations_saved']} iterations"
+            )
+        console.append(f"Estimated |lambda2/lambda1|: {results['ratio_estimate']:.6g}")
+        if np.isfinite(results["remaining_iterations"]):
+            console.append(
+                f"Predicted iterations remaining: {results['remaining_iterations']}"
+            )
         console.append("-" * 40)
 
         canvas.draw()
@@ -295,16 +429,27 @@ class MainWindow(QMainWindow):
         console.append("Solving exponential fit task")
 
         canvas = self.plot_stack.widget(4)
-        results = solve_task_5(x_input, y_input, axes=canvas.axes)
+        results = solve_task_5(
+            x_input, y_input, axes=canvas.axes, max_rows=TASK5_PREVIEW_ROWS
+        )
 
-        console.append("Comparison Table:")
-        console.append(
+        lines = ["Comparison Table:"]
+        lines.append(
             "{:<10} {:<15} {:<15} {:<15}".format("x", "y (data)", "y (model)", "Error")
         )
-        for xi, yi, yi_fit, error in results["errors"]:
-            console.append(
-                "{:<10.4f} {:<15.4f} {:<15.4f} {:<15.4e}".format(xi, yi, yi_fit, error)
-            )
+        lines.extend(
+            "{:<10.4f} {:<15.4f} {:<15.4f} {:<15.4e}".format(xi, yi, yi_fit, error)
+            for xi, yi, yi_fit, error in results["errors"]
+        )
+        hidden = results["rows_total"] - len(results["errors"])
+        if hidden > 0:
+            lines.append(f"... {hidden} more rows")
+        summary = results["summary"]
+        lines.append(
+            f"RMSE: {summary['rmse']:.6g}, max |error|: {summary['max_error']:.6g}, "
+            f"R^2: {summary['r2']:.6g}"
+        )
+        console.append("\n".join(lines))
         console.append(f"A fit: {results['A_fit']}")
         console.append(f"B fit: {results['B_fit']}")
         console.append(
@@ -430,7 +575,8 @@ class Task1InputWidget(QWidget):
 
 
 class Task2InputWidget(QWidget):
-    solveRequested = Signal(str, str, str, str, str, str, str)
+    solveRequested = Signal(str, str, str, str, str, str, str, str)
+    basinRequested = Signal(str, str, str, str, str, str)
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -471,10 +617,21 @@ class Task2InputWidget(QWidget):
         self.input_tol.setPlaceholderText("Enter tolerance value (1e-10)")
         layout.addWidget(self.input_tol)
 
+        self.input_method = QComboBox()
+        self.input_method.addItem("Bisection + Newton-Raphson", "default")
+        self.input_method.addItem("Compare all methods", "all")
+        for method, label in METHOD_LABELS.items():
+            self.input_method.addItem(label, method)
+        layout.addWidget(self.input_method)
+
         self.solve_button = QPushButton("Solve")
         layout.addWidget(self.solve_button)
 
+        self.basin_button = QPushButton("Newton basin map")
+        layout.addWidget(self.basin_button)
+
         self.solve_button.clicked.connect(self.on_solve_clicked)
+        self.basin_button.clicked.connect(self.on_basin_clicked)
 
     def on_solve_clicked(self):
         n1_text = self.input_n1.text().strip()
@@ -484,13 +641,25 @@ class Task2InputWidget(QWidget):
         c_text = self.input_c.text().strip()
         d_text = self.input_d.text().strip()
         tol_text = self.input_tol.text().strip()
+        methods = self.input_method.currentData()
         self.solveRequested.emit(
-            n1_text, n2_text, a_text, b_text, c_text, d_text, tol_text
+            n1_text, n2_text, a_text, b_text, c_text, d_text, tol_text, methods
+        )
+
+    def on_basin_clicked(self):
+        self.basinRequested.emit(
+            self.input_n1.text().strip(),
+            self.input_n2.text().strip(),
+            self.input_a.text().strip(),
+            self.input_b.text().strip(),
+            self.input_c.text().strip(),
+            self.input_d.text().strip(),
         )
 
 
 class Task3InputWidget(QWidget):
     solveRequested = Signal(str, str, str, str)
+    sweepRequested = Signal(str, str, str)
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -506,7 +675,9 @@ y = c - z
         layout.addWidget(self.label_info)
 
         self.input_omega = QLineEdit()
-        self.input_omega.setPlaceholderText("Enter the relaxation parameter ω")
+        self.input_omega.setPlaceholderText(
+            "Enter the relaxation parameter ω (empty or 'auto' to choose it)"
+        )
         layout.addWidget(self.input_omega)
 
         self.input_a = QLineEdit()
@@ -524,7 +695,11 @@ y = c - z
         self.solve_button = QPushButton("Solve")
         layout.addWidget(self.solve_button)
 
+        self.sweep_button = QPushButton("Sweep ω")
+        layout.addWidget(self.sweep_button)
+
         self.solve_button.clicked.connect(self.on_solve_clicked)
+        self.sweep_button.clicked.connect(self.on_sweep_clicked)
 
     def on_solve_clicked(self):
         omega_text = self.input_omega.text().strip()
@@ -533,9 +708,81 @@ y = c - z
         c_text = self.input_c.text().strip()
         self.solveRequested.emit(omega_text, a_text, b_text, c_text)
 
+    def on_sweep_clicked(self):
+        a_text = self.input_a.text().strip()
+        b_text = self.input_b.text().strip()
+        c_text = self.input_c.text().strip()
+        self.sweepRequested.emit(a_text, b_text, c_text)
+
+
+class MatrixTableModel(QAbstractTableModel):
+    """
+    Table model over a NumPy array (or a scipy.sparse matrix). The view only
+    asks for the cells it shows, so large matrices are never turned into one
+    widget item per cell. In-memory arrays are editable; memory-mapped files
+    and sparse matrices are shown read-only.
+    """
+
+    def __init__(self, matrix, parent=None):
+        super().__init__(parent)
+        self.matrix = matrix
+
+    def set_matrix(self, matrix):
+        self.beginResetModel()
+        self.matrix = matrix
+        self.endResetModel()
+
+    def editable(self):
+        return (
+            isinstance(self.matrix, np.ndarray)
+            and not isinstance(self.matrix, np.memmap)
+            and self.matrix.flags.writeable
+        )
+
+    def resize(self, size):
+        matrix = np.zeros((size, size))
+        keep = min(size, self.matrix.shape[0])
+        if sp.issparse(self.matrix):
+            matrix[:keep, :keep] = self.matrix[:keep, :keep].toarray()
+        else:
+            matrix[:keep, :keep] = self.matrix[:keep, :keep]
+        self.set_matrix(matrix)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.matrix.shape[0]
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.matrix.shape[1]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        return f"{self.matrix[index.row(), index.column()]:.10g}"
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole or not self.editable():
+            return False
+        try:
+            self.matrix[index.row(), index.column()] = float(value)
+        except ValueError:
+            return False
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if self.editable():
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        return str(section)
+
 
 class Task4InputWidget(QWidget):
-    solveRequested = Signal(np.ndarray)
+    solveRequested = Signal(object, str)
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -551,49 +798,65 @@ class Task4InputWidget(QWidget):
         self.input_size.setPlaceholderText("Enter the size of the square matrix")
         layout.addWidget(self.input_size)
 
-        self.input_matrix = QTableWidget()
-        self.input_matrix.setColumnCount(3)
-        self.input_matrix.setRowCount(3)
-        matrix = [
-            [6, 2, 3],
-            [2, 6, 4],
-            [3, 4, 6],
-        ]
-        for i in range(3):
-            for j in range(3):
-                self.input_matrix.setItem(i, j, QTableWidgetItem(str(matrix[i][j])))
-        self.input_matrix.resizeColumnsToContents()
+        matrix = np.array(
+            [
+                [6, 2, 3],
+                [2, 6, 4],
+                [3, 4, 6],
+            ],
+            dtype=float,
+        )
+        self.matrix_model = MatrixTableModel(matrix, self)
+        self.input_matrix = QTableView()
+        self.input_matrix.setModel(self.matrix_model)
         layout.addWidget(self.input_matrix)
 
+        self.import_button = QPushButton("Import matrix...")
+        layout.addWidget(self.import_button)
+
+        self.input_shift = QLineEdit()
+        self.input_shift.setPlaceholderText(
+            "Shift for inverse iteration (empty for the power method)"
+        )
+        layout.addWidget(self.input_shift)
+
         self.solve_button = QPushButton("Solve")
         layout.addWidget(self.solve_button)
 
         self.solve_button.clicked.connect(self.on_solve_clicked)
+        self.import_button.clicked.connect(self.on_import_clicked)
         self.input_size.textChanged.connect(self.on_size_changed)
 
     def on_solve_clicked(self):
-        size = self.input_matrix.rowCount()
-        matrix = np.zeros((size, size))
-        for i in range(size):
-            for j in range(size):
-                item = self.input_matrix.item(i, j)
-                if item is None:
-                    return
-                try:
-                    matrix[i, j] = float(item.text())
-                except ValueError:
-                    return
-        self.solveRequested.emit(matrix)
+        self.solveRequested.emit(
+            self.matrix_model.matrix, self.input_shift.text().strip()
+        )
+
+    def on_import_clicked(self):
+        patterns = " ".join(f"*{extension}" for extension in MATRIX_FILE_TYPES)
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Import matrix", "", f"Matrix files ({patterns})"
+        )
+        if not path:
+            return
+        try:
+            matrix = load_matrix(path)
+        except (OSError, ValueError) as error:
+            self.label_info.setText(f"Could not import {path}: {error}")
+            return
+        self.matrix_model.set_matrix(matrix)
+        # Show the new size without resizing (copying) the imported matrix
+        self.input_size.blockSignals(True)
+        self.input_size.setText(str(matrix.shape[0]))
+        self.input_size.blockSignals(False)
 
     def on_size_changed(self):
         try:
             size = int(self.input_size.text())
-            self.input_matrix.setColumnCount(size)
-            self.input_matrix.setRowCount(size)
-            self.input_matrix.setVerticalHeaderLabels([f"{i}" for i in range(size)])
-            self.input_matrix.resizeColumnsToContents()
         except ValueError:
-            pass
+            return
+        if size > 0 and size != self.matrix_model.matrix.shape[0]:
+            self.matrix_model.resize(size)
 
 
 class Task5InputWidget(QWidget):
@@ -625,8 +888,8 @@ class Task5InputWidget(QWidget):
     def on_solve_clicked(self):
         x_text = self.input_x.text().strip()
         y_text = self.input_y.text().strip()
-        x_input = np.array([float(x) for x in x_text.split()])
-        y_input = np.array([float(y) for y in y_text.split()])
+        x_input = np.array(x_text.split(), dtype=float)
+        y_input = np.array(y_text.split(), dtype=float)
         self.solveRequested.emit(x_input, y_input)
 
 
@@ -0,0 +1,679 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import os
+import time
+import warnings
+import numpy as np
+import scipy.sparse as sp
+from scipy.linalg import LinAlgWarning, lu_factor, lu_solve
+from scipy.sparse.linalg import LinearOperator, aslinearoperator, eigs, eigsh, splu
+
+
+def as_operator(matrix):
+    """
+    Returns a square operator supporting `operator @ x` and `.shape`.
+
+    Dense arrays and scipy.sparse matrices are used as they are; anything else
+    (a scipy LinearOperator or any object with `shape` and `matvec`) is wrapped
+    with aslinearoperator, so the matrix is never materialized.
+    """
+    if isinstance(matrix, np.ndarray) or sp.issparse(matrix):
+        operator = matrix
+    else:
+        try:
+            operator = aslinearoperator(matrix)
+        except TypeError:
+            operator = aslinearoperator(np.asarray(matrix, dtype=float))
+    if len(operator.shape) != 2 or operator.shape[0] != operator.shape[1]:
+        raise ValueError("Matrix must be square.")
+    return operator
+
+
+class MemmapOperator(LinearOperator):
+    """
+    Dense square matrix stored on disk, applied without loading it into memory.
+
+    A .npy file is memory-mapped with np.load; any other file is read as raw
+    row-major binary of the given dtype and shape (starting at offset bytes).
+    Every product A @ x streams the matrix in blocks of rows of about
+    memory_budget / workers bytes, which a pool of threads multiplies
+    concurrently (NumPy releases the GIL during the products), so the memory
+    used stays near memory_budget whatever the size of the matrix.
+
+    The bytes read and the time taken by every product are appended to
+    self.io_history as (bytes, seconds) pairs.
+    """
+
+    def __init__(
+        self,
+        path,
+        shape: tuple = None,
+        dtype=np.float64,
+        offset: int = 0,
+        memory_budget: int = 64 * 2**20,
+        workers: int = None,
+    ):
+        if str(path).endswith(".npy"):
+            matrix = np.load(path, mmap_mode="r")
+        else:
+            if shape is None:
+                raise ValueError("shape is required for raw binary files.")
+            matrix = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=shape)
+        if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+            raise ValueError("Matrix must be square.")
+        super().__init__(dtype=matrix.dtype, shape=matrix.shape)
+        self.matrix = matrix
+        self.workers = workers or os.cpu_count() or 1
+        row_bytes = matrix.shape[1] * matrix.dtype.itemsize
+        self.block_rows = max(1, memory_budget // (self.workers * row_bytes))
+        self.io_history = []
+
+    def _multiply_block(self, x, out, start):
+        stop = min(start + self.block_rows, self.shape[0])
+        out[start:stop] = self.matrix[start:stop] @ x
+
+    def _matvec(self, x):
+        x = np.asarray(x).ravel()
+        out = np.empty(self.shape[0], dtype=np.result_type(self.dtype, x.dtype))
+        starts = range(0, self.shape[0], self.block_rows)
+        began = time.perf_counter()
+        if self.workers == 1 or len(starts) == 1:
+            for start in starts:
+                self._multiply_block(x, out, start)
+        else:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                list(executor.map(partial(self._multiply_block, x, out), starts))
+        self.io_history.append((self.matrix.nbytes, time.perf_counter() - began))
+        return out
+
+    def throughput(self) -> np.ndarray:
+        """Read throughput of every product so far, in bytes per second."""
+        io = np.array(self.io_history, dtype=float).reshape(-1, 2)
+        return io[:, 0] / io[:, 1]
+
+
+POWER_ACCELERATIONS = (None, "aitken", "chebyshev")
+
+
+def _is_symmetric(A, rtol: float = 1e-10) -> bool:
+    """Whether A equals its transpose up to rounding (relative to max |A_ij|)."""
+    if not (sp.issparse(A) or isinstance(A, np.ndarray)):
+        return False
+    if A.ndim != 2 or A.shape[0] != A.shape[1] or A.shape[0] == 0:
+        return False
+    if sp.issparse(A):
+        return abs(A - A.T).max() <= rtol * abs(A).max()
+    return np.allclose(A, A.T, rtol=rtol, atol=rtol * np.abs(A).max())
+
+
+def convergence_estimate(
+    eigenvalue_history, tol: float = 1e-10, symmetric: bool = False, window: int = 5
+) -> dict:
+    """
+    Estimates the convergence of a power iteration from its eigenvalue history.
+
+    The changes d_k = lambda_k - lambda_{k-1} of a power iteration shrink by a
+    constant factor q per iteration; q is estimated as the median of the last
+    `window` ratios |d_k / d_{k-1}|. The Rayleigh quotient converges as
+    |lambda2/lambda1|^2 for symmetric matrices and as |lambda2/lambda1| in
+    general, which gives the ratio estimate. The number of iterations left is
+    the number of further contractions needed for |d_k| to drop below tol.
+
+    Returns:
+        dict with keys "contraction" (q), "ratio" (|lambda2/lambda1|) and
+        "remaining_iterations"; nan when the history is too short or the
+        sequence does not contract.
+    """
+    changes = np.abs(np.diff(np.asarray(eigenvalue_history, dtype=float)))
+    estimate = {"contraction": np.nan, "ratio": np.nan, "remaining_iterations": np.nan}
+    if changes.size < 2:
+        return estimate
+    if changes[-1] < tol:
+        estimate["remaining_iterations"] = 0
+    recent = changes[-(window + 1) :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratios = recent[1:] / recent[:-1]
+    ratios = ratios[np.isfinite(ratios) & (ratios > 0)]
+    if ratios.size == 0:
+        return estimate
+    q = float(np.median(ratios))
+    estimate["contraction"] = q
+    estimate["ratio"] = np.sqrt(q) if symmetric else q
+    if q < 1 and changes[-1] >= tol:
+        estimate["remaining_iterations"] = int(
+            np.ceil(np.log(tol / changes[-1]) / np.log(q))
+        )
+    return estimate
+
+
+def _lambda2_estimate(q, symmetric, lambda1, radius=None) -> float:
+    """
+    |lambda2| implied by the contraction q of the Rayleigh quotients, for plain
+    power iteration (radius None) or Chebyshev iteration on [-radius, radius].
+    """
+    rate = np.sqrt(q) if symmetric else q
+    if radius is None:
+        return rate * lambda1
+    # Chebyshev iteration damps lambda relative to lambda1 by
+    # g(|lambda|/radius)/g(lambda1/radius) per step, g(t) = t + sqrt(t^2 - 1)
+    # outside the interval (and 1 inside it)
+    t1 = lambda1 / radius
+    g = rate * (t1 + np.sqrt(t1**2 - 1))
+    if g <= 1:
+        return 0.0
+    return (g + 1 / g) / 2 * radius
+
+
+def iter_power(
+    matrix,
+    x0=None,
+    tol: float = 1e-10,
+    max_iter: int = 1000,
+    acceleration: str = None,
+    chebyshev_bounds: tuple = None,
+    warmup: int = 10,
+    symmetric: bool = None,
+    dtype=np.float64,
+    rtol: float = 0.0,
+):
+    """
+    Generator version of the power method.
+
+    Yields the Rayleigh quotient x^T A x of every iteration. The iteration stops
+    when two consecutive approximations differ by less than tol (plus rtol
+    times the eigenvalue). The generator
+    returns a dict with keys "eigenvalue", "eigenvector", "iterations",
+    "converged" and "ratio_estimate" (|lambda2/lambda1|, see
+    convergence_estimate).
+
+    Only products A @ x are needed, so matrix may be dense, sparse or any
+    operator accepted by as_operator.
+
+    acceleration:
+      - None: plain power iteration.
+      - "aitken": Aitken's delta-squared extrapolation of the Rayleigh quotients;
+        the extrapolated values are yielded and checked for convergence.
+      - "chebyshev": Chebyshev-filtered iteration for matrices with a real
+        spectrum. The iterates follow the Chebyshev recurrence on the interval
+        chebyshev_bounds = (a, b) that should contain all eigenvalues except the
+        dominant one, which damps them uniformly instead of by |lambda/lambda1|
+        per step. If no bounds are given, plain iterations are run until the
+        estimate of |lambda2| from convergence_estimate settles (at least
+        `warmup` of them) and the interval [-r, r] with r slightly above
+        |lambda2| is used. Early estimates tend to be low, so the observed
+        contraction keeps being checked, and when it shows |lambda2| > r the
+        interval is widened and the recurrence restarted. Still one product
+        A @ x per iteration. The ratio estimate is the last |lambda2| estimate
+        that placed the interval (nan if it cannot be inferred).
+
+    symmetric: whether A is symmetric, which decides how the ratio is estimated
+    from the Rayleigh quotients; detected for explicit matrices if None.
+
+    dtype: floating type of the iteration vectors; the products are done in
+    the precision of A and x (see iter_power_mixed for single precision).
+    """
+    if acceleration not in POWER_ACCELERATIONS:
+        raise ValueError(f"Unknown acceleration: {acceleration!r}")
+    A = as_operator(matrix)
+    n = A.shape[0]
+    x = np.ones(n, dtype=dtype) if x0 is None else np.array(x0, dtype=dtype)
+    x = x / np.linalg.norm(x)
+
+    if symmetric is None:
+        symmetric = _is_symmetric(A)
+
+    rayleigh = []
+    ratio_estimate = q_prev = np.nan
+    x_prev = None  # previous Chebyshev iterate, scaled like x
+    center = half_width = None
+    adaptive = chebyshev_bounds is None
+    start = 0  # iteration at which the current recurrence started
+    if acceleration == "chebyshev" and not adaptive:
+        a, b = chebyshev_bounds
+        center, half_width = (b + a) / 2, (b - a) / 2
+
+    lambda_approx = None
+    converged = False
+    iterations = 0
+    for iterations in range(1, max_iter + 1):
+        y = A @ x
+        rayleigh.append(np.dot(x, y))
+        lambda_prev, lambda_approx = lambda_approx, rayleigh[-1]
+        if acceleration == "aitken" and len(rayleigh) >= 3:
+            l0, l1, l2 = rayleigh[-3:]
+            denominator = l2 - 2 * l1 + l0
+            if denominator != 0:
+                lambda_approx = l2 - (l2 - l1) ** 2 / denominator
+        yield lambda_approx
+        if lambda_prev is not None and abs(lambda_approx - lambda_prev) < (
+            tol + rtol * abs(lambda_approx)
+        ):
+            converged = True
+            break
+        if iterations == max_iter:
+            break
+
+        if acceleration == "chebyshev" and adaptive and iterations - start >= warmup:
+            q = convergence_estimate(rayleigh[start:], tol)["contraction"]
+            if abs(q - q_prev) <= 0.01 * q:
+                estimate = _lambda2_estimate(
+                    q, symmetric, abs(lambda_approx), half_width
+                )
+                lambda1 = abs(lambda_approx)
+                if half_width is None and estimate >= lambda1:
+                    pass  # too noisy to place the interval yet
+                elif half_width is None or estimate > half_width:
+                    # |lambda2| lies outside the damped interval: widen it by a
+                    # quarter of the gap (half the remaining gap if the noisy
+                    # estimate is not below lambda1) and restart the recurrence
+                    ratio = estimate / lambda1
+                    if ratio < 1:
+                        ratio_estimate = ratio
+                        half_width = (1 + 3 * ratio) / 4 * lambda1
+                    else:
+                        half_width = (half_width + lambda1) / 2
+                    center = 0.0
+                    x_prev, start, q_prev = None, iterations, np.nan
+            q_prev = q
+        if center is None:
+            x = y / np.linalg.norm(y)
+            continue
+        # Three-term Chebyshev recurrence in t = (A - center)/half_width; x_prev and
+        # x are rescaled together, which keeps the (linear) recurrence intact.
+        z = (y - center * x) / half_width
+        if x_prev is None:
+            x_prev = x
+        else:
+            z = 2 * z - x_prev
+            x_prev = x
+        scale = np.linalg.norm(z)
+        x, x_prev = z / scale, x_prev / scale
+
+    if acceleration != "chebyshev" or (adaptive and np.isnan(ratio_estimate)):
+        ratio_estimate = convergence_estimate(rayleigh, tol, symmetric)["ratio"]
+    elif not adaptive and center == 0 and lambda_approx:
+        # |lambda2| implied by the observed contraction on the given [-r, r]
+        # (unknown if it lies inside the interval, which gives 0)
+        q = convergence_estimate(rayleigh, tol)["contraction"]
+        lambda1 = abs(lambda_approx)
+        ratio = _lambda2_estimate(q, symmetric, lambda1, half_width) / lambda1
+        if 0 < ratio < 1:
+            ratio_estimate = ratio
+    return {
+        "eigenvalue": lambda_approx,
+        "eigenvector": x,
+        "iterations": iterations,
+        "converged": converged,
+        "ratio_estimate": ratio_estimate,
+    }
+
+
+def _float64_operator(matrix, block_bytes: int = 32 * 2**20):
+    """
+    Operator computing A @ x in double precision. A dense single-precision
+    matrix is converted in blocks of rows of about block_bytes, instead of
+    the n x n float64 copy NumPy would make for a mixed-type product.
+    """
+    if not isinstance(matrix, np.ndarray) or matrix.dtype == np.float64:
+        return as_operator(matrix)
+    n = matrix.shape[0]
+    block_rows = max(1, block_bytes // (8 * n))
+
+    def matvec(x):
+        x = np.asarray(x, dtype=np.float64).ravel()
+        out = np.empty(n)
+        for start in range(0, n, block_rows):
+            stop = min(start + block_rows, n)
+            out[start:stop] = matrix[start:stop].astype(np.float64) @ x
+        return out
+
+    return LinearOperator((n, n), matvec=matvec, dtype=np.float64)
+
+
+def as_float32(matrix):
+    """
+    Single-precision copy of an explicit matrix (unchanged if it already is
+    float32); other operators are returned as they are.
+    """
+    if isinstance(matrix, np.ndarray) or sp.issparse(matrix):
+        return matrix.astype(np.float32, copy=False)
+    return as_operator(matrix)
+
+
+def _iter_ritz_refinement(A, x, tol: float, max_iter: int, krylov_dim: int = 12):
+    """
+    Refines an approximate dominant eigenvector x by restarted Arnoldi
+    (Lanczos for symmetric A) Rayleigh-Ritz extraction.
+
+    Each product extends an orthonormal Krylov basis of x, A x, A^2 x, ... and
+    yields the Ritz value of largest magnitude (the first one is the Rayleigh
+    quotient of x). After krylov_dim products the iteration restarts from the
+    Ritz vector. Stops when two consecutive Ritz values differ by less than
+    tol. Returns a dict like iter_power.
+    """
+    n = A.shape[0]
+    m = max(1, min(krylov_dim, n))
+    x = np.asarray(x, dtype=np.float64)
+    Q = np.empty((n, m + 1))
+    H = np.zeros((m + 1, m))
+    Q[:, 0] = x / np.linalg.norm(x)
+
+    theta = None
+    converged = False
+    iterations = 0
+    j = 0
+    while iterations < max_iter:
+        w = A @ Q[:, j]
+        iterations += 1
+        # Modified Gram-Schmidt, repeated once for orthogonality
+        for _ in range(2):
+            coefficients = Q[:, : j + 1].T @ w
+            w = w - Q[:, : j + 1] @ coefficients
+            H[: j + 1, j] += coefficients
+        H[j + 1, j] = np.linalg.norm(w)
+
+        values, vectors = np.linalg.eig(H[: j + 1, : j + 1])
+        top = np.argmax(np.abs(values))
+        theta_prev, theta = theta, values[top].real
+        yield theta
+        exhausted = H[j + 1, j] <= np.finfo(float).eps * abs(theta)
+        if (theta_prev is not None and abs(theta - theta_prev) < tol) or exhausted:
+            converged = True
+        if converged or j + 1 == m or iterations == max_iter:
+            x = Q[:, : j + 1] @ vectors[:, top].real
+            x = x / np.linalg.norm(x)
+            if converged:
+                break
+            # Restart from the Ritz vector
+            Q[:, 0] = x
+            H[:] = 0.0
+            j = 0
+            continue
+        Q[:, j + 1] = w / H[j + 1, j]
+        j += 1
+
+    return {
+        "eigenvalue": theta,
+        "eigenvector": x,
+        "iterations": iterations,
+        "converged": converged,
+    }
+
+
+def iter_power_mixed(
+    matrix,
+    x0=None,
+    tol: float = 1e-10,
+    max_iter: int = 1000,
+    krylov_dim: int = 12,
+    matrix32=None,
+    **kwargs,
+):
+    """
+    Mixed-precision power method.
+
+    The power iteration first runs on a float32 copy of A (matrix32, made by
+    as_float32 if not given) with float32 vectors, which halves the memory
+    traffic of every product, until the eigenvalue stops changing at single
+    precision. The vector is then refined in float64 by Rayleigh-Ritz
+    extraction from a small Krylov space (restarted every krylov_dim products,
+    see _iter_ritz_refinement): where more float64 power steps would still
+    contract the error by only |lambda2/lambda1| each, this needs a few
+    products to reach double precision. matrix itself may be float32: the
+    refinement products then convert it to float64 block by block.
+
+    Yields the eigenvalue approximations of both phases and returns the dict
+    of iter_power, with "low_precision_iterations" and "refinement_iterations".
+    Other keyword arguments (acceleration, ...) are passed to the float32 phase.
+    """
+    if matrix32 is None:
+        matrix32 = as_float32(matrix)
+    # Changes below a few float32 roundoffs of lambda are noise
+    low = yield from iter_power(
+        matrix32,
+        x0,
+        tol,
+        max_iter,
+        rtol=10 * np.finfo(np.float32).eps,
+        dtype=np.float32,
+        **kwargs,
+    )
+    refine = yield from _iter_ritz_refinement(
+        _float64_operator(matrix),
+        low["eigenvector"],
+        tol,
+        max(max_iter - low["iterations"], 1),
+        krylov_dim,
+    )
+    return {
+        **refine,
+        "iterations": low["iterations"] + refine["iterations"],
+        "ratio_estimate": low["ratio_estimate"],
+        "low_precision_iterations": low["iterations"],
+        "refinement_iterations": refine["iterations"],
+    }
+
+
+EIGEN_METHODS = ("power", "subspace", "lanczos", "arnoldi", "shift-invert")
+
+
+def _sort_pairs(values, vectors):
+    order = np.argsort(-np.abs(values), kind="stable")
+    return np.real_if_close(values[order]), np.real_if_close(vectors[:, order])
+
+
+def residual_norms(matrix, eigenvalues, eigenvectors) -> np.ndarray:
+    """
+    Residual norms ||A v - lambda v|| of the eigenpairs (columns of eigenvectors).
+    """
+    A = as_operator(matrix)
+    V = np.asarray(eigenvectors)
+    return np.linalg.norm(A @ V - V * np.asarray(eigenvalues), axis=0)
+
+
+def iter_subspace(
+    matrix,
+    k: int,
+    block_size: int = None,
+    tol: float = 1e-10,
+    max_iter: int = 1000,
+    seed: int = 0,
+):
+    """
+    Generator version of subspace (block power) iteration with Rayleigh-Ritz
+    extraction of the k eigenvalues of largest magnitude.
+
+    block_size >= k columns are iterated together (2k by default); the extra
+    columns speed up convergence of the k-th eigenvalue from |lambda_{k+1}/lambda_k|
+    to |lambda_{p+1}/lambda_k|. Every iteration costs one block product A @ Q,
+    which is reused for the Ritz values and residuals.
+
+    Yields the k Ritz values of every iteration. Stops when they change by less
+    than tol. Returns a dict with keys "eigenvalues", "eigenvectors",
+    "residual_norms", "iterations" and "converged".
+    """
+    A = as_operator(matrix)
+    n = A.shape[0]
+    if not 1 <= k <= n:
+        raise ValueError("k must satisfy 1 <= k <= n.")
+    p = min(n, 2 * k) if block_size is None else min(n, max(k, block_size))
+
+    Q, _ = np.linalg.qr(np.random.default_rng(seed).standard_normal((n, p)))
+    theta = None
+    converged = False
+    iterations = 0
+    for iterations in range(1, max_iter + 1):
+        Y = A @ Q
+        values, S = np.linalg.eig(Q.T @ Y)
+        order = np.argsort(-np.abs(values), kind="stable")[:k]
+        theta_prev, theta = theta, values[order]
+        S = S[:, order]
+        yield np.real_if_close(theta)
+        if theta_prev is not None and np.max(np.abs(theta - theta_prev)) < tol:
+            converged = True
+            break
+        if iterations == max_iter:
+            break
+        Q, _ = np.linalg.qr(Y)
+
+    # Q is orthonormal and the columns of S have unit norm, so V has too
+    V = Q @ S
+    residuals = np.linalg.norm(Y @ S - V * theta, axis=0)
+    return {
+        "eigenvalues": np.real_if_close(theta),
+        "eigenvectors": np.real_if_close(V),
+        "residual_norms": residuals,
+        "iterations": iterations,
+        "converged": converged,
+    }
+
+
+def krylov_eigenpairs(
+    matrix, k: int, method: str = "lanczos", tol: float = 0.0
+) -> dict:
+    """
+    The k eigenpairs of largest magnitude by implicitly restarted Lanczos
+    (symmetric matrices) or Arnoldi (general matrices) iteration (ARPACK).
+    Small matrices, for which ARPACK cannot return k pairs, are solved densely.
+    Lanczos on an explicit matrix that is not symmetric raises a ValueError
+    (operators cannot be checked and are assumed symmetric).
+
+    Returns a dict with keys "eigenvalues", "eigenvectors" and "residual_norms",
+    sorted by decreasing magnitude.
+    """
+    A = as_operator(matrix)
+    n = A.shape[0]
+    if not 1 <= k <= n:
+        raise ValueError("k must satisfy 1 <= k <= n.")
+    if (
+        method == "lanczos"
+        and (isinstance(A, np.ndarray) or sp.issparse(A))
+        and not _is_symmetric(A)
+    ):
+        raise ValueError("Lanczos needs a symmetric matrix; use method='arnoldi'.")
+    if method == "lanczos" and k < n:
+        values, vectors = eigsh(A, k=k, which="LM", tol=tol)
+    elif method == "arnoldi" and k < n - 1:
+        values, vectors = eigs(A, k=k, which="LM", tol=tol)
+    elif method in ("lanczos", "arnoldi"):
+        dense = A.toarray() if sp.issparse(A) else np.asarray(A @ np.eye(n))
+        if method == "lanczos":
+            values, vectors = np.linalg.eigh(dense)
+        else:
+            values, vectors = np.linalg.eig(dense)
+    else:
+        raise ValueError(f"Unknown Krylov method: {method!r}")
+
+    values, vectors = _sort_pairs(values, vectors)
+    values, vectors = values[:k], vectors[:, :k]
+    return {
+        "eigenvalues": values,
+        "eigenvectors": vectors,
+        "residual_norms": residual_norms(A, values, vectors),
+    }
+
+
+class ShiftInvertSolver:
+    """
+    Shifted inverse iteration for the eigenvalue of A closest to a shift.
+
+    The LU factorization of A - shift*I is cached per shift (the most recent
+    max_cached shifts), so refining several eigenvalues, or the same eigenvalue
+    again from a different start vector, factorizes each shift only once.
+    A must be given explicitly (dense array or scipy.sparse matrix). A shift
+    that is exactly an eigenvalue makes A - shift*I singular; it is then moved
+    by a relative sqrt(machine epsilon), which still converges to that
+    eigenvalue.
+    """
+
+    def __init__(self, matrix, max_cached: int = 8):
+        if sp.issparse(matrix):
+            self.matrix = sp.csc_matrix(matrix)
+        elif isinstance(matrix, LinearOperator) or hasattr(matrix, "matvec"):
+            raise TypeError(
+                "Shifted inverse iteration needs an explicit matrix "
+                "(numpy array or scipy.sparse matrix), not a linear operator."
+            )
+        else:
+            self.matrix = np.asarray(matrix, dtype=float)
+        if self.matrix.ndim != 2 or self.matrix.shape[0] != self.matrix.shape[1]:
+            raise ValueError("Matrix must be square.")
+        self.max_cached = max_cached
+        self.factorizations = {}
+
+    def _factorize(self, shift):
+        """x -> (A - shift*I)^{-1} x, or None if A - shift*I is exactly singular."""
+        n = self.matrix.shape[0]
+        if sp.issparse(self.matrix):
+            try:
+                return splu(
+                    (self.matrix - shift * sp.identity(n, format="csc")).tocsc()
+                ).solve
+            except RuntimeError:
+                return None
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", LinAlgWarning)
+            factors = lu_factor(self.matrix - shift * np.eye(n), check_finite=False)
+        if np.any(np.diag(factors[0]) == 0):
+            return None
+        return partial(lu_solve, factors, check_finite=False)
+
+    def factorization(self, shift):
+        """Returns the function x -> (A - shift*I)^{-1} x, factorizing on first use."""
+        solve = self.factorizations.pop(shift, None)
+        if solve is None:
+            solve = self._factorize(shift)
+            if solve is None:
+                scale = max(abs(shift), float(abs(self.matrix).max())) or 1.0
+                solve = self._factorize(shift + np.sqrt(np.finfo(float).eps) * scale)
+            if solve is None:
+                raise ValueError(f"A - {shift}*I cannot be factorized (singular).")
+            while len(self.factorizations) >= self.max_cached:
+                self.factorizations.pop(next(iter(self.factorizations)))
+        # Most recently used shifts are kept at the end
+        self.factorizations[shift] = solve
+        return solve
+
+    def solve(self, shift, x0=None, tol: float = 1e-10, max_iter: int = 100) -> dict:
+        """
+        Runs inverse iteration with the given shift.
+
+        Returns a dict with keys "eigenvalue", "eigenvector", "residual_norm",
+        "iterations" and "converged" (eigenvalue changed by less than tol).
+        """
+        iterates = self.iter_solve(shift, x0, tol, max_iter)
+        while True:
+            try:
+                next(iterates)
+            except StopIteration as stop:
+                return stop.value
+
+    def iter_solve(self, shift, x0=None, tol: float = 1e-10, max_iter: int = 100):
+        """
+        Generator version of solve: yields the Rayleigh quotient of every
+        iteration and returns the dict of solve.
+        """
+        solve = self.factorization(shift)
+        n = self.matrix.shape[0]
+        x = np.ones(n) if x0 is None else np.array(x0)
+        x = x / np.linalg.norm(x)
+        eigenvalue = None
+        converged = False
+        iterations = 0
+        for iterations in range(1, max_iter + 1):
+            y = solve(x)
+            x = y / np.linalg.norm(y)
+            previous, eigenvalue = eigenvalue, np.vdot(x, self.matrix @ x)
+            yield np.real_if_close(eigenvalue)
+            if previous is not None and abs(eigenvalue - previous) < tol:
+                converged = True
+                break
+
+        eigenvalue = np.real_if_close(eigenvalue)
+        return {
+            "eigenvalue": eigenvalue,
+            "eigenvector": x,
+            "residual_norm": float(np.linalg.norm(self.matrix @ x - eigenvalue * x)),
+            "iterations": iterations,
+            "converged": converged,
+        }
@@ -0,0 +1,188 @@
+import hashlib
+import numpy as np
+from scipy.linalg import solve_triangular
+
+# Models that become linear least-squares problems z = X c after transforming
+# the data. For each model:
+#   - "label": the model equation,
+#   - "design": x -> columns of the design matrix X,
+#   - "transform": y -> z (the linearized response),
+#   - "x_valid", "y_valid": domains of the transforms,
+#   - "parameters": coefficients c -> dict of model parameters,
+#   - "evaluate": (parameters, x) -> y.
+MODELS = {
+    "exponential": {
+        "label": "y = A * exp(B * x)",
+        "design": lambda x: [np.ones_like(x), x],
+        "transform": np.log,
+        "x_valid": lambda x: np.isfinite(x),
+        "y_valid": lambda y: y > 0,
+        "parameters": lambda c: {"A": np.exp(c[0]), "B": c[1]},
+        "evaluate": lambda p, x: p["A"] * np.exp(p["B"] * x),
+    },
+    "power": {
+        "label": "y = A * x^B",
+        "design": lambda x: [np.ones_like(x), np.log(x)],
+        "transform": np.log,
+        "x_valid": lambda x: x > 0,
+        "y_valid": lambda y: y > 0,
+        "parameters": lambda c: {"A": np.exp(c[0]), "B": c[1]},
+        "evaluate": lambda p, x: p["A"] * x ** p["B"],
+    },
+    "logarithmic": {
+        "label": "y = A + B * ln(x)",
+        "design": lambda x: [np.ones_like(x), np.log(x)],
+        "transform": lambda y: y,
+        "x_valid": lambda x: x > 0,
+        "y_valid": lambda y: np.isfinite(y),
+        "parameters": lambda c: {"A": c[0], "B": c[1]},
+        "evaluate": lambda p, x: p["A"] + p["B"] * np.log(x),
+    },
+    # Michaelis-Menten saturation, linearized as 1/y = 1/A + (B/A) * (1/x)
+    "saturating": {
+        "label": "y = A * x / (B + x)",
+        "design": lambda x: [np.ones_like(x), 1.0 / x],
+        "transform": lambda y: 1.0 / y,
+        "x_valid": lambda x: x != 0,
+        "y_valid": lambda y: y != 0,
+        "parameters": lambda c: {"A": 1.0 / c[0], "B": c[1] / c[0]},
+        "evaluate": lambda p, x: p["A"] * x / (p["B"] + x),
+    },
+}
+MODEL_NAMES = tuple(MODELS) + ("polynomial",)
+
+
+def _polynomial_model(degree: int, x_min: float, x_max: float) -> dict:
+    """
+    Polynomial of the given degree. The design matrix uses t = (x - center) /
+    half_width in [-1, 1], which keeps it well conditioned; the coefficients
+    are converted to powers of x by one fixed linear map.
+    """
+    center = (x_max + x_min) / 2
+    half_width = (x_max - x_min) / 2 or 1.0
+    # Column j: coefficients in powers of x of t^j
+    to_x = np.zeros((degree + 1, degree + 1))
+    for j in range(degree + 1):
+        power = np.polynomial.polynomial.polypow(
+            [-center / half_width, 1 / half_width], j
+        )
+        to_x[: j + 1, j] = power
+
+    def evaluate(p, x):
+        coefficients = p["coefficients"]
+        values = np.polynomial.polynomial.polyval(x, coefficients)
+        return values if coefficients.ndim == 1 else np.moveaxis(values, 0, -1)
+
+    terms = " + ".join(f"c{j} * x^{j}" for j in range(degree + 1))
+    return {
+        "label": f"y = {terms}",
+        "design": lambda x: list(
+            np.polynomial.polynomial.polyvander((x - center) / half_width, degree).T
+        ),
+        "transform": lambda y: y,
+        "x_valid": lambda x: np.isfinite(x),
+        "y_valid": lambda y: np.isfinite(y),
+        "parameters": lambda c: {"coefficients": to_x @ c},
+        "evaluate": evaluate,
+    }
+
+
+def get_model(model: str, degree: int = 2, x=None) -> dict:
+    """Returns the model specification (see MODELS) by name."""
+    if model == "polynomial":
+        if degree < 0:
+            raise ValueError("The polynomial degree must be nonnegative.")
+        x = np.asarray(x, dtype=float)
+        return _polynomial_model(degree, float(x.min()), float(x.max()))
+    if model not in MODELS:
+        raise ValueError(f"Unknown model: {model!r}")
+    return MODELS[model]
+
+
+class LinearFitter:
+    """
+    Least-squares fits of one linearizable model on a fixed x-grid.
+
+    The design matrix X and its reduced QR factorization X = Q R are computed
+    once; every fit of a response y then only costs Q^T z and a triangular
+    solve R c = Q^T z. Many responses sampled on the same grid can be fitted
+    in one call, as the rows of a 2-D array.
+    """
+
+    def __init__(self, model: str, x_data, degree: int = 2):
+        x = np.asarray(x_data, dtype=float)
+        self.model = model
+        self.spec = get_model(model, degree, x)
+        if x.ndim != 1 or not np.all(self.spec["x_valid"](x)):
+            raise ValueError(f"x values outside the domain of the {model} model.")
+        X = np.column_stack(self.spec["design"](x))
+        if X.shape[0] < X.shape[1]:
+            raise ValueError("Not enough points to fit the model.")
+        self.Q, self.R = np.linalg.qr(X)
+        diagonal = np.abs(np.diag(self.R))
+        if diagonal.min() <= 1e-12 * diagonal.max():
+            raise ValueError("The design matrix is rank deficient.")
+        self.x = x
+
+    def fit(self, y_data) -> dict:
+        """
+        Fits the model to y_data of shape (n,) or (m, n) (one response per row).
+
+        Returns:
+            dict of the model parameters (floats, or arrays of shape (m,) for
+            2-D y_data; "coefficients" of a polynomial has shape (degree + 1,)
+            or (degree + 1, m)).
+        """
+        y = np.asarray(y_data, dtype=float)
+        if y.shape[-1] != self.x.size:
+            raise ValueError("y_data must have one value per x value.")
+        if not np.all(self.spec["y_valid"](y)):
+            raise ValueError(f"y values outside the domain of the {self.model} model.")
+        z = self.spec["transform"](y).T
+        coefficients = solve_triangular(self.R, self.Q.T @ z)
+        return self.spec["parameters"](coefficients)
+
+    def evaluate(self, parameters: dict, x_data):
+        """Model values at x_data (shape (len(x), m) for parameters of m responses)."""
+        x = np.asarray(x_data, dtype=float)
+        if self.model != "polynomial" and np.ndim(parameters["A"]) > 0:
+            x = x[:, None]
+        return self.spec["evaluate"](parameters, x)
+
+
+# Fitters kept by get_fitter (most recently used last), and the limits on their
+# number and on the memory of their Q factors; larger fitters are not cached
+_FITTERS = {}
+_MAX_CACHED_FITTERS = 8
+_MAX_CACHED_BYTES = 64 * 2**20
+
+
+def get_fitter(model: str, x_data, degree: int = 2) -> LinearFitter:
+    """
+    LinearFitter for the model on the grid x_data. Fitters of small grids are
+    memoized on a digest of the grid values, so repeated fits on the same grid
+    reuse the QR factorization; for large grids hold on to the returned
+    fitter (or create a LinearFitter) instead.
+    """
+    x = np.ascontiguousarray(x_data, dtype=float)
+    if model != "polynomial":
+        degree = 0
+    digest = hashlib.blake2b(x, digest_size=16).digest()
+    key = (model, degree, x.shape, digest)
+    fitter = _FITTERS.pop(key, None)
+    if fitter is None:
+        fitter = LinearFitter(model, x, degree)
+    if fitter.Q.nbytes <= _MAX_CACHED_BYTES:
+        while len(_FITTERS) >= _MAX_CACHED_FITTERS or (
+            _FITTERS
+            and sum(f.Q.nbytes for f in _FITTERS.values()) + fitter.Q.nbytes
+            > _MAX_CACHED_BYTES
+        ):
+            _FITTERS.pop(next(iter(_FITTERS)))
+        _FITTERS[key] = fitter
+    return fitter
+
+
+def fit_model(model: str, x_data, y_data, degree: int = 2) -> dict:
+    """Fits the model to y_data (one response, or one per row); see LinearFitter.fit."""
+    return get_fitter(model, x_data, degree).fit(y_data)
@@ -0,0 +1,405 @@
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import eigsh, splu
+
+RELAXATION_METHODS = ("jacobi", "gauss-seidel", "sor")
+
+
+def red_black_colors(grid_shape: tuple) -> np.ndarray:
+    """
+    Red-black coloring of the unknowns of a structured grid (C order): the color
+    of grid point (i, j, ...) is (i + j + ...) % 2. For 5-point (7-point in 3-D)
+    stencils, unknowns of the same color are not coupled to each other.
+    """
+    return (np.indices(grid_shape).sum(axis=0) % 2).ravel()
+
+
+def _residual_norm(A, b, x) -> float:
+    return float(np.max(np.abs(b - A @ x)))
+
+
+def _check_options(method: str, criterion: str):
+    if method not in RELAXATION_METHODS:
+        raise ValueError(f"Unknown relaxation method: {method!r}")
+    if criterion not in ("residual", "change"):
+        raise ValueError(f"Unknown stopping criterion: {criterion!r}")
+
+
+def _make_sweep(A, diag, omega, method, ordering, grid_shape, colors):
+    """
+    Builds the function sweep(x, b) performing one relaxation iteration in place.
+    x and b are vectors of length n or (n, k) matrices with one system per column.
+    """
+    n = A.shape[0]
+
+    def column(v, x):
+        return v if x.ndim == 1 else v[:, None]
+
+    if method == "jacobi":
+
+        def sweep(x, b):
+            x += omega * (b - A @ x) / column(diag, x)
+
+    elif ordering == "natural":
+        # (D + omega*L) x_new = omega*b - (omega*U + (omega - 1)*D) x
+        lower = sp.tril(A, k=-1, format="csc")
+        upper = sp.triu(A, k=1, format="csr")
+        solver = splu(
+            (sp.diags(diag) + omega * lower).tocsc(),
+            permc_spec="NATURAL",
+            diag_pivot_thresh=0.0,
+        )
+
+        def sweep(x, b):
+            x[...] = solver.solve(
+                omega * b - omega * (upper @ x) + (1.0 - omega) * column(diag, x) * x
+            )
+
+    elif ordering in ("red-black", "colors"):
+        if ordering == "red-black":
+            if grid_shape is None:
+                raise ValueError("Red-black ordering requires grid_shape.")
+            colors = red_black_colors(grid_shape)
+        if colors is None or len(colors) != n:
+            raise ValueError("A color is required for every unknown.")
+        blocks = []
+        for color in np.unique(colors):
+            rows = np.flatnonzero(colors == color)
+            blocks.append((rows, A[rows], diag[rows]))
+
+        def sweep(x, b):
+            for rows, A_rows, d_rows in blocks:
+                x[rows] += omega * (b[rows] - A_rows @ x) / column(d_rows, x)
+
+    else:
+        raise ValueError(f"Unknown ordering: {ordering!r}")
+    return sweep
+
+
+def iter_sor(
+    A,
+    b,
+    omega: float = 1.0,
+    method: str = "sor",
+    x0=None,
+    tol: float = 1e-10,
+    max_iter: int = 1000,
+    criterion: str = "residual",
+    ordering: str = "natural",
+    grid_shape: tuple = None,
+    colors=None,
+):
+    """
+    Relaxation method for the sparse system A x = b as a generator: yields the
+    current approximation after every iteration (the same array is updated in
+    place, copy it if it must be kept). The consumer may stop early by leaving
+    the loop.
+
+    Parameters:
+        A         : square matrix (scipy.sparse, converted to CSR, or dense array)
+                    with a nonzero diagonal
+        b         : right-hand side
+        omega     : relaxation parameter (omega = 1 gives plain Jacobi / Gauss-Seidel)
+        method    : "jacobi" (weighted Jacobi), "gauss-seidel" or "sor"
+        x0        : initial approximation (zeros by default)
+        tol       : tolerance
+        max_iter  : maximum number of iterations
+        criterion : "residual" stops when max|b - A x| <= tol * max|b| (tol if b = 0),
+                    "change" stops when the maximum change of x is below tol
+        ordering  : "natural" sweeps the unknowns in index order (one sparse
+                    triangular solve per iteration), "red-black" sweeps the colors
+                    of red_black_colors(grid_shape) one after another, "colors"
+                    uses the given colors array (unknowns of one color must not
+                    be coupled); both colored orderings are fully vectorized
+        grid_shape: shape of the structured grid for ordering="red-black"
+        colors    : color of every unknown for ordering="colors"
+
+    Returns (as the generator's return value):
+        dict with "x", "iterations", "converged" and "residual_norm".
+    """
+    _check_options(method, criterion)
+    if method == "gauss-seidel":
+        omega = 1.0
+
+    A = sp.csr_matrix(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    n = A.shape[0]
+    if A.shape != (n, n) or b.shape != (n,):
+        raise ValueError("A must be square and match the size of b.")
+    diag = A.diagonal()
+    if np.any(diag == 0):
+        raise ValueError("Relaxation method requires a nonzero diagonal.")
+
+    x = np.zeros(n) if x0 is None else np.array(x0, dtype=float)
+    b_norm = float(np.max(np.abs(b))) if n > 0 else 0.0
+    threshold = tol * b_norm if b_norm > 0 else tol
+    sweep = _make_sweep(A, diag, omega, method, ordering, grid_shape, colors)
+
+    converged = False
+    iterations = 0
+    residual = None
+    for _ in range(max_iter):
+        x_old = x.copy() if criterion == "change" else None
+        sweep(x, b)
+        iterations += 1
+        yield x
+        if criterion == "change":
+            if np.max(np.abs(x - x_old)) < tol:
+                converged = True
+                break
+        else:
+            residual = _residual_norm(A, b, x)
+            if residual <= threshold:
+                converged = True
+                break
+
+    if residual is None:
+        residual = _residual_norm(A, b, x)
+    return {
+        "x": x,
+        "iterations": iterations,
+        "converged": converged,
+        "residual_norm": residual,
+    }
+
+
+def sor_solve(A, b, history: bool = False, **kwargs) -> dict:
+    """
+    Solves the sparse system A x = b by the relaxation method (see iter_sor for
+    the parameters).
+
+    With history=True, all iterates are stored in a preallocated array of shape
+    (iterations, n); use it only for small systems.
+
+    Returns:
+        dict with keys:
+           - "x": the approximate solution,
+           - "iterations": number of iterations performed,
+           - "converged": whether the stopping criterion was met,
+           - "residual_norm": max|b - A x| at the end,
+           - "history": array of iterates (only with history=True).
+    """
+    max_iter = kwargs.get("max_iter", 1000)
+    iterates = iter_sor(A, b, **kwargs)
+    stored = np.empty((max_iter, len(b))) if history else None
+    count = 0
+    while True:
+        try:
+            x = next(iterates)
+        except StopIteration as stop:
+            result = stop.value
+            break
+        if history:
+            stored[count] = x
+        count += 1
+    if history:
+        result["history"] = stored[:count]
+    return result
+
+
+def sor_solve_multi(
+    A,
+    B,
+    omega: float = 1.0,
+    method: str = "sor",
+    X0=None,
+    tol: float = 1e-10,
+    max_iter: int = 1000,
+    criterion: str = "residual",
+    ordering: str = "natural",
+    grid_shape: tuple = None,
+    colors=None,
+) -> dict:
+    """
+    Solves A X = B for many right-hand sides at once (one system per column of
+    B) by the relaxation method; see iter_sor for the parameters.
+
+    All columns are iterated together as one (n, k) matrix. A column stops being
+    updated as soon as it meets the stopping criterion, so every column gets its
+    own iteration count.
+
+    Returns:
+        dict with keys:
+           - "X": (n, k) array of the approximate solutions,
+           - "iterations": (k,) array of iterations performed per column,
+           - "converged": (k,) boolean array,
+           - "residual_norms": (k,) array of max|B - A X| per column.
+    """
+    _check_options(method, criterion)
+    if method == "gauss-seidel":
+        omega = 1.0
+
+    A = sp.csr_matrix(A, dtype=float)
+    B = np.asarray(B, dtype=float)
+    n = A.shape[0]
+    if A.shape != (n, n) or B.ndim != 2 or B.shape[0] != n:
+        raise ValueError("A must be square and B must have shape (n, k).")
+    diag = A.diagonal()
+    if np.any(diag == 0):
+        raise ValueError("Relaxation method requires a nonzero diagonal.")
+
+    k = B.shape[1]
+    X = np.zeros((n, k)) if X0 is None else np.array(X0, dtype=float)
+    b_norms = np.max(np.abs(B), axis=0) if n > 0 else np.zeros(k)
+    thresholds = np.where(b_norms > 0, tol * b_norms, tol)
+    sweep = _make_sweep(A, diag, omega, method, ordering, grid_shape, colors)
+
+    iterations = np.zeros(k, dtype=int)
+    converged = np.zeros(k, dtype=bool)
+    active = np.arange(k)
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        X_active = X[:, active]
+        B_active = B[:, active]
+        X_old = X_active.copy() if criterion == "change" else None
+        sweep(X_active, B_active)
+        X[:, active] = X_active
+        iterations[active] += 1
+        if criterion == "change":
+            done = np.max(np.abs(X_active - X_old), axis=0) < tol
+        else:
+            residuals = np.max(np.abs(B_active - A @ X_active), axis=0)
+            done = residuals <= thresholds[active]
+        converged[active[done]] = True
+        active = active[~done]
+
+    return {
+        "X": X,
+        "iterations": iterations,
+        "converged": converged,
+        "residual_norms": np.max(np.abs(B - A @ X), axis=0),
+    }
+
+
+def jacobi_spectral_radius(
+    A, method: str = "power", tol: float = 1e-6, max_iter: int = 500, seed: int = 0
+) -> float:
+    """
+    Estimates the spectral radius of the Jacobi iteration matrix B = I - D^-1 A.
+
+    Parameters:
+        A        : square sparse (or dense) matrix with a nonzero diagonal
+        method   : "power" runs the power method on B (any A), "lanczos" runs a
+                   few Lanczos steps on the similar symmetric matrix
+                   I - D^-1/2 A D^-1/2 (A must be symmetric with a positive diagonal);
+                   "power" switches to "lanczos" when A allows it, since the
+                   power method converges very slowly when rho is close to 1
+        tol      : relative tolerance of the estimate (of the eigenvalue
+                   residual for the power method)
+        max_iter : maximum number of power iterations (two products with B each)
+        seed     : seed of the random starting vector
+    """
+    A = sp.csr_matrix(A, dtype=float)
+    diag = A.diagonal()
+    if np.any(diag == 0):
+        raise ValueError("Relaxation method requires a nonzero diagonal.")
+    n = A.shape[0]
+    if (
+        method == "power"
+        and np.all(diag > 0)
+        and abs(A - A.T).max() <= 1e-12 * abs(A).max()
+    ):
+        method = "lanczos"
+
+    if method == "lanczos":
+        if np.any(diag < 0):
+            raise ValueError("Lanczos estimate requires a positive diagonal.")
+        scale = sp.diags(1.0 / np.sqrt(diag))
+        S = sp.identity(n, format="csr") - scale @ A @ scale
+        if n <= 2:
+            return float(np.max(np.abs(np.linalg.eigvalsh(S.toarray()))))
+        value = eigsh(S, k=1, which="LM", tol=tol, return_eigenvectors=False)
+        return float(abs(value[0]))
+    if method != "power":
+        raise ValueError(f"Unknown spectral radius method: {method!r}")
+
+    # Power method on B^2, which also converges for eigenvalue pairs +-rho
+    # (e.g. for consistently ordered A); it stops when the eigenvalue residual
+    # ||B^2 x - mu x|| is small, not when mu merely stagnates
+    x = np.random.default_rng(seed).random(n)
+    x /= np.linalg.norm(x)
+    norm = 0.0
+    for _ in range(max_iter):
+        y = x - (A @ x) / diag
+        z = y - (A @ y) / diag
+        norm = np.linalg.norm(z)
+        if norm == 0:
+            # B is nilpotent on the starting vector
+            return 0.0
+        mu = x @ z
+        if np.linalg.norm(z - mu * x) <= tol * abs(mu):
+            return float(np.sqrt(abs(mu)))
+        x = z / norm
+    return float(np.sqrt(norm))
+
+
+def optimal_omega(A, method: str = "power", **kwargs) -> dict:
+    """
+    Chooses the relaxation parameter from the spectral radius rho of the
+    Jacobi iteration matrix: omega = 2 / (1 + sqrt(1 - rho^2)), which is optimal
+    for consistently ordered matrices (e.g. 5-point grids, tridiagonal systems).
+
+    Returns:
+        dict with "omega" and "spectral_radius".
+    Raises ValueError if rho >= 1 (Jacobi diverges and the formula does not apply).
+    """
+    rho = jacobi_spectral_radius(A, method=method, **kwargs)
+    if rho >= 1.0:
+        raise ValueError(
+            f"Spectral radius of the Jacobi matrix is {rho:.6g} >= 1, optimal omega is undefined."
+        )
+    return {
+        "omega": 2.0 / (1.0 + float(np.sqrt(1.0 - rho * rho))),
+        "spectral_radius": rho,
+    }
+
+
+def _sweep_run(args: tuple) -> tuple:
+    """Runs the relaxation method for one omega of an omega sweep."""
+    A, b, omega, kwargs = args
+    result = sor_solve(A, b, omega=omega, **kwargs)
+    return result["iterations"], result["converged"]
+
+
+def omega_sweep(A, b, omegas, workers: int = None, **kwargs) -> dict:
+    """
+    Runs the relaxation method for every candidate omega in a pool of worker
+    processes and reports the iterations needed to reach the tolerance.
+
+    Parameters:
+        A, b    : the system
+        omegas  : candidate relaxation parameters
+        workers : number of worker processes (None: one per CPU, 1: no pool)
+        kwargs  : further arguments of iter_sor (method, tol, max_iter, ...)
+
+    Returns:
+        dict with keys:
+           - "omegas": the candidates,
+           - "iterations": iterations performed for each candidate,
+           - "converged": whether each candidate reached the tolerance,
+           - "best_omega": the converged candidate with the fewest iterations
+             (None if none converged).
+    """
+    omegas = np.asarray(omegas, dtype=float)
+    A = sp.csr_matrix(A, dtype=float)
+    jobs = [(A, b, omega, kwargs) for omega in omegas]
+    if workers == 1 or len(jobs) <= 1:
+        runs = [_sweep_run(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            runs = list(executor.map(_sweep_run, jobs))
+
+    iterations = np.array([run[0] for run in runs], dtype=int)
+    converged = np.array([run[1] for run in runs], dtype=bool)
+    best_omega = None
+    if converged.any():
+        candidates = np.flatnonzero(converged)
+        best_omega = float(omegas[candidates[np.argmin(iterations[candidates])]])
+    return {
+        "omegas": omegas,
+        "iterations": iterations,
+        "converged": converged,
+        "best_omega": best_omega,
+    }
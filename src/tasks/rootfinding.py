@@ -0,0 +1,438 @@
+import math
+import numpy as np
+
+
+class CountedFunction:
+    """
+    Wraps a function and counts how many times it has been evaluated.
+    """
+
+    def __init__(self, func: callable):
+        self.func = func
+        self.calls = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        return self.func(x)
+
+
+def _check_bracket(fa: float, fb: float):
+    if fa * fb > 0:
+        raise ValueError(
+            "No sign change at the endpoints of the interval. Bracketing method is not applicable."
+        )
+
+
+# Every method is written as a generator that yields each iterate as soon as it
+# is produced and returns a summary dict ("root", "converged" and evaluation
+# counts) when it stops. The consumer may stop early simply by not asking for
+# further iterates. The eager functions below collect the iterates into a
+# preallocated NumPy buffer.
+
+
+def iter_bisection(
+    func: callable, a: float, b: float, tol: float = 1e-10, max_iter: int = 1000
+):
+    """
+    Bisection method on [a, b] as a generator of midpoints.
+
+    The value of func at the left endpoint is cached, so every iteration costs
+    exactly one function evaluation. Stops when the interval is shorter than tol
+    or |func(mid)| < tol.
+    """
+    f = CountedFunction(func)
+    fa = f(a)
+    _check_bracket(fa, f(b))
+
+    count = 0
+    root = (a + b) / 2.0
+    while (b - a) > tol and count < max_iter:
+        mid = (a + b) / 2.0
+        f_mid = f(mid)
+        count += 1
+        root = mid
+        yield mid
+        if abs(f_mid) < tol:  # if the function value is very close to 0
+            return {"root": root, "converged": True, "function_evaluations": f.calls}
+        # Determine in which subinterval the sign change occurs
+        if fa * f_mid < 0:
+            b = mid
+        else:
+            a, fa = mid, f_mid
+    return {
+        "root": root,
+        "converged": (b - a) <= tol,
+        "function_evaluations": f.calls,
+    }
+
+
+def iter_newton(
+    func: callable, dfunc: callable, x0: float, tol: float = 1e-10, max_iter: int = 1000
+):
+    """
+    Newton-Raphson method as a generator of iterates, starting from x0.
+
+    Stops when two consecutive iterates differ by less than tol.
+    Raises ValueError if the derivative becomes 0.
+    """
+    f = CountedFunction(func)
+    df = CountedFunction(dfunc)
+
+    converged = False
+    x = x0
+    for _ in range(max_iter):
+        f_val = f(x)
+        d_val = df(x)
+        if d_val == 0:
+            raise ValueError("Division by zero encountered (derivative is 0).")
+        x_new = x - f_val / d_val
+        yield x_new
+        if abs(x_new - x) < tol:
+            converged = True
+            x = x_new
+            break
+        x = x_new
+    return {
+        "root": x,
+        "converged": converged,
+        "function_evaluations": f.calls,
+        "derivative_evaluations": df.calls,
+    }
+
+
+def iter_secant(
+    func: callable, x0: float, x1: float, tol: float = 1e-10, max_iter: int = 1000
+):
+    """
+    Secant method as a generator of iterates, with starting points x0 and x1.
+
+    Stops when two consecutive iterates differ by less than tol.
+    Raises ValueError if the secant becomes horizontal.
+    """
+    f = CountedFunction(func)
+    f0 = f(x0)
+    f1 = f(x1)
+
+    converged = False
+    for _ in range(max_iter):
+        if f1 == f0:
+            raise ValueError("Division by zero encountered (f(x0) == f(x1)).")
+        x2 = x1 - f1 * (x1 - x0) / (f1 - f0)
+        yield x2
+        if abs(x2 - x1) < tol:
+            converged = True
+            x1 = x2
+            break
+        x0, f0 = x1, f1
+        x1, f1 = x2, f(x2)
+    return {"root": x1, "converged": converged, "function_evaluations": f.calls}
+
+
+def iter_illinois(
+    func: callable, a: float, b: float, tol: float = 1e-10, max_iter: int = 1000
+):
+    """
+    Illinois variant of regula falsi on [a, b] as a generator of iterates.
+
+    When the same endpoint is retained twice in a row, its function value is
+    halved, which avoids the one-sided slow convergence of plain regula falsi.
+    Stops when two consecutive iterates differ by less than tol or |func(x)| < tol.
+    """
+    f = CountedFunction(func)
+    fa = f(a)
+    fb = f(b)
+    _check_bracket(fa, fb)
+
+    converged = False
+    side = 0
+    x = None
+    for _ in range(max_iter):
+        x_prev = x
+        if fa == fb:
+            # Both endpoint values are 0: a is a root
+            x, fx = a, fa
+        else:
+            x = (a * fb - b * fa) / (fb - fa)
+            fx = f(x)
+        yield x
+        if abs(fx) < tol or (x_prev is not None and abs(x - x_prev) < tol):
+            converged = True
+            break
+        if fx * fb > 0:
+            # The root lies in [a, x]: replace b
+            b, fb = x, fx
+            if side == -1:
+                fa /= 2.0
+            side = -1
+        else:
+            # The root lies in [x, b]: replace a
+            a, fa = x, fx
+            if side == 1:
+                fb /= 2.0
+            side = 1
+    return {
+        "root": x if x is not None else (a + b) / 2.0,
+        "converged": converged,
+        "function_evaluations": f.calls,
+    }
+
+
+def iter_brent(
+    func: callable, a: float, b: float, tol: float = 1e-10, max_iter: int = 1000
+):
+    """
+    Brent's method on [a, b] as a generator of iterates.
+
+    Combines inverse quadratic interpolation, the secant step and bisection, and
+    keeps the root bracketed. Stops when the bracket is shorter than about tol.
+    """
+    f = CountedFunction(func)
+    fa = f(a)
+    fb = f(b)
+    _check_bracket(fa, fb)
+
+    c, fc = b, fb
+    d = e = b - a
+    converged = False
+    count = 0
+    while True:
+        if fb * fc > 0:
+            # Rename a, c so that the root lies between b and c
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol1 = 2.0 * np.finfo(float).eps * abs(b) + 0.5 * tol
+        xm = 0.5 * (c - b)
+        if abs(xm) <= tol1 or fb == 0:
+            converged = True
+            break
+        if count >= max_iter:
+            break
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            # Attempt inverse quadratic interpolation (secant if a == c)
+            s = fb / fa
+            if a == c:
+                p = 2.0 * xm * s
+                q = 1.0 - s
+            else:
+                q = fa / fc
+                r = fb / fc
+                p = s * (2.0 * xm * q * (q - r) - (b - a) * (r - 1.0))
+                q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2.0 * p < min(3.0 * xm * q - abs(tol1 * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = xm
+        else:
+            d = e = xm
+        a, fa = b, fb
+        b += d if abs(d) > tol1 else math.copysign(tol1, xm)
+        fb = f(b)
+        count += 1
+        yield b
+    return {"root": b, "converged": converged, "function_evaluations": f.calls}
+
+
+def _collect(iterates, max_iter: int) -> dict:
+    """
+    Runs a method generator to the end, storing the iterates in a preallocated
+    NumPy buffer, and builds the common result dictionary.
+    """
+    trace = np.empty(max_iter)
+    count = 0
+    while True:
+        try:
+            trace[count] = next(iterates)
+        except StopIteration as stop:
+            summary = stop.value
+            break
+        count += 1
+    result = {
+        "root": summary.pop("root"),
+        "iterations": trace[:count],
+        "iteration_count": count,
+    }
+    result.update(summary)
+    return result
+
+
+def bisection(
+    func: callable, a: float, b: float, tol: float = 1e-10, max_iter: int = 1000
+) -> dict:
+    """Finds a root of 'func' in [a, b] using the bisection method (see iter_bisection)."""
+    return _collect(iter_bisection(func, a, b, tol, max_iter), max_iter)
+
+
+def newton(
+    func: callable, dfunc: callable, x0: float, tol: float = 1e-10, max_iter: int = 1000
+) -> dict:
+    """Finds a root of 'func' using the Newton-Raphson method (see iter_newton)."""
+    return _collect(iter_newton(func, dfunc, x0, tol, max_iter), max_iter)
+
+
+def secant(
+    func: callable, x0: float, x1: float, tol: float = 1e-10, max_iter: int = 1000
+) -> dict:
+    """Finds a root of 'func' using the secant method (see iter_secant)."""
+    return _collect(iter_secant(func, x0, x1, tol, max_iter), max_iter)
+
+
+def illinois(
+    func: callable, a: float, b: float, tol: float = 1e-10, max_iter: int = 1000
+) -> dict:
+    """Finds a root of 'func' in [a, b] using the Illinois method (see iter_illinois)."""
+    return _collect(iter_illinois(func, a, b, tol, max_iter), max_iter)
+
+
+def brent(
+    func: callable, a: float, b: float, tol: float = 1e-10, max_iter: int = 1000
+) -> dict:
+    """Finds a root of 'func' in [a, b] using Brent's method (see iter_brent)."""
+    return _collect(iter_brent(func, a, b, tol, max_iter), max_iter)
+
+
+METHODS = {
+    "bisection": bisection,
+    "newton": newton,
+    "secant": secant,
+    "illinois": illinois,
+    "brent": brent,
+}
+
+ITER_METHODS = {
+    "bisection": iter_bisection,
+    "newton": iter_newton,
+    "secant": iter_secant,
+    "illinois": iter_illinois,
+    "brent": iter_brent,
+}
+
+
+def iter_root(
+    method: str,
+    func: callable,
+    a: float,
+    b: float,
+    dfunc: callable = None,
+    x0: float = None,
+    tol: float = 1e-10,
+    max_iter: int = 1000,
+):
+    """
+    Generator variant of find_root: yields the iterates of the selected method
+    and returns its summary dict. Takes the same arguments as find_root.
+    """
+    if method not in ITER_METHODS:
+        raise ValueError(f"Unknown root-finding method: {method!r}")
+    if method == "newton":
+        if dfunc is None:
+            raise ValueError("Newton-Raphson method requires the derivative.")
+        if x0 is None:
+            x0 = (a + b) / 2.0
+        return iter_newton(func, dfunc, x0, tol, max_iter)
+    return ITER_METHODS[method](func, a, b, tol, max_iter)
+
+
+def find_root(
+    method: str,
+    func: callable,
+    a: float,
+    b: float,
+    dfunc: callable = None,
+    x0: float = None,
+    tol: float = 1e-10,
+    max_iter: int = 1000,
+) -> dict:
+    """
+    Finds a root of 'func' on [a, b] with the selected method.
+
+    Parameters:
+      method: one of "bisection", "newton", "secant", "illinois", "brent".
+      func: the function.
+      a, b: the interval. Bracketing methods require a sign change on it,
+            the secant method uses a and b as its two starting points.
+      dfunc: the derivative (required by "newton").
+      x0: initial guess for "newton" (the middle of [a, b] by default).
+      tol, max_iter: tolerance and maximum number of iterations.
+
+    Returns:
+      dict with keys:
+         - "root": approximate root,
+         - "iterations": NumPy array of the iterates,
+         - "iteration_count": number of iterations,
+         - "converged": whether the tolerance was reached,
+         - "function_evaluations": number of evaluations of func
+           (plus "derivative_evaluations" for "newton").
+    """
+    return _collect(iter_root(method, func, a, b, dfunc, x0, tol, max_iter), max_iter)
+
+
+def _order(e0: float, e1: float, e2: float):
+    """Estimated convergence order from three consecutive errors (None if undefined)."""
+    if e0 > 0 and e1 > 0 and e2 > 0 and e0 != e1:
+        return math.log(e2 / e1) / math.log(e1 / e0)
+    return None
+
+
+def track_convergence(iterates, exact=None):
+    """
+    Wraps a stream of iterates (numbers or NumPy vectors) and yields one record
+    per iterate with running convergence statistics, computed incrementally from
+    the last three iterates only.
+
+    Parameters:
+      iterates: any iterable of iterates (e.g. a generator from iter_root).
+      exact: exact solution, if known. Errors of vectors use the max norm.
+
+    Yields:
+      dict with keys:
+         - "iteration": iteration number (starting at 1),
+         - "x": the iterate,
+         - "step": |x_k - x_(k-1)| (None for the first iterate),
+         - "abs_error", "rel_error": errors against exact (None without exact),
+         - "order": estimated convergence order p from
+           e_(k+1) / e_k = (e_k / e_(k-1))^p, using the errors if exact is
+           given and the steps otherwise (None until enough data is available).
+
+    The consumer may stop at any time by leaving the loop; the summary returned
+    by the wrapped generator is passed through as this generator's return value.
+    """
+    if exact is not None:
+        exact_norm = float(np.max(np.abs(exact)))
+    previous = None
+    history = []
+    iterates = iter(iterates)
+    k = 0
+    while True:
+        try:
+            x = next(iterates)
+        except StopIteration as stop:
+            return stop.value
+        k += 1
+        step = None if previous is None else float(np.max(np.abs(x - previous)))
+        previous = x
+
+        abs_error = rel_error = None
+        if exact is not None:
+            abs_error = float(np.max(np.abs(x - exact)))
+            rel_error = abs_error / exact_norm if exact_norm != 0 else None
+            measure = abs_error
+        else:
+            measure = step
+        if measure is not None:
+            history = (history + [measure])[-3:]
+        order = _order(*history) if len(history) == 3 else None
+
+        yield {
+            "iteration": k,
+            "x": x,
+            "step": step,
+            "abs_error": abs_error,
+            "rel_error": rel_error,
+            "order": order,
+        }
@@ -1,75 +1,124 @@
+import math
+import timeit
 import numpy as np
 import matplotlib.pyplot as plt
 from decimal import Decimal
 
 
-def solve_task(n: float, a: float, b: float, c: float, axes=None):
+def solve_task(
+    n: float,
+    a: float,
+    b: float,
+    c: float,
+    axes=None,
+    method: str = "analytic",
+    cross_check: bool = False,
+):
     """
     Решает задачу:
       Вычисляет функцию f(x) = a*x^4 - b*x^2 + c на интервале [-n, n],
-      ищет приближённый корень (графическим методом и методом бисекции),
-      строит график функции и возвращает результаты в виде словаря.
+      находит корни, строит график функции и возвращает результаты в виде словаря.
+      По умолчанию корни находятся аналитически (подстановка u = x^2);
+      графический метод и бисекция выполняются только для method="bisection"
+      или для сверки (cross_check=True).
     Параметры:
       n, a, b, c: значения (можно передавать как Decimal, str или float).
       axes: объект matplotlib.axes, на котором нужно нарисовать график.
              Если не передан, создаётся новое окно.
+      method: "analytic" (по умолчанию) — аналитическое решение,
+              "bisection" — только графический метод и бисекция.
+      cross_check: для "analytic" дополнительно найти корни графическим методом
+              и бисекцией и сверить их с аналитическими.
     Возвращает:
       dict с ключами:
          - "x_vals": массив значений x,
          - "f_vals": массив значений f(x),
+         - "roots": найденные корни (аналитические для "analytic",
+           уточнённые бисекцией для "bisection"),
          - "approx_root_graph": приближённый корень, найденный графическим методом (или None, если не найден),
          - "approx_root_bis": уточнённый корень методом бисекции (или None),
          - "abs_error": абсолютная ошибка между методами (или None),
-         - "iterations": число итераций метода бисекции (или None).
+         - "iterations": число итераций метода бисекции (или None),
+         - "roots_graph": массив всех корней, найденных графическим методом,
+         - "roots_bis": массив всех корней, уточнённых методом бисекции,
+         - "iterations_all": число итераций бисекции для каждого корня,
+         - "abs_errors": абсолютные ошибки для каждого корня,
+         - "roots_exact": корни, найденные аналитически (или None для "bisection"),
+         - "exact_errors": расстояние от каждого корня бисекции до ближайшего
+           аналитического корня (или None, если сверка не выполнялась).
+      Ключи графического метода и бисекции равны None, если они не выполнялись
+      ("analytic" без cross_check).
     """
+    if method not in ("analytic", "bisection"):
+        raise ValueError(f"Unknown method: {method!r}")
+
     # Transform input to float
     n_val = float(n)
     a_val = float(a)
     b_val = float(b)
     c_val = float(c)
 
-    # Defining the function f(x) = a*x^4 - b*x^2 + c
-    def f(x: float) -> float:
+    # Defining the function f(x) = a*x^4 - b*x^2 + c (works for scalars and arrays)
+    def f(x):
         return a_val * x**4 - b_val * x**2 + c_val
 
     # Creating x and f(x) values for corresponding plot
     x_vals = np.linspace(-n_val, n_val, 1000)
-    f_vals = np.array([f(x) for x in x_vals])
+    f_vals = f(x_vals)
+
+    # Closed-form roots
+    roots_exact = None
+    if method == "analytic":
+        roots_exact = biquadratic_roots(n_val, a_val, b_val, c_val)
 
-    # Finding the approximate root using graphical method (if sign change exists)
     approx_root_graph = None
-    sign_change_index = None
-    for i in range(len(x_vals) - 1):
-        if f_vals[i] * f_vals[i + 1] < 0:
-            approx_root_graph = (x_vals[i] + x_vals[i + 1]) / 2.0
-            sign_change_index = i
-            break
-
-    # If no sign change found, set other values to None
-    if approx_root_graph is None:
-        approx_root_bis = None
-        abs_error = None
-        iterations = None
-    else:
-        # Bisecting the interval to find the root more accurately
-        x_left = x_vals[sign_change_index]
-        x_right = x_vals[sign_change_index + 1]
-        tol = 1e-10
-        max_iter = 1000
-        iterations = 0
-        while (x_right - x_left) > tol and iterations < max_iter:
-            x_mid = (x_left + x_right) / 2.0
-            f_mid = f(x_mid)
-            if abs(f_mid) < tol:
-                break
-            # Determine the new interval
-            if f(x_left) * f_mid < 0:
-                x_right = x_mid
+    approx_root_bis = None
+    abs_error = None
+    iterations = None
+    roots_graph = None
+    roots_bis = None
+    iterations_all = None
+    abs_errors = None
+    exact_errors = None
+    if method == "bisection" or cross_check:
+        # Finding all approximate roots using graphical method (every sign change)
+        left_idx = find_sign_changes(f_vals)
+        roots_graph = (x_vals[left_idx] + x_vals[left_idx + 1]) / 2.0
+
+        # Bisecting all brackets at once to find the roots more accurately
+        roots_bis, iterations_all = bisect_brackets(
+            f, x_vals[left_idx], x_vals[left_idx + 1]
+        )
+
+        # Grid points where f(x) is exactly 0 are roots without a sign change
+        zero_idx = np.flatnonzero(f_vals == 0)
+        if zero_idx.size > 0:
+            roots_graph = np.concatenate([roots_graph, x_vals[zero_idx]])
+            roots_bis = np.concatenate([roots_bis, x_vals[zero_idx]])
+            iterations_all = np.concatenate(
+                [iterations_all, np.zeros(zero_idx.size, dtype=int)]
+            )
+            order = np.argsort(roots_bis)
+            roots_graph = roots_graph[order]
+            roots_bis = roots_bis[order]
+            iterations_all = iterations_all[order]
+        abs_errors = np.abs(roots_graph - roots_bis)
+
+        # The first root is reported separately (None if no sign change found)
+        if roots_bis.size > 0:
+            approx_root_graph = roots_graph[0]
+            approx_root_bis = roots_bis[0]
+            abs_error = abs_errors[0]
+            iterations = int(iterations_all[0])
+
+        # Cross-check of the bisection roots against the closed-form roots
+        if roots_exact is not None:
+            if roots_exact.size > 0:
+                exact_errors = np.abs(roots_bis[:, None] - roots_exact[None, :]).min(
+                    axis=1
+                )
             else:
-                x_left = x_mid
-            iterations += 1
-        approx_root_bis = (x_left + x_right) / 2.0
-        abs_error = abs(approx_root_graph - approx_root_bis)
+                exact_errors = np.full(roots_bis.shape, np.nan)
 
     # Plotting the function f(x) = a*x^4 + b*x^2 + c
     if axes is None:
@@ -91,10 +140,263 @@ def solve_task(n: float, a: float, b: float, c: float, axes=None):
     return {
         "x_vals": x_vals,
         "f_vals": f_vals,
+        "roots": roots_exact if method == "analytic" else roots_bis,
         "approx_root_graph": approx_root_graph,
         "approx_root_bis": approx_root_bis,
         "abs_error": abs_error,
         "iterations": iterations,
+        "roots_graph": roots_graph,
+        "roots_bis": roots_bis,
+        "iterations_all": iterations_all,
+        "abs_errors": abs_errors,
+        "roots_exact": roots_exact,
+        "exact_errors": exact_errors,
+    }
+
+
+def biquadratic_roots(n: float, a: float, b: float, c: float) -> np.ndarray:
+    """
+    Finds the real roots of f(x) = a*x^4 - b*x^2 + c on [-n, n] in closed form.
+
+    With u = x^2 the equation becomes a*u^2 - b*u + c = 0, which is solved with
+    the numerically stable form of the quadratic formula (no cancellation between
+    b and the square root of the discriminant). Each u >= 0 gives x = ±sqrt(u).
+    Double roots (zero discriminant, u = 0) are returned once; a = 0 falls back to
+    the linear equation -b*u + c = 0. If f is identically zero, no roots are returned.
+
+    Returns: sorted array of the distinct roots lying in [-n, n].
+    """
+    n, a, b, c = float(n), float(a), float(b), float(c)
+    if a == 0.0:
+        u_roots = [c / b] if b != 0.0 else []
+    else:
+        disc = b * b - 4.0 * a * c
+        if disc < 0.0:
+            u_roots = []
+        else:
+            q = 0.5 * (b + math.copysign(math.sqrt(disc), b))
+            if q == 0.0:
+                # b = 0 and c = 0: u = 0 is a double root
+                u_roots = [0.0]
+            elif disc == 0.0:
+                u_roots = [q / a]
+            else:
+                u_roots = [q / a, c / q]
+
+    roots = set()
+    for u in u_roots:
+        if u > 0.0:
+            x = math.sqrt(u)
+            roots.update((-x, x))
+        elif u == 0.0:
+            roots.add(0.0)
+    return np.array(sorted(x for x in roots if -n <= x <= n))
+
+
+def benchmark(n: float, a: float, b: float, c: float, number: int = 1000) -> dict:
+    """
+    Compares the run time of the closed-form solver with the grid + bisection
+    path of solve_task(method="bisection") (without plotting).
+
+    Returns:
+      dict with the mean time per call in seconds ("analytic", "bisection"),
+      the speedup and the largest distance between the roots of both paths.
+    """
+    n_val, a_val, b_val, c_val = float(n), float(a), float(b), float(c)
+
+    def run_bisection():
+        x_vals = np.linspace(-n_val, n_val, 1000)
+        f_vals = _quartic(x_vals, a_val, b_val, c_val)
+        left_idx = find_sign_changes(f_vals)
+        return bisect_brackets(
+            lambda x: _quartic(x, a_val, b_val, c_val),
+            x_vals[left_idx],
+            x_vals[left_idx + 1],
+        )[0]
+
+    def run_analytic():
+        return biquadratic_roots(n_val, a_val, b_val, c_val)
+
+    t_analytic = timeit.timeit(run_analytic, number=number) / number
+    t_bisection = timeit.timeit(run_bisection, number=number) / number
+
+    roots_exact = run_analytic()
+    roots_bis = run_bisection()
+    if roots_exact.size > 0 and roots_bis.size > 0:
+        max_diff = np.abs(roots_bis[:, None] - roots_exact[None, :]).min(axis=1).max()
+    else:
+        max_diff = None
+
+    return {
+        "analytic": t_analytic,
+        "bisection": t_bisection,
+        "speedup": t_bisection / t_analytic,
+        "max_root_difference": max_diff,
+    }
+
+
+def find_sign_changes(f_vals: np.ndarray) -> np.ndarray:
+    """
+    Returns the indices i for which f_vals[i] and f_vals[i + 1] have opposite signs,
+    i.e. the left ends of all brackets [x_i, x_(i+1)] containing a root.
+    """
+    f_vals = np.asarray(f_vals)
+    return np.flatnonzero(f_vals[:-1] * f_vals[1:] < 0)
+
+
+def bisect_brackets(
+    f, x_left, x_right, tol: float = 1e-10, max_iter: int = 1000, args: tuple = ()
+) -> tuple:
+    """
+    Refines all brackets [x_left[k], x_right[k]] simultaneously by the bisection method.
+
+    f must accept NumPy arrays. A bracket stops being refined once its width drops
+    below tol, |f(mid)| < tol or max_iter is reached. args is an optional tuple of
+    per-bracket arrays (e.g. coefficients); f is called as f(x, *args) with only
+    the entries of the brackets that are still being refined.
+
+    Returns:
+      - array of approximate roots (one per bracket)
+      - array of iteration counts (one per bracket)
+    """
+    x_left = np.array(x_left, dtype=float)
+    x_right = np.array(x_right, dtype=float)
+    args = tuple(np.asarray(arg) for arg in args)
+    f_left = f(x_left, *args)
+    iterations = np.zeros(x_left.shape, dtype=int)
+    roots = (x_left + x_right) / 2.0
+    active = np.flatnonzero(x_right - x_left > tol)
+
+    while active.size > 0:
+        left = x_left[active]
+        right = x_right[active]
+        mid = (left + right) / 2.0
+        f_mid = f(mid, *(arg[active] for arg in args))
+
+        # Brackets where the function value is very close to 0 are done
+        hit = np.abs(f_mid) < tol
+        roots[active[hit]] = mid[hit]
+
+        # Determine the new interval for the remaining brackets
+        keep = ~hit
+        active = active[keep]
+        mid = mid[keep]
+        f_mid = f_mid[keep]
+        go_left = f_left[active] * f_mid < 0
+        x_right[active[go_left]] = mid[go_left]
+        go_right = ~go_left
+        x_left[active[go_right]] = mid[go_right]
+        f_left[active[go_right]] = f_mid[go_right]
+        iterations[active] += 1
+
+        roots[active] = (x_left[active] + x_right[active]) / 2.0
+        done = (x_right[active] - x_left[active] <= tol) | (
+            iterations[active] >= max_iter
+        )
+        active = active[~done]
+
+    return roots, iterations
+
+
+def _quartic(x, a, b, c):
+    """Returns f(x) = a*x^4 - b*x^2 + c evaluated element-wise (Horner in x^2)."""
+    x2 = x * x
+    return (a * x2 - b) * x2 + c
+
+
+def solve_batch(
+    n,
+    a,
+    b,
+    c,
+    num_points: int = 1000,
+    tol: float = 1e-10,
+    max_iter: int = 1000,
+    chunk_size: int = 4096,
+) -> dict:
+    """
+    Solves task 1 for many coefficient sets at once, without plotting.
+
+    Every set (n[k], a[k], b[k], c[k]) gets its own grid of num_points points on
+    [-n[k], n[k]]; the grids of a chunk of sets are evaluated as one 2-D array,
+    and all brackets found in the chunk are refined by one masked bisection.
+    A quartic has at most 4 real roots, so the results are padded to 4 columns.
+
+    Parameters:
+      n, a, b, c: arrays (or scalars, broadcast together) of interval half-widths
+                  and coefficients.
+      num_points: number of grid points per coefficient set.
+      tol, max_iter: bisection tolerance and iteration limit.
+      chunk_size: number of coefficient sets evaluated together (bounds memory use
+                  to about chunk_size * num_points floats).
+
+    Returns:
+      dict with keys:
+         - "root_counts": number of roots found for each set, shape (m,),
+         - "roots_graph": roots found by the graphical method, shape (m, 4), NaN-padded,
+         - "roots_bis": roots refined by bisection, shape (m, 4), NaN-padded,
+         - "iterations": bisection iterations per root, shape (m, 4), 0 for padding,
+         - "abs_errors": |roots_graph - roots_bis|, shape (m, 4), NaN-padded.
+    """
+    n, a, b, c = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(v, dtype=float)) for v in (n, a, b, c))
+    )
+    m = n.shape[0]
+    max_roots = 4
+    grid = np.linspace(-1.0, 1.0, num_points)
+
+    root_counts = np.zeros(m, dtype=int)
+    roots_graph = np.full((m, max_roots), np.nan)
+    roots_bis = np.full((m, max_roots), np.nan)
+    iterations = np.zeros((m, max_roots), dtype=int)
+
+    for start in range(0, m, chunk_size):
+        stop = min(start + chunk_size, m)
+        a_c = a[start:stop, None]
+        b_c = b[start:stop, None]
+        c_c = c[start:stop, None]
+        x_vals = n[start:stop, None] * grid
+        f_vals = _quartic(x_vals, a_c, b_c, c_c)
+
+        # Sign changes (brackets) and grid points where f(x) is exactly 0
+        rows_s, cols_s = np.nonzero(f_vals[:, :-1] * f_vals[:, 1:] < 0)
+        rows_z, cols_z = np.nonzero(f_vals == 0)
+
+        left = x_vals[rows_s, cols_s]
+        right = x_vals[rows_s, cols_s + 1]
+        bis, its = bisect_brackets(
+            _quartic,
+            left,
+            right,
+            tol,
+            max_iter,
+            args=(a[start + rows_s], b[start + rows_s], c[start + rows_s]),
+        )
+
+        rows = np.concatenate([rows_s, rows_z])
+        graph = np.concatenate([(left + right) / 2.0, x_vals[rows_z, cols_z]])
+        bis = np.concatenate([bis, x_vals[rows_z, cols_z]])
+        its = np.concatenate([its, np.zeros(rows_z.size, dtype=int)])
+
+        # Order roots by row, then by position, and give each its column slot
+        order = np.lexsort((bis, rows))
+        rows, graph, bis, its = rows[order], graph[order], bis[order], its[order]
+        counts = np.bincount(rows, minlength=stop - start)
+        slot = np.arange(rows.size) - np.repeat(np.cumsum(counts) - counts, counts)
+        keep = slot < max_roots
+        rows, slot = rows[keep] + start, slot[keep]
+
+        root_counts[start:stop] = np.minimum(counts, max_roots)
+        roots_graph[rows, slot] = graph[keep]
+        roots_bis[rows, slot] = bis[keep]
+        iterations[rows, slot] = its[keep]
+
+    return {
+        "root_counts": root_counts,
+        "roots_graph": roots_graph,
+        "roots_bis": roots_bis,
+        "iterations": iterations,
+        "abs_errors": np.abs(roots_graph - roots_bis),
     }
 
 
@@ -111,26 +413,29 @@ def main():
     b_val = float(b_input)
     c_val = float(c_input)
 
-    # Решение задачи
-    result = solve_task(n_val, a_val, b_val, c_val)
+    # Решение задачи (с проверкой аналитических корней бисекцией)
+    result = solve_task(n_val, a_val, b_val, c_val, cross_check=True)
 
     # Вывод результатов
-    if result["approx_root_graph"] is None:
-        print(
-            "Смена знака не обнаружена на интервале. Графический метод не смог найти корень."
-        )
-    else:
-        print(
-            "Приблизительный корень, найденный графическим методом:",
-            result["approx_root_graph"],
-        )
-        print("Корень, найденный методом бисекции:", result["approx_root_bis"])
-        print("Количество итераций в методе бисекции:", result["iterations"])
-        print(
-            "Абсолютная ошибка между графическим методом и методом бисекции:",
-            result["abs_error"],
-        )
-
+    if result["roots"].size == 0:
+        print("Корни на интервале не найдены.")
+    print("Корни, найденные аналитически:", result["roots"])
+    if result["roots_bis"] is not None:
+        for k in range(len(result["roots_bis"])):
+            print(f"\nКорень #{k + 1}:")
+            print(
+                "Приблизительный корень, найденный графическим методом:",
+                result["roots_graph"][k],
+            )
+            print("Корень, найденный методом бисекции:", result["roots_bis"][k])
+            print(
+                "Количество итераций в методе бисекции:", result["iterations_all"][k]
+            )
+            print(
+                "Абсолютная ошибка между графическим методом и методом бисекции:",
+                result["abs_errors"][k],
+            )
+    return result
 
 if __name__ == "__main__":
     main()
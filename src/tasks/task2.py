@@ -1,6 +1,18 @@
+import math
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 import numpy as np
 import matplotlib.pyplot as plt
 
+from tasks.rootfinding import (
+    METHODS,
+    bisection,
+    find_root,
+    iter_root,
+    newton,
+    track_convergence,
+)
+
 
 def f(x: float, a: float, b: float, c: float, d: float) -> float:
     """Returns f(x) = a*x^3 + b*x^2 + c*x + d."""
@@ -12,76 +24,476 @@ def df(x: float, a: float, b: float, c: float):
     return 3 * a * x**2 + 2 * b * x + c
 
 
+# Errors and steps below this many machine epsilons (relative to max(1, |root|))
+# are rounding noise and give no information about the convergence order
+_ORDER_NOISE_EPS = 16
+
+
+def estimated_order(iterations, exact_root: float):
+    """
+    Median of the convergence orders estimated per iteration (see
+    track_convergence), over the iterations whose errors and step are still
+    above rounding noise. Returns None if fewer than two such estimates remain.
+    """
+    noise = _ORDER_NOISE_EPS * np.finfo(float).eps * max(1.0, abs(exact_root))
+    orders = []
+    errors = []
+    for record in track_convergence(iterations, exact_root):
+        errors.append(record["abs_error"])
+        if record["order"] is None or record["step"] <= noise:
+            continue
+        if min(errors[-3:]) <= noise:
+            continue
+        orders.append(record["order"])
+    return float(np.median(orders)) if len(orders) >= 2 else None
+
+
 def bisection_method(
     func: callable, n1: float, n2: float, tol: float = 1e-10, max_iter: int = 1000
-) -> tuple:
+) -> np.ndarray:
     """
     Finds a root of the function 'func' in the interval [n1, n2] using the bisection method.
 
-    Returns: list of iterations and approximate root
+    Returns: array of iterations (the last one is the approximate root)
     """
-    iterations = []
-    # Check if there is a sign change at the endpoints
-    if func(n1) * func(n2) > 0:
-        raise ValueError(
-            "No sign change at the endpoints of the interval. Bisection method is not applicable."
-        )
-
-    while (n2 - n1) > tol and len(iterations) < max_iter:
-        mid = (n1 + n2) / 2.0
-        f_mid = func(mid)
-        iterations += [mid]
-        if abs(f_mid) < tol:  # if the function value is very close to 0
-            return iterations
-        # Determine in which subinterval the sign change occurs
-        if func(n1) * f_mid < 0:
-            n2 = mid
-        else:
-            n1 = mid
-    return iterations
+    return bisection(func, n1, n2, tol, max_iter)["iterations"]
 
 
 def newton_raphson_method(
     func: callable, dfunc: callable, x0: float, tol=1e-10, max_iter=1000
-) -> tuple:
+) -> np.ndarray:
     """
     Finds a root of the function 'func' using the Newton-Raphson method starting from initial guess x0.
 
+    Returns: array of iterations (the last one is the approximate root)
+    """
+    return newton(func, dfunc, x0, tol, max_iter)["iterations"]
+
+
+def newton_batch(x0, coeffs, tol: float = 1e-10, max_iter: int = 1000) -> dict:
+    """
+    Runs the Newton-Raphson method on many cubics f(x) = a*x^3 + b*x^2 + c*x + d
+    and/or many starting points at once.
+
+    Every lane is an independent Newton iteration. The cubic and its derivative
+    are evaluated together with Horner's scheme, and lanes that have converged
+    (or failed) are dropped from the following iterations.
+
+    Parameters:
+      x0: array of initial guesses (complex guesses run Newton in the complex plane).
+      coeffs: array of coefficient rows (a, b, c, d), shape (..., 4); broadcast
+              against x0 (e.g. one row for many x0, or one row per x0).
+      tol: stop a lane when two consecutive iterates differ by less than tol.
+      max_iter: maximum number of iterations per lane.
+
     Returns:
-      - approximate root
-      - number of iterations
+      dict with keys (arrays with the broadcast shape of x0 and the coefficient rows):
+         - "roots": last iterate of each lane,
+         - "iterations": number of iterations of each lane,
+         - "converged": True where the tolerance was reached,
+         - "failed": True where the derivative became 0 or the iterate overflowed.
     """
-    x = x0
-    iterations = []
-    while len(iterations) < max_iter:
-        f_val = func(x)
-        d_val = dfunc(x)
-        if d_val == 0:
-            raise ValueError("Division by zero encountered (derivative is 0).")
+    coeffs = np.asarray(coeffs, dtype=float)
+    if coeffs.shape[-1] != 4:
+        raise ValueError("Coefficient rows must have 4 entries (a, b, c, d).")
+    x0 = np.asarray(x0)
+    x, a, b, c, d = np.broadcast_arrays(
+        x0.astype(np.result_type(x0, float)), *np.moveaxis(coeffs, -1, 0)
+    )
+    shape = x.shape
+    x = x.ravel().copy()
+    coeff_rows = [v.ravel() for v in (a, b, c, d)]
+
+    iterations = np.zeros(x.size, dtype=int)
+    converged = np.zeros(x.size, dtype=bool)
+    failed = np.zeros(x.size, dtype=bool)
+    active = np.arange(x.size)
+
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        x_old = x[active]
+        lane_coeffs = [v[active] for v in coeff_rows]
+
+        # Horner's scheme for f(x) and f'(x) in one pass
+        f_val = lane_coeffs[0]
+        d_val = np.zeros_like(x_old)
+        for coef in lane_coeffs[1:]:
+            d_val = d_val * x_old + f_val
+            f_val = f_val * x_old + coef
+
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            x_new = x_old - f_val / d_val
+        bad = (d_val == 0) | ~np.isfinite(x_new)
+        failed[active[bad]] = True
+        ok = ~bad
+        active, x_old, x_new = active[ok], x_old[ok], x_new[ok]
+
+        iterations[active] += 1
+        x[active] = x_new
+        done = np.abs(x_new - x_old) < tol
+        converged[active[done]] = True
+        active = active[~done]
+
+    return {
+        "roots": x.reshape(shape),
+        "iterations": iterations.reshape(shape),
+        "converged": converged.reshape(shape),
+        "failed": failed.reshape(shape),
+    }
+
+
+# Relative size of the discriminant below which a cubic is treated as having
+# a multiple root (three real roots) instead of one real root
+_DISC_RTOL = 1e-12
+
+
+def _quadratic_roots(a: float, b: float, c: float, rtol: float = 0.0) -> list:
+    """
+    Real roots of a*x^2 + b*x + c = 0 (stable formula, linear if a = 0).
+    A negative discriminant smaller than rtol * (b^2 + |4ac|) is treated as 0.
+    """
+    if a == 0:
+        return [-c / b] if b != 0 else []
+    disc = b * b - 4.0 * a * c
+    if disc < 0:
+        if disc < -rtol * (b * b + abs(4.0 * a * c)):
+            return []
+        disc = 0.0
+    q = -0.5 * (b + math.copysign(math.sqrt(disc), b))
+    if q == 0:
+        # b = 0 and c = 0: x = 0 is a double root
+        return [0.0, 0.0]
+    return [q / a, c / q]
+
+
+def _polish(x: float, a: float, b: float, c: float, d: float, steps: int = 1) -> float:
+    """Newton steps on the original cubic, each kept only if it reduces |f(x)|."""
+    for _ in range(steps):
+        f_val = f(x, a, b, c, d)
+        d_val = df(x, a, b, c)
+        if d_val == 0 or f_val == 0:
+            break
         x_new = x - f_val / d_val
-        iterations += [x_new]
-        if abs(x_new - x) < tol:
-            return iterations
+        if abs(f(x_new, a, b, c, d)) >= abs(f_val):
+            break
         x = x_new
-    return iterations
+    return x
+
+
+def cubic_roots(a: float, b: float, c: float, d: float) -> np.ndarray:
+    """
+    Finds the real roots of f(x) = a*x^3 + b*x^2 + c*x + d in closed form.
+
+    The cubic is reduced to the depressed form t^3 + p*t + q = 0 (x = t - b/(3a)).
+    One real root is computed with Cardano's formula (written so that the two
+    cube-root terms never cancel), three real roots with the trigonometric form.
+    Near-degenerate cubics (double and triple roots) take the second path: the
+    largest root is polished by Newton's method and removed by backward
+    deflation, and the other two come from the stable quadratic formula.
+    For a = 0 the quadratic (or linear) equation is solved.
+
+    Returns: sorted array of the real roots, repeated according to multiplicity
+    when the cubic has three real roots.
+    """
+    a, b, c, d = float(a), float(b), float(c), float(d)
+    if a == 0:
+        return np.array(sorted(_quadratic_roots(b, c, d)))
+
+    A, B, C = b / a, c / a, d / a
+    shift = A / 3.0
+    p = B - A * A / 3.0
+    q = 2.0 * A**3 / 27.0 - A * B / 3.0 + C
+    half_q2 = (q / 2.0) ** 2
+    p3 = (p / 3.0) ** 3
+    disc = half_q2 + p3
+    if disc > _DISC_RTOL * max(half_q2, abs(p3)):
+        # One real root (Cardano)
+        w = -q / 2.0 - math.copysign(math.sqrt(disc), q)
+        u = math.copysign(abs(w) ** (1.0 / 3.0), w)
+        return np.array([_polish(u - p / (3.0 * u) - shift, a, b, c, d, steps=2)])
+
+    # Three real roots: the largest one from the trigonometric form
+    if p < 0:
+        r = 2.0 * math.sqrt(-p / 3.0)
+        arg = 3.0 * q / (2.0 * p) * math.sqrt(-3.0 / p)
+        phi = math.acos(min(1.0, max(-1.0, arg)))
+        t_roots = [r * math.cos((phi - 2.0 * math.pi * k) / 3.0) for k in range(3)]
+    else:
+        t_roots = [0.0]
+    x1 = max((t - shift for t in t_roots), key=abs)
+    x1 = _polish(x1, a, b, c, d, steps=2)
+    if x1 == 0:
+        # The largest root is 0, so all three are
+        return np.zeros(3)
+
+    # Backward deflation: f(x) = (x - x1) * (a*x^2 + e*x + g)
+    g = -d / x1
+    e = (g - c) / x1
+    others = [_polish(x, a, b, c, d) for x in _quadratic_roots(a, e, g, rtol=_DISC_RTOL)]
+    return np.array(sorted([x1] + others))
+
+
+def _horner(x, a, b, c, d):
+    return ((a * x + b) * x + c) * x + d
+
+
+def _polish_batch(x, a, b, c, d, steps: int = 1):
+    """Vectorized _polish: Newton steps kept only where they reduce |f(x)|."""
+    for _ in range(steps):
+        f_val = _horner(x, a, b, c, d)
+        d_val = (3.0 * a * x + 2.0 * b) * x + c
+        x_new = x - f_val / d_val
+        better = (d_val != 0) & (np.abs(_horner(x_new, a, b, c, d)) < np.abs(f_val))
+        x = np.where(better, x_new, x)
+    return x
+
+
+def cubic_roots_batch(coeffs) -> np.ndarray:
+    """
+    Vectorized variant of cubic_roots for many cubics at once.
+
+    Parameters:
+      coeffs: array of coefficient rows (a, b, c, d), shape (..., 4).
+
+    Returns: array of shape (..., 3) with the sorted real roots of every cubic,
+    padded with NaN (one real root, or fewer roots when a = 0).
+    """
+    coeffs = np.asarray(coeffs, dtype=float)
+    if coeffs.shape[-1] != 4:
+        raise ValueError("Coefficient rows must have 4 entries (a, b, c, d).")
+    a, b, c, d = np.moveaxis(coeffs, -1, 0)
+    roots = np.full(a.shape + (3,), np.nan)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        # Cubic lanes: depressed cubic t^3 + p*t + q = 0
+        cubic = a != 0
+        A = np.where(cubic, b / a, 0.0)
+        B = np.where(cubic, c / a, 0.0)
+        C = np.where(cubic, d / a, 0.0)
+        shift = A / 3.0
+        p = B - A * A / 3.0
+        q = 2.0 * A**3 / 27.0 - A * B / 3.0 + C
+        half_q2 = (q / 2.0) ** 2
+        p3 = (p / 3.0) ** 3
+        disc = half_q2 + p3
+
+        # One real root (Cardano)
+        one = cubic & (disc > _DISC_RTOL * np.maximum(half_q2, np.abs(p3)))
+        w = -q / 2.0 - np.copysign(np.sqrt(np.where(one, disc, 0.0)), q)
+        u = np.cbrt(w)
+        x_one = np.where(u != 0, u - p / (3.0 * u), 0.0) - shift
+        x_one = _polish_batch(x_one, a, b, c, d, steps=2)
+        roots[..., 0] = np.where(one, x_one, roots[..., 0])
+
+        # Three real roots: the largest one from the trigonometric form
+        three = cubic & ~one
+        p_neg = np.where(three & (p < 0), p, -1.0)
+        r = np.where(three & (p < 0), 2.0 * np.sqrt(-p_neg / 3.0), 0.0)
+        arg = 3.0 * q / (2.0 * p_neg) * np.sqrt(-3.0 / p_neg)
+        phi = np.arccos(np.clip(arg, -1.0, 1.0))
+        k = np.arange(3)
+        t_three = r[..., None] * np.cos((phi[..., None] - 2.0 * np.pi * k) / 3.0)
+        x_three = t_three - shift[..., None]
+        x1 = np.take_along_axis(
+            x_three, np.argmax(np.abs(x_three), axis=-1)[..., None], axis=-1
+        )[..., 0]
+        x1 = _polish_batch(x1, a, b, c, d, steps=2)
+
+        # Backward deflation and the stable quadratic formula for the other two
+        g = np.where(x1 != 0, -d / x1, 0.0)
+        e = np.where(x1 != 0, (g - c) / x1, 0.0)
+        qdisc = e * e - 4.0 * a * g
+        real = qdisc >= -_DISC_RTOL * (e * e + np.abs(4.0 * a * g))
+        qq = -0.5 * (e + np.copysign(np.sqrt(np.maximum(qdisc, 0.0)), e))
+        x2 = np.where(qq != 0, qq / a, 0.0)
+        x3 = np.where(qq != 0, g / qq, 0.0)
+        x2 = np.where(real, _polish_batch(x2, a, b, c, d), np.nan)
+        x3 = np.where(real, _polish_batch(x3, a, b, c, d), np.nan)
+        roots = np.where(three[..., None], np.stack([x1, x2, x3], axis=-1), roots)
+
+        # Quadratic and linear lanes (a = 0)
+        quad = ~cubic & (b != 0)
+        qdisc = c * c - 4.0 * b * d
+        two = quad & (qdisc >= 0)
+        qq = -0.5 * (c + np.copysign(np.sqrt(np.where(two, qdisc, 0.0)), c))
+        r1 = np.where(qq != 0, qq / b, 0.0)
+        r2 = np.where(qq != 0, d / qq, 0.0)
+        roots[..., 0] = np.where(two, r1, roots[..., 0])
+        roots[..., 1] = np.where(two, r2, roots[..., 1])
+        lin = ~cubic & (b == 0) & (c != 0)
+        roots[..., 0] = np.where(lin, -d / c, roots[..., 0])
+
+    return np.sort(roots, axis=-1)
+
+
+# Estimated memory per grid point of a basin map chunk (start point, iterates,
+# Horner temporaries, counters and masks), in bytes
+_BASIN_BYTES_PER_POINT = 160
+
+
+def _basin_chunk(args: tuple) -> tuple:
+    """Runs Newton on one chunk of start points and classifies the limits."""
+    z0, coeffs, roots, tol, max_iter = args
+    result = newton_batch(z0, coeffs, tol, max_iter)
+    distance = np.abs(result["roots"][:, None] - roots[None, :])
+    root_index = np.argmin(distance, axis=1).astype(np.int8)
+    close = distance[np.arange(z0.size), root_index] <= np.sqrt(tol) * np.maximum(
+        1.0, np.abs(roots[root_index])
+    )
+    root_index[~(result["converged"] & close)] = -1
+    return root_index, result["iterations"]
+
+
+def basin_map(
+    a: float,
+    b: float,
+    c: float,
+    d: float,
+    x_range: tuple,
+    y_range: tuple = None,
+    resolution: tuple = (400, 400),
+    tol: float = 1e-10,
+    max_iter: int = 100,
+    memory_budget: int = 64 * 2**20,
+    workers: int = None,
+) -> dict:
+    """
+    Computes the Newton basins of attraction of f(x) = a*x^3 + b*x^2 + c*x + d.
+
+    For every start point of a grid, finds which root Newton's method converges
+    to and how many iterations it takes. With y_range the grid covers the complex
+    plane x_range x y_range; without it, the start points are real points of
+    x_range (a single row). The grid is split into chunks of about memory_budget
+    bytes, which are processed by a pool of worker processes.
+
+    Parameters:
+      a, b, c, d: coefficients of the cubic.
+      x_range: (min, max) of the real part of the start points.
+      y_range: (min, max) of the imaginary part, or None for real start points.
+      resolution: (width, height) of the grid; height is ignored without y_range.
+      tol, max_iter: Newton tolerance and iteration limit.
+      memory_budget: approximate memory used by one chunk, in bytes.
+      workers: number of worker processes (None: one per CPU, 1: no pool).
+
+    Returns:
+      dict with keys:
+         - "roots": complex array of the roots of the cubic,
+         - "root_index": (height, width) array with the index of the root reached
+           from each start point (-1 if Newton did not converge to a root),
+         - "iterations": (height, width) array of Newton iteration counts,
+         - "x", "y": coordinates of the grid columns and rows.
+    """
+    coeffs = np.array([a, b, c, d], dtype=float)
+    if y_range is None:
+        # Real roots, with repeated roots merged
+        roots = cubic_roots(a, b, c, d)
+        if roots.size:
+            distinct = np.diff(roots) > np.sqrt(tol) * np.maximum(
+                1.0, np.abs(roots[1:])
+            )
+            roots = roots[np.concatenate(([True], distinct))]
+    else:
+        roots = np.roots(coeffs)
+    if roots.size == 0:
+        raise ValueError("The cubic has no roots to classify the start points by.")
+    width, height = resolution
+    x = np.linspace(x_range[0], x_range[1], width)
+    if y_range is None:
+        y = np.zeros(1)
+        z0 = x[None, :]
+    else:
+        y = np.linspace(y_range[0], y_range[1], height)
+        z0 = x[None, :] + 1j * y[:, None]
+    shape = z0.shape
+    z0 = z0.ravel()
+
+    chunk_size = max(1, memory_budget // _BASIN_BYTES_PER_POINT)
+    chunks = [
+        (z0[start : start + chunk_size], coeffs, roots, tol, max_iter)
+        for start in range(0, z0.size, chunk_size)
+    ]
+    if workers == 1 or len(chunks) == 1:
+        parts = [_basin_chunk(chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parts = list(executor.map(_basin_chunk, chunks))
+
+    return {
+        "roots": roots,
+        "root_index": np.concatenate([p[0] for p in parts]).reshape(shape),
+        "iterations": np.concatenate([p[1] for p in parts]).reshape(shape),
+        "x": x,
+        "y": y,
+    }
+
+
+def plot_basin_map(result: dict, axes=None):
+    """
+    Draws a basin map as an image: the hue shows which root is reached, the
+    brightness how fast (darker means more iterations). Points that did not
+    converge are black.
+    """
+    if axes is None:
+        fig, axes = plt.subplots(figsize=(8, 6))
+    else:
+        axes.clear()
+
+    root_index = result["root_index"]
+    iterations = result["iterations"]
+    colors = plt.get_cmap("tab10")(np.arange(max(len(result["roots"]), 1)))[:, :3]
+    shade = 1.0 - 0.7 * np.log1p(iterations) / np.log1p(max(iterations.max(), 1))
+    image = colors[np.maximum(root_index, 0)] * shade[..., None]
+    image[root_index < 0] = 0.0
+
+    x, y = result["x"], result["y"]
+    axes.imshow(
+        image,
+        origin="lower",
+        extent=(x[0], x[-1], y[0], y[-1]) if len(y) > 1 else (x[0], x[-1], -0.5, 0.5),
+        aspect="auto",
+        interpolation="nearest",
+    )
+    for k, root in enumerate(result["roots"]):
+        axes.plot(
+            np.real(root),
+            np.imag(root),
+            "wo",
+            markeredgecolor="k",
+            label=f"Root {k + 1}: {np.round(root, 6)}",
+        )
+    axes.set_xlabel("Re(x0)")
+    axes.set_ylabel("Im(x0)" if len(y) > 1 else "")
+    axes.set_title("Newton basins of attraction")
+    axes.legend(loc="upper right", fontsize="small")
+    if axes.figure is not None:
+        axes.figure.canvas.draw_idle()
+    return axes
+
+
+@lru_cache(maxsize=1024)
+def _cached_exact_root(
+    a: float, b: float, c: float, d: float, n1: float, n2: float
+) -> float:
+    for r in cubic_roots(a, b, c, d):
+        if n1 <= r <= n2:
+            return float(r)
+    return None
 
 
 def get_exact_root(
     a: float, b: float, c: float, d: float, n1: float, n2: float
 ) -> float:
     """
-    Attempts to find a real root of the cubic equation f(x) = ax^3 + b*x^2 + c*x - d
-    that lies within the interval [n1, n2] using np.roots.
+    Attempts to find a real root of the cubic equation f(x) = ax^3 + b*x^2 + c*x + d
+    that lies within the interval [n1, n2] using the closed-form cubic_roots.
+
+    Results are memoized on the coefficients and the interval, so repeated
+    solves of the same task skip the computation.
     """
-    roots = np.roots([a, b, c, d])
-    exact_root = None
-    for r in roots:
-        if np.isreal(r):
-            r_real = np.real(r)
-            if n1 <= r_real <= n2:
-                exact_root = r_real
-                break
-    return exact_root
+    return _cached_exact_root(
+        float(a), float(b), float(c), float(d), float(n1), float(n2)
+    )
 
 
 def plot_function_and_roots(
@@ -123,24 +535,70 @@ def plot_function_and_roots(
     plt.show()
 
 
+METHOD_LABELS = {
+    "bisection": "Bisection",
+    "newton": "Newton-Raphson",
+    "secant": "Secant",
+    "illinois": "Illinois (regula falsi)",
+    "brent": "Brent",
+}
+
+METHOD_MARKERS = {
+    "bisection": "o",
+    "newton": "s",
+    "secant": "^",
+    "illinois": "d",
+    "brent": "v",
+}
+
+
+def _select_methods(methods) -> tuple:
+    """Turns the 'methods' argument of solve_task into a tuple of method names."""
+    if methods is None or methods == "default":
+        return ("bisection", "newton")
+    if methods == "all":
+        return tuple(METHODS)
+    if isinstance(methods, str):
+        methods = (methods,)
+    for method in methods:
+        if method not in METHODS:
+            raise ValueError(f"Unknown root-finding method: {method!r}")
+    return tuple(methods)
+
+
 def solve_task(
-    n1: float, n2: float, a: float, b: float, c: float, d: float, tol: float, axes=None
+    n1: float,
+    n2: float,
+    a: float,
+    b: float,
+    c: float,
+    d: float,
+    tol: float,
+    axes=None,
+    methods="default",
 ) -> dict:
     """
     Анализирует функцию f(x)= a*x^3 + b*x^2 + c*x + d на интервале [n1, n2]:
-      - Находит корень методом бисекции и методом Ньютона–Рафсона (с сохранением таблиц итераций).
-      - Измеряет число итераций для каждого метода.
-      - Вычисляет относительные погрешности по сравнению с точным корнем (через np.roots).
-      - Строит график зависимости абсолютной ошибки от номера итерации для обоих методов.
+      - Находит корень выбранными методами (по умолчанию бисекция и Ньютон–Рафсон,
+        также доступны метод секущих, Illinois и метод Брента) с сохранением таблиц итераций.
+      - Измеряет число итераций и число вычислений функции для каждого метода.
+      - Вычисляет относительные погрешности по сравнению с точным корнем (по формуле для кубического уравнения).
+      - Строит график зависимости абсолютной ошибки от номера итерации для всех методов.
 
     Параметры:
       n1, n2: Концы интервала.
       a, b, c, d: Коэффициенты кубической функции.
       tol: Заданная точность.
       axes: Объект matplotlib.axes для построения графика. Если None, создаётся новый.
+      methods: "default" (бисекция и Ньютон), "all" (все методы), имя метода
+               или последовательность имён из rootfinding.METHODS.
 
     Возвращает:
       dict с результатами, включая найденные корни, число итераций, ошибки и построенный график.
+      Ключ "methods" содержит для каждого метода словарь с ключами "root", "iterations",
+      "iteration_count", "function_evaluations", "absolute_errors", "relative_errors",
+      "estimated_order" (медиана оценок порядка сходимости по итерациям).
+      Ключи "bisection_*" и "newton_*" равны None, если метод не был выбран.
     """
     # Приводим входные данные к float
     n1_val = float(n1)
@@ -150,37 +608,27 @@ def solve_task(
     c_val = float(c)
     d_val = float(d)
     tol_val = float(tol)
+    selected = _select_methods(methods)
 
     # Определяем функцию и её производную с фиксированными коэффициентами
     func = lambda x: f(x, a_val, b_val, c_val, d_val)
     dfunc = lambda x: df(x, a_val, b_val, c_val)
 
-    # Находим точный корень с помощью np.roots
+    # Находим точный корень в замкнутой форме (с кэшированием)
     exact_root = get_exact_root(a_val, b_val, c_val, d_val, n1_val, n2_val)
     if exact_root is None:
         raise ValueError("No real roots found in the interval.")
 
-    # Метод бисекции
-    bisect_iterations = bisection_method(func, n1_val, n2_val, tol_val)
-    bisect_root = bisect_iterations[-1]
-    bisect_iter_count = len(bisect_iterations)
-
-    # Метод Ньютона–Рафсона (начальное приближение – середина интервала)
-    initial_guess = (n1_val + n2_val) / 2.0
-    newton_iterations = newton_raphson_method(func, dfunc, initial_guess, tol_val)
-    newton_root = newton_iterations[-1]
-    newton_iter_count = len(newton_iterations)
-
-    # Вычисляем относительные и абсолютные погрешности для каждого приближения
-    bisect_relative_errors = [
-        abs(x - exact_root) / abs(exact_root) for x in bisect_iterations
-    ]
-    newton_relative_errors = [
-        abs(x - exact_root) / abs(exact_root) for x in newton_iterations
-    ]
-
-    bisect_absolute_errors = [abs(x - exact_root) for x in bisect_iterations]
-    newton_absolute_errors = [abs(x - exact_root) for x in newton_iterations]
+    # Запускаем выбранные методы (начальное приближение Ньютона – середина интервала)
+    method_results = {}
+    for method in selected:
+        result = find_root(method, func, n1_val, n2_val, dfunc=dfunc, tol=tol_val)
+        # Вычисляем относительные и абсолютные погрешности для каждого приближения
+        absolute_errors = np.abs(result["iterations"] - exact_root)
+        result["absolute_errors"] = absolute_errors
+        result["relative_errors"] = absolute_errors / abs(exact_root)
+        result["estimated_order"] = estimated_order(result["iterations"], exact_root)
+        method_results[method] = result
 
     # Построение графика зависимости абсолютной ошибки от номера итерации
     if axes is None:
@@ -188,13 +636,13 @@ def solve_task(
     else:
         axes.clear()
 
-    iterations_bis = range(1, bisect_iter_count + 1)
-    iterations_newton = range(1, newton_iter_count + 1)
-
-    axes.plot(iterations_bis, bisect_absolute_errors, marker="o", label="Bisection")
-    axes.plot(
-        iterations_newton, newton_absolute_errors, marker="s", label="Newton-Raphson"
-    )
+    for method, result in method_results.items():
+        axes.plot(
+            np.arange(1, result["iteration_count"] + 1),
+            result["absolute_errors"],
+            marker=METHOD_MARKERS[method],
+            label=METHOD_LABELS[method],
+        )
     axes.set_xlabel("Iteration number")
     axes.set_ylabel("Absolute error")
     axes.set_title("Absolute error vs Iteration number")
@@ -202,20 +650,63 @@ def solve_task(
     axes.grid(True)
 
     # Формируем и возвращаем словарь с результатами
+    bisect = method_results.get("bisection")
+    newton_res = method_results.get("newton")
     return {
         "exact_root": exact_root,
-        "bisection_root": bisect_root,
-        "bisection_iterations": bisect_iter_count,
-        "newton_root": newton_root,
-        "newton_iterations": newton_iter_count,
-        "bisection_relative_errors": bisect_relative_errors,
-        "newton_relative_errors": newton_relative_errors,
-        "bisection_absolute_errors": bisect_absolute_errors,
-        "newton_absolute_errors": newton_absolute_errors,
+        "bisection_root": bisect["root"] if bisect else None,
+        "bisection_iterations": bisect["iteration_count"] if bisect else None,
+        "newton_root": newton_res["root"] if newton_res else None,
+        "newton_iterations": newton_res["iteration_count"] if newton_res else None,
+        "bisection_relative_errors": bisect["relative_errors"] if bisect else None,
+        "newton_relative_errors": (
+            newton_res["relative_errors"] if newton_res else None
+        ),
+        "bisection_absolute_errors": bisect["absolute_errors"] if bisect else None,
+        "newton_absolute_errors": (
+            newton_res["absolute_errors"] if newton_res else None
+        ),
+        "methods": method_results,
         "axes": axes,  # можно вернуть объект axes для дальнейшего использования
     }
 
 
+def stream_task(
+    n1: float,
+    n2: float,
+    a: float,
+    b: float,
+    c: float,
+    d: float,
+    tol: float,
+    method: str = "newton",
+    max_iter: int = 1000,
+):
+    """
+    Потоковый вариант solve_task для одного метода: выдаёт записи по мере
+    вычисления итераций, без хранения всей истории и без построения графика.
+
+    Каждая запись — словарь из rootfinding.track_convergence ("iteration", "x",
+    "step", "abs_error", "rel_error", "order"); ошибки считаются относительно
+    точного корня. Потребитель может остановиться в любой момент, выйдя из цикла.
+    """
+    a_val, b_val, c_val, d_val = float(a), float(b), float(c), float(d)
+    n1_val, n2_val = float(n1), float(n2)
+    exact_root = get_exact_root(a_val, b_val, c_val, d_val, n1_val, n2_val)
+    if exact_root is None:
+        raise ValueError("No real roots found in the interval.")
+    iterates = iter_root(
+        method,
+        lambda x: f(x, a_val, b_val, c_val, d_val),
+        n1_val,
+        n2_val,
+        dfunc=lambda x: df(x, a_val, b_val, c_val),
+        tol=float(tol),
+        max_iter=max_iter,
+    )
+    return (yield from track_convergence(iterates, exact_root))
+
+
 def main():
     lower_bound = float(
         input("Enter the lower bound of the interval x (upper bound will be x+3): ")
@@ -1,8 +1,27 @@
 from decimal import Decimal
+import io
+import os
+import sys
+import numpy as np
+import scipy.sparse as sp
 import matplotlib.pyplot as plt
 
+from tasks.relaxation import iter_sor, omega_sweep, optimal_omega, sor_solve_multi
+from tasks.rootfinding import track_convergence
 
-def solve_task(omega, a, b, c, axes=None, tol=1e-10, max_iter=1000):
+
+def solve_task(
+    omega,
+    a,
+    b,
+    c,
+    axes=None,
+    tol=1e-10,
+    max_iter=1000,
+    keep_every=1,
+    keep_last=None,
+    table_file=None,
+):
     """
     Solves the task by performing the following steps:
     1. Perform the relaxation method for solving the system.
@@ -11,19 +30,28 @@ def solve_task(omega, a, b, c, axes=None, tol=1e-10, max_iter=1000):
     4. Plot the convergence of the variables.
 
     Parameters:
-        omega   : relaxation parameter
+        omega   : relaxation parameter, or "auto" to choose the optimal one
+                  from the spectral radius of the Jacobi iteration matrix
         a, b, c : coefficients
         axes    : matplotlib axes for plotting
         tol     : tolerance for convergence (max change)
         max_iter: maximum number of iterations
+        keep_every, keep_last: history thinning (see relaxation_method)
+        table_file: file object or path for the iteration table (stdout by default)
     """
+    # Step 1: Choose omega automatically if requested
+    if omega == "auto":
+        omega = optimal_omega(system_matrix(a, b, c)[0])["omega"]
+
     # Step 2 & 3: Execute the relaxation method
     iterations, x, y, z, iterations_list, x_history, y_history, z_history = (
-        relaxation_method(omega, a, b, c, tol, max_iter)
+        relaxation_method(omega, a, b, c, tol, max_iter, keep_every, keep_last)
     )
 
     # Step 3.1: Print the iteration table
-    print_iteration_table(iterations_list, x_history, y_history, z_history)
+    print_iteration_table(
+        iterations_list, x_history, y_history, z_history, file=table_file
+    )
 
     # Step 4: Print the results
     print_results(iterations, x, y, z, a, b, c)
@@ -55,6 +83,7 @@ def solve_task(omega, a, b, c, axes=None, tol=1e-10, max_iter=1000):
         axes.figure.canvas.draw_idle()
 
     return {
+        "omega": omega,
         "iterations": iterations,
         "x": x,
         "y": y,
@@ -66,7 +95,9 @@ def solve_task(omega, a, b, c, axes=None, tol=1e-10, max_iter=1000):
     }
 
 
-def relaxation_method(omega, a, b, c, tol=1e-10, max_iter=1000):
+def relaxation_method(
+    omega, a, b, c, tol=1e-10, max_iter=1000, keep_every=1, keep_last=None
+):
     """
     Step 2 & 3: Performs the relaxation method for solving the system.
 
@@ -75,75 +106,236 @@ def relaxation_method(omega, a, b, c, tol=1e-10, max_iter=1000):
         x = b - z
         y = c - z
 
+    The history is stored in a preallocated NumPy array. For long runs it can be
+    thinned out: keep_every=k keeps every k-th iteration (and the last one),
+    keep_last=N keeps only the last N iterations (ring buffer).
+
     Parameters:
-        omega   : relaxation parameter
-        a, b, c : coefficients
-        tol     : tolerance for convergence (max change)
-        max_iter: maximum number of iterations
+        omega     : relaxation parameter
+        a, b, c   : coefficients
+        tol       : tolerance for convergence (max change)
+        max_iter  : maximum number of iterations
+        keep_every: store every k-th iteration only
+        keep_last : store only the last N iterations (overrides keep_every)
 
     Returns:
         iterations      : number of iterations performed
         x, y, z         : approximate solution
-        iterations_list : list of iteration numbers (for plotting)
+        iterations_list : array of the stored iteration numbers (for plotting)
         x_history       : history of x values
         y_history       : history of y values
         z_history       : history of z values
     """
-    # Initial approximations (can be arbitrary)
-    x = 0.0
-    y = 0.0
-    z = 0.0
+    if keep_every < 1 or (keep_last is not None and keep_last < 1):
+        raise ValueError("keep_every and keep_last must be positive.")
+
+    # Preallocated history: columns are iteration, x, y, z
+    if keep_last is not None:
+        capacity = keep_last
+    else:
+        capacity = -(-max_iter // keep_every) + 1
+    history = np.empty((capacity, 4))
+    stored = 0
+
+    iterations = 0
+    x = y = z = 0.0
+    for iter, values in enumerate(iter_relaxation(omega, a, b, c, tol, max_iter)):
+        iterations = iter + 1
+        x, y, z = values
+        if keep_last is not None:
+            history[iter % keep_last] = (iter, x, y, z)
+        elif iter % keep_every == 0:
+            history[stored] = (iter, x, y, z)
+            stored += 1
+
+    if keep_last is not None:
+        # Unroll the ring buffer into chronological order
+        stored = min(iterations, keep_last)
+        shift = iterations % keep_last if iterations > keep_last else 0
+        history = np.roll(history[:stored], -shift, axis=0)
+    elif iterations > 0 and (iterations - 1) % keep_every != 0:
+        # Always keep the last iteration
+        history[stored] = (iterations - 1, x, y, z)
+        stored += 1
+    history = history[:stored]
+
+    return (
+        iterations,
+        x,
+        y,
+        z,
+        history[:, 0].astype(int),
+        history[:, 1],
+        history[:, 2],
+        history[:, 3],
+    )
+
+
+def relaxation_method_multi(omega, a, b, c, tol=1e-10, max_iter=1000):
+    """
+    Performs the relaxation method for many right-hand sides (a, b, c) at once.
+
+    The system matrix does not depend on (a, b, c), so all right-hand sides are
+    iterated together as the columns of one matrix, each with its own
+    convergence check (max change below tol) and iteration count. No history
+    is stored.
+
+    Parameters:
+        omega   : relaxation parameter
+        a, b, c : arrays of coefficients (broadcast together)
+        tol     : tolerance for convergence (max change)
+        max_iter: maximum number of iterations
+
+    Returns:
+        dict with keys:
+           - "solution": (m, 3) array of the approximate (x, y, z) per right-hand side,
+           - "iterations": (m,) array of iterations performed,
+           - "converged": (m,) boolean array.
+    """
+    a, b, c = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(v, dtype=float)) for v in (a, b, c))
+    )
+    A, _ = system_matrix(0.0, 0.0, 0.0)
+    rhs = np.vstack([b + c - a, b, c])
+    result = sor_solve_multi(
+        A, rhs, omega, "sor", tol=tol, max_iter=max_iter, criterion="change"
+    )
+    return {
+        "solution": result["X"][[1, 2, 0]].T,
+        "iterations": result["iterations"],
+        "converged": result["converged"],
+    }
+
+
+def system_matrix(a, b, c):
+    """
+    Returns the task's system in sparse form (A, rhs) for the unknowns ordered
+    as (z, x, y), so that a forward relaxation sweep updates z first and then
+    x and y with the new z:
+        z         = b + c - a
+        x     + z = b
+        y     + z = c
+    """
+    A = sp.csr_matrix(
+        np.array(
+            [
+                [1.0, 0.0, 0.0],
+                [1.0, 1.0, 0.0],
+                [1.0, 0.0, 1.0],
+            ]
+        )
+    )
+    rhs = np.array([b + c - a, b, c], dtype=float)
+    return A, rhs
 
-    # Lists to store iteration history for plotting and table
-    iterations_list = []
-    x_history = []
-    y_history = []
-    z_history = []
 
-    for iter in range(max_iter):
-        # Save previous values to check for convergence
-        x_old, y_old, z_old = x, y, z
+def iter_relaxation(omega, a, b, c, tol=1e-10, max_iter=1000):
+    """
+    Generator form of the relaxation method: yields the approximation (x, y, z)
+    as a NumPy array after every iteration and stops when the maximum change is
+    below tol or after max_iter iterations. The consumer may stop earlier simply
+    by leaving the loop.
 
-        # Update z using the relaxation rule:
-        # "Exact" relation: z = b + c - a
-        z = (1 - omega) * z_old + omega * (b + c - a)
+    The iteration is the SOR solver of relaxation.iter_sor applied to
+    system_matrix(a, b, c), starting from x = y = z = 0.
 
-        # Update x: x = b - z (using the new z)
-        x = (1 - omega) * x_old + omega * (b - z)
+    Returns (as the generator's return value):
+        dict with "iterations" (number of iterations) and "converged".
+    """
+    A, rhs = system_matrix(a, b, c)
+    iterates = iter_sor(
+        A, rhs, omega, "sor", tol=tol, max_iter=max_iter, criterion="change"
+    )
+    while True:
+        try:
+            zxy = next(iterates)
+        except StopIteration as stop:
+            return {
+                "iterations": stop.value["iterations"],
+                "converged": stop.value["converged"],
+            }
+        yield zxy[[1, 2, 0]]
+
+
+def stream_relaxation(omega, a, b, c, tol=1e-10, max_iter=1000):
+    """
+    Streams the relaxation method with running convergence statistics.
+
+    Yields the records of rootfinding.track_convergence ("iteration", "x",
+    "step", "abs_error", "rel_error", "order"), with the errors measured in the
+    max norm against the analytical solution.
+    """
+    exact = np.array([a - c, a - b, b + c - a])
+    return (
+        yield from track_convergence(
+            iter_relaxation(omega, a, b, c, tol, max_iter), exact
+        )
+    )
 
-        # Update y: y = c - z (using the new z)
-        y = (1 - omega) * y_old + omega * (c - z)
 
-        # Store values for plotting and table
-        iterations_list.append(iter)
-        x_history.append(x)
-        y_history.append(y)
-        z_history.append(z)
+def sweep_omega(a, b, c, omegas=None, tol=1e-10, max_iter=1000, workers=None):
+    """
+    Runs the relaxation method for several candidate omegas in parallel worker
+    processes and reports the iterations needed for each one.
 
-        # Check for convergence: stop if the maximum change is below tol
-        if max(abs(x - x_old), abs(y - y_old), abs(z - z_old)) < tol:
-            break
+    Parameters:
+        a, b, c : coefficients
+        omegas  : candidate relaxation parameters (0.1, 0.2, ..., 1.9 by default)
+        tol     : tolerance for convergence (max change)
+        max_iter: maximum number of iterations
+        workers : number of worker processes (None: one per CPU)
 
-    return iter + 1, x, y, z, iterations_list, x_history, y_history, z_history
+    Returns:
+        dict from relaxation.omega_sweep ("omegas", "iterations", "converged",
+        "best_omega").
+    """
+    if omegas is None:
+        omegas = np.round(np.arange(1, 20) * 0.1, 1)
+    A, rhs = system_matrix(a, b, c)
+    return omega_sweep(
+        A,
+        rhs,
+        omegas,
+        workers=workers,
+        method="sor",
+        tol=tol,
+        max_iter=max_iter,
+        criterion="change",
+    )
 
 
-def print_iteration_table(iterations_list, x_history, y_history, z_history):
+def print_iteration_table(iterations_list, x_history, y_history, z_history, file=None):
     """
     Step 3.1: Prints the iteration table.
 
     Prints a formatted table showing the values of x, y, and z at each iteration.
+    The table is formatted in one pass and written at once.
+
+    Parameters:
+        file: file object or path to write the table to (sys.stdout by default)
     """
-    print("\nIteration Table:")
-    print("-" * 40)
-    print("{:<10} | {:<10} | {:<10} | {:<10}".format("Iteration", "x", "y", "z"))
-    print("-" * 40)
-    for i in range(len(iterations_list)):
-        print(
-            "{:<10} | {:<10.6f} | {:<10.6f} | {:<10.6f}".format(
-                iterations_list[i], x_history[i], y_history[i], z_history[i]
-            )
+    line = "-" * 40 + "\n"
+    buffer = io.StringIO()
+    buffer.write("\nIteration Table:\n" + line)
+    buffer.write(
+        "{:<10} | {:<10} | {:<10} | {:<10}\n".format("Iteration", "x", "y", "z")
+    )
+    buffer.write(line)
+    if len(iterations_list) > 0:
+        np.savetxt(
+            buffer,
+            np.column_stack([iterations_list, x_history, y_history, z_history]),
+            fmt="%-10d | %-10.6f | %-10.6f | %-10.6f",
         )
-    print("-" * 40)
+    buffer.write(line)
+
+    if file is None:
+        sys.stdout.write(buffer.getvalue())
+    elif isinstance(file, (str, os.PathLike)):
+        with open(file, "w", encoding="utf-8") as handle:
+            handle.write(buffer.getvalue())
+    else:
+        file.write(buffer.getvalue())
 
 
 def print_results(iterations, x, y, z, a, b, c):
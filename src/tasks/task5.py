@@ -1,8 +1,30 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import math
 import numpy as np
 import matplotlib.pyplot as plt
 
+from tasks.fitting import MODEL_NAMES, get_fitter
 
-def solve_task(x_input: np.ndarray, y_input: np.ndarray, axes=None):
+FIT_METHODS = ("log-linear", "lm")
+
+# Points drawn in the scatter plot at most (evenly strided beyond that)
+MAX_PLOT_POINTS = 10000
+
+ERROR_DTYPE = np.dtype([("x", float), ("y", float), ("y_fit", float), ("error", float)])
+
+
+def solve_task(
+    x_input: np.ndarray,
+    y_input: np.ndarray,
+    axes=None,
+    method: str = "log-linear",
+    weights=None,
+    max_rows: int = None,
+    bootstrap: int = 0,
+    model: str = "exponential",
+    degree: int = 2,
+):
     """
     Solves the task by performing the following steps:
     1. Get the initial value n from the user.
@@ -10,42 +32,126 @@ def solve_task(x_input: np.ndarray, y_input: np.ndarray, axes=None):
     3. Perform an exponential fit of the model: y = A * exp(B * x).
     4. Print a comparison table of the original data and the model approximations.
     5. Plot the original data and the fitted exponential model.
+
+    method selects the fit: "log-linear" (exponential_fit) or "lm" (nonlinear
+    least squares, exponential_fit_lm); both use the optional point weights.
+
+    The comparison table "errors" is a structured array with fields x, y,
+    y_fit and error (one row per point, or only the first max_rows rows for
+    large inputs); "summary" holds the RMSE, max |error| and R^2 over all
+    points and "rows_total" the number of points.
+
+    With bootstrap > 0, "bootstrap" holds confidence intervals for A and B of
+    the log-linear fit from that many resamples (see bootstrap_fit).
+
+    model selects another linearizable model from tasks.fitting.MODEL_NAMES
+    ("power", "logarithmic", "saturating" or "polynomial" of the given
+    degree), fitted by linear least squares after transforming the data;
+    "params" then holds its parameters and A_fit / B_fit are None where the
+    model has no such parameter.
     """
-    # Step 1: Perform the exponential fit
-    A_fit, B_fit = exponential_fit(x_input, y_input)
+    x_input = np.asarray(x_input, dtype=float)
+    y_input = np.asarray(y_input, dtype=float)
+    if model not in MODEL_NAMES:
+        raise ValueError(f"Unknown model: {model!r}")
+    if model != "exponential" and (
+        method != "log-linear" or bootstrap > 0 or weights is not None
+    ):
+        raise ValueError(
+            "The lm method, weights and bootstrap need the exponential model."
+        )
+    # Step 1: Perform the fit
+    if model != "exponential":
+        fitter = get_fitter(model, x_input, degree)
+        params = fitter.fit(y_input)
+        A_fit, B_fit = params.get("A"), params.get("B")
+        label = fitter.spec["label"]
+    elif method == "lm":
+        A_fit, B_fit = exponential_fit_lm(x_input, y_input, weights)
+    elif method == "log-linear":
+        A_fit, B_fit = exponential_fit(x_input, y_input, weights)
+    else:
+        raise ValueError(f"Unknown fit method: {method!r}")
+    if model == "exponential":
+        params = {"A": A_fit, "B": B_fit}
+        label = "y = A * exp(B * x)"
 
-    errors = []
-    for xi, yi in zip(x_input, y_input):
-        yi_fit = A_fit * np.exp(B_fit * xi)
-        error = yi - yi_fit
-        errors.append((xi, yi, yi_fit, error))
+    def evaluate(x):
+        if model == "exponential":
+            return A_fit * np.exp(B_fit * x)
+        return fitter.evaluate(params, x)
+
+    y_model = evaluate(x_input)
+    residuals = y_input - y_model
+    summary = fit_summary(y_input, residuals)
+    rows = slice(None) if max_rows is None else slice(max_rows)
+    errors = np.empty(x_input[rows].size, dtype=ERROR_DTYPE)
+    errors["x"] = x_input[rows]
+    errors["y"] = y_input[rows]
+    errors["y_fit"] = y_model[rows]
+    errors["error"] = residuals[rows]
 
     if axes is None:
-        plt.figure(figsize=(8, 6))
+        fig, axes = plt.subplots(figsize=(8, 6))
     else:
         axes.clear()
-    axes.scatter(x_input, y_input, color="red", label="Original Data", zorder=5)
+    stride = max(1, -(-x_input.size // MAX_PLOT_POINTS))
+    axes.scatter(
+        x_input[::stride],
+        y_input[::stride],
+        color="red",
+        label="Original Data",
+        zorder=5,
+    )
     x_fit = np.linspace(x_input[0], x_input[-1], 100)
-    y_fit = A_fit * np.exp(B_fit * x_fit)
+    y_fit = evaluate(x_fit)
     axes.plot(x_fit, y_fit, label="Fitted Model", color="blue", linewidth=2)
     axes.set_xlabel("x")
     axes.set_ylabel("y")
-    axes.set_title("Exponential Fit: y = A * exp(B * x)")
+    axes.set_title(f"{model.capitalize()} Fit: {label}")
     axes.legend()
     axes.grid(True)
     if axes.figure is not None:
         axes.figure.canvas.draw_idle()
 
-    return {
+    results = {
         "A_fit": A_fit,
         "B_fit": B_fit,
+        "params": params,
         "x_fit": x_fit,
         "y_fit": y_fit,
         "errors": errors,
+        "summary": summary,
+        "rows_total": x_input.size,
     }
+    if bootstrap > 0:
+        results["bootstrap"] = bootstrap_fit(
+            x_input, y_input, resamples=bootstrap, weights=weights
+        )
+    return results
 
 
-def exponential_fit(x_data, y_data):
+def fit_summary(y_data, residuals) -> dict:
+    """
+    Goodness of fit from the data and the residuals y - y_model.
+
+    Returns:
+        dict with keys "rmse", "max_error" (largest |residual|) and "r2"
+        (coefficient of determination, 1 - SS_res / SS_tot).
+    """
+    y_data = np.asarray(y_data, dtype=float)
+    residuals = np.asarray(residuals, dtype=float)
+    ss_res = float(residuals @ residuals)
+    deviations = y_data - y_data.mean()
+    ss_tot = float(deviations @ deviations)
+    return {
+        "rmse": float(np.sqrt(ss_res / residuals.size)),
+        "max_error": float(np.max(np.abs(residuals))),
+        "r2": 1.0 - ss_res / ss_tot if ss_tot > 0 else np.nan,
+    }
+
+
+def exponential_fit(x_data, y_data, weights=None):
     """
     Performs an exponential fit of the model: y = A * exp(B * x)
 
@@ -56,6 +162,8 @@ def exponential_fit(x_data, y_data):
     Parameters:
         x_data (numpy.ndarray): Array of x values.
         y_data (numpy.ndarray): Array of y values.
+        weights (numpy.ndarray): Optional nonnegative point weights of the
+            squared residuals of ln(y) (as in bootstrap_fit).
 
     Returns:
         A_fit (float): Fitted coefficient A.
@@ -63,8 +171,392 @@ def exponential_fit(x_data, y_data):
     """
     # Transform the data: ln(y) = ln(A) + B * x
     Y = np.log(y_data)
-    coeff = np.polyfit(x_data, Y, 1)  # coeff[0] = B, coeff[1] = ln(A)
+    # np.polyfit weights the residuals themselves, not their squares
+    w = None if weights is None else np.sqrt(np.broadcast_to(weights, Y.shape))
+    coeff = np.polyfit(x_data, Y, 1, w=w)  # coeff[0] = B, coeff[1] = ln(A)
     B_fit = coeff[0]
     lnA_fit = coeff[1]
     A_fit = np.exp(lnA_fit)
     return A_fit, B_fit
+
+
+def _log_linear_sums(x, log_y, w) -> np.ndarray:
+    """Per-point terms w, w*x, w*x^2, w*ln y, w*x*ln y of the log-linear fit, shape (n, 5)."""
+    return np.column_stack([w, w * x, w * x * x, w * log_y, w * x * log_y])
+
+
+def _fit_from_sums(sums):
+    """Log-linear fits (A, B) from sums of _log_linear_sums (last axis); nan if degenerate."""
+    s_w, s_x, s_xx, s_y, s_xy = np.moveaxis(sums, -1, 0)
+    det = s_w * s_xx - s_x * s_x
+    # Relative threshold: resamples with (almost) a single distinct x are degenerate
+    degenerate = det <= 1e-12 * s_w * s_xx
+    with np.errstate(divide="ignore", invalid="ignore"):
+        B = np.where(degenerate, np.nan, (s_w * s_xy - s_x * s_y) / det)
+        A = np.exp((s_y - B * s_x) / s_w)
+    return A, B
+
+
+# Bytes per (resample, point) pair of one bootstrap chunk (index + count matrix)
+_BOOTSTRAP_BYTES_PER_ENTRY = 16
+
+
+def _bootstrap_chunk(args: tuple) -> tuple:
+    """Fits count resamples of the points given by their per-point sum terms."""
+    terms, count, seed = args
+    n = terms.shape[0]
+    rng = np.random.default_rng(seed)
+    index = rng.integers(0, n, size=(count, n))
+    # How often every point occurs in every resample; the sums of all
+    # resamples are then one matrix product
+    offsets = np.arange(count)[:, None] * n
+    counts = np.bincount((index + offsets).ravel(), minlength=count * n)
+    sums = counts.reshape(count, n) @ terms
+    return _fit_from_sums(sums)
+
+
+def bootstrap_fit(
+    x_data,
+    y_data,
+    resamples: int = 2000,
+    confidence: float = 0.95,
+    weights=None,
+    seed: int = 0,
+    memory_budget: int = 64 * 2**20,
+    workers: int = None,
+) -> dict:
+    """
+    Bootstrap confidence intervals for the log-linear fit of y = A * exp(B * x).
+
+    Every resample draws n points with replacement. Its fit depends only on
+    five weighted sums (see IncrementalExponentialFit), which for all
+    resamples of a chunk are one product (resample counts) @ (per-point
+    terms); no fit is run per resample. Chunks of about memory_budget bytes
+    are processed by a pool of worker processes (None: one per CPU, 1: no
+    pool). Each chunk has its own random stream derived from seed, so the
+    result does not depend on the number of workers.
+
+    Returns:
+        dict with keys:
+           - "A_fit", "B_fit": fit of the full data,
+           - "A_ci", "B_ci": (low, high) percentile intervals at the confidence level,
+           - "A_std", "B_std": bootstrap standard errors,
+           - "A_samples", "B_samples": fits of the resamples (degenerate ones removed).
+    """
+    x = np.asarray(x_data, dtype=float)
+    y = np.asarray(y_data, dtype=float)
+    w = np.broadcast_to(
+        np.ones(1) if weights is None else np.asarray(weights, dtype=float), x.shape
+    )
+    if np.any(y <= 0):
+        raise ValueError("The log-linear fit requires positive y values.")
+    # x is shifted by its mean to avoid cancellation in the sums
+    shift = x.mean()
+    terms = _log_linear_sums(x - shift, np.log(y), w)
+    A_fit, B_fit = _fit_from_sums(terms.sum(axis=0))
+
+    n = x.size
+    chunk_size = max(1, memory_budget // (_BOOTSTRAP_BYTES_PER_ENTRY * n))
+    counts = [
+        min(chunk_size, resamples - start) for start in range(0, resamples, chunk_size)
+    ]
+    seeds = np.random.SeedSequence(seed).spawn(len(counts))
+    chunks = [(terms, count, chunk_seed) for count, chunk_seed in zip(counts, seeds)]
+    if workers == 1 or len(chunks) <= 1:
+        parts = [_bootstrap_chunk(chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parts = list(executor.map(_bootstrap_chunk, chunks))
+
+    A_samples = np.concatenate([p[0] for p in parts]) if parts else np.empty(0)
+    B_samples = np.concatenate([p[1] for p in parts]) if parts else np.empty(0)
+    valid = np.isfinite(A_samples) & np.isfinite(B_samples)
+    # Undo the shift: A*exp(B*(x - shift)) = (A*exp(-B*shift)) * exp(B*x)
+    A_samples = A_samples[valid] * np.exp(-B_samples[valid] * shift)
+    B_samples = B_samples[valid]
+    tail = (1 - confidence) / 2 * 100
+
+    return {
+        "A_fit": A_fit * np.exp(-B_fit * shift),
+        "B_fit": B_fit,
+        "A_ci": tuple(float(v) for v in np.percentile(A_samples, [tail, 100 - tail])),
+        "B_ci": tuple(float(v) for v in np.percentile(B_samples, [tail, 100 - tail])),
+        "A_std": float(np.std(A_samples, ddof=1)),
+        "B_std": float(np.std(B_samples, ddof=1)),
+        "A_samples": A_samples,
+        "B_samples": B_samples,
+    }
+
+
+def _log_linear_seed(x, y, w):
+    """
+    Weighted log-linear fits of y = A * exp(B * x) for every row of y, used as
+    starting points of the nonlinear fit. The sign of A is taken from the
+    weighted sum of y and only the points of that sign are used; rows with
+    fewer than two such points start from A = weighted mean of y, B = 0.
+    """
+    sign = np.where(np.sum(w * y, axis=1, keepdims=True) < 0, -1.0, 1.0)
+    use = (sign * y > 0) & (w > 0)
+    wu = np.where(use, w, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_y = np.where(use, np.log(np.abs(y)), 0.0)
+        s0 = wu.sum(axis=1)
+        sx = (wu * x).sum(axis=1)
+        sxx = (wu * x * x).sum(axis=1)
+        sy = (wu * log_y).sum(axis=1)
+        sxy = (wu * x * log_y).sum(axis=1)
+        det = s0 * sxx - sx * sx
+        B = (s0 * sxy - sx * sy) / det
+        ln_A = (sy - B * sx) / s0
+    ok = (use.sum(axis=1) >= 2) & np.isfinite(B) & np.isfinite(ln_A) & (det > 0)
+    A = np.where(ok, sign[:, 0] * np.exp(np.where(ok, ln_A, 0.0)), 0.0)
+    mean_y = (w * y).sum(axis=1) / w.sum(axis=1)
+    return np.where(ok, A, mean_y), np.where(ok, B, 0.0)
+
+
+def exponential_fit_batch(
+    x_data, y_data, weights=None, tol: float = 1e-10, max_iter: int = 100
+) -> dict:
+    """
+    Nonlinear least-squares fits of y = A * exp(B * x) to many data series at
+    once by the Levenberg-Marquardt method, minimizing sum(w * (y - A*exp(B*x))^2).
+
+    Unlike the log-linear fit this does not weight the points by 1/y^2 and
+    accepts zero or negative y. Every series starts from the weighted
+    log-linear fit; the 2 x 2 damped normal equations of all series are
+    solved together in closed form with the analytic Jacobian
+    (exp(B*x), A*x*exp(B*x)), and each series has its own damping factor
+    and stops when its relative step drops below tol.
+
+    Parameters:
+        x_data: x values, shape (n,) shared by all series, or (m, n).
+        y_data: y values, shape (m, n) (or (n,) for a single series).
+        weights: nonnegative point weights, broadcastable to (m, n); default 1.
+
+    Returns:
+        dict with arrays of shape (m,): "A_fit", "B_fit", "iterations",
+        "converged" and "cost" (weighted sum of squared residuals).
+    """
+    y = np.atleast_2d(np.asarray(y_data, dtype=float))
+    x = np.broadcast_to(np.asarray(x_data, dtype=float), y.shape)
+    w = np.broadcast_to(
+        np.ones(1) if weights is None else np.asarray(weights, dtype=float), y.shape
+    )
+    m = y.shape[0]
+
+    def cost_and_model(A, B, rows):
+        x_r, y_r, w_r = x[rows], y[rows], w[rows]
+        with np.errstate(over="ignore", invalid="ignore"):
+            e = np.exp(B[:, None] * x_r)
+            r = y_r - A[:, None] * e
+            cost = np.sum(w_r * r * r, axis=1)
+        return np.where(np.isfinite(cost), cost, np.inf), e, r
+
+    A, B = _log_linear_seed(x, y, w)
+    cost, e, r = cost_and_model(A, B, slice(None))
+    damping = np.full(m, 1e-3)
+    iterations = np.zeros(m, dtype=int)
+    converged = np.zeros(m, dtype=bool)
+    scale = np.finfo(float).eps
+
+    # Series still being fitted, and their exp(B*x) and residuals
+    rows = np.arange(m)
+    for _ in range(max_iter):
+        if rows.size == 0:
+            break
+        iterations[rows] += 1
+        x_r, w_r, A_r, B_r = x[rows], w[rows], A[rows], B[rows]
+        # J^T W J and J^T W r for J = [e, A*x*e]
+        jB = A_r[:, None] * x_r * e
+        a = np.sum(w_r * e * e, axis=1)
+        b = np.sum(w_r * e * jB, axis=1)
+        c = np.sum(w_r * jB * jB, axis=1)
+        gA = np.sum(w_r * e * r, axis=1)
+        gB = np.sum(w_r * jB * r, axis=1)
+
+        a_d = a * (1 + damping[rows])
+        c_d = c * (1 + damping[rows])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            det = a_d * c_d - b * b
+            dA = (c_d * gA - b * gB) / det
+            dB = (a_d * gB - b * gA) / det
+        dA = np.where(np.isfinite(dA), dA, 0.0)
+        dB = np.where(np.isfinite(dB), dB, 0.0)
+
+        cost_new, e_new, r_new = cost_and_model(A_r + dA, B_r + dB, rows)
+        accept = cost_new <= cost[rows]
+        A[rows[accept]] += dA[accept]
+        B[rows[accept]] += dB[accept]
+        cost[rows[accept]] = cost_new[accept]
+        e[accept] = e_new[accept]
+        r[accept] = r_new[accept]
+        damping[rows] = np.where(accept, damping[rows] / 10, damping[rows] * 10)
+
+        step = np.maximum(
+            np.abs(dA) / (np.abs(A[rows]) + scale),
+            np.abs(dB) / (np.abs(B[rows]) + scale),
+        )
+        stalled = damping[rows] > 1e16
+        done = (accept & (step < tol)) | (cost[rows] == 0) | stalled
+        converged[rows[done & ~stalled]] = True
+        rows, e, r = rows[~done], e[~done], r[~done]
+
+    return {
+        "A_fit": A,
+        "B_fit": B,
+        "iterations": iterations,
+        "converged": converged,
+        "cost": cost,
+    }
+
+
+def exponential_fit_lm(
+    x_data, y_data, weights=None, tol: float = 1e-10, max_iter: int = 100
+):
+    """
+    Nonlinear least-squares fit of y = A * exp(B * x) (Levenberg-Marquardt,
+    seeded with the log-linear fit); see exponential_fit_batch.
+
+    Returns:
+        A_fit (float): Fitted coefficient A.
+        B_fit (float): Fitted coefficient B.
+    """
+    result = exponential_fit_batch(x_data, y_data, weights, tol, max_iter)
+    return result["A_fit"][0], result["B_fit"][0]
+
+
+class IncrementalExponentialFit:
+    """
+    Log-linear fit of y = A * exp(B * x) to a stream of points, updated in O(1)
+    per point.
+
+    The weighted least-squares line ln(y) = ln(A) + B*x depends on the data only
+    through the sums of w, w*x, w*x^2, w*ln(y) and w*x*ln(y), which are kept
+    up to date as points arrive, so fit() costs the same however long the
+    stream is. With unit weights it gives the same A_fit, B_fit as
+    exponential_fit on the same points.
+
+    With window = k only the last k points are fitted: the oldest point is
+    subtracted from the sums when a new one arrives. To keep rounding errors of
+    these subtractions from accumulating, the sums are recomputed from the
+    window after every k removals (amortized O(1) per point). x is shifted by
+    a reference value to avoid cancellation in the sums.
+    """
+
+    def __init__(self, window: int = None):
+        if window is not None and window < 2:
+            raise ValueError("The window must hold at least 2 points.")
+        self.window = window
+        self.points = deque()  # (x, ln y, w) of the points in the window
+        self.shift = None
+        self.removals = 0
+        self.sums = np.zeros(5)  # w, w*u, w*u^2, w*ln y, w*u*ln y, u = x - shift
+
+    def _terms(self, x, log_y, w):
+        u = x - self.shift
+        return np.array(
+            [
+                np.sum(w),
+                np.sum(w * u),
+                np.sum(w * u * u),
+                np.sum(w * log_y),
+                np.sum(w * u * log_y),
+            ]
+        )
+
+    def _recompute(self):
+        x, log_y, w = (np.array(v, dtype=float) for v in zip(*self.points))
+        self.shift = float(np.mean(x))
+        self.sums = self._terms(x, log_y, w)
+        self.removals = 0
+
+    def extend(self, x_data, y_data, weights=None):
+        """Adds points (arrays or scalars) to the fit."""
+        x = np.atleast_1d(np.asarray(x_data, dtype=float))
+        y = np.atleast_1d(np.asarray(y_data, dtype=float))
+        w = np.broadcast_to(
+            np.ones(1) if weights is None else np.asarray(weights, dtype=float), x.shape
+        )
+        if np.any(y <= 0):
+            raise ValueError("The log-linear fit requires positive y values.")
+        if x.size == 0:
+            return
+        log_y = np.log(y)
+        if self.shift is None:
+            self.shift = float(x[0])
+        self.sums += self._terms(x, log_y, w)
+        if self.window is None:
+            return
+
+        self.points.extend(zip(x, log_y, w))
+        overflow = len(self.points) - self.window
+        if overflow > 0:
+            old = [self.points.popleft() for _ in range(overflow)]
+            old_x, old_log_y, old_w = (np.array(v) for v in zip(*old))
+            self.sums -= self._terms(old_x, old_log_y, old_w)
+            self.removals += overflow
+            if self.removals >= self.window:
+                self._recompute()
+
+    def add(self, x, y, weight: float = 1.0):
+        """Adds one point to the fit (scalar fast path of extend)."""
+        x, y, weight = float(x), float(y), float(weight)
+        if y <= 0:
+            raise ValueError("The log-linear fit requires positive y values.")
+        log_y = math.log(y)
+        if self.shift is None:
+            self.shift = x
+        u = x - self.shift
+        self.sums += (
+            weight,
+            weight * u,
+            weight * u * u,
+            weight * log_y,
+            weight * u * log_y,
+        )
+        if self.window is None:
+            return
+
+        self.points.append((x, log_y, weight))
+        if len(self.points) > self.window:
+            old_x, old_log_y, old_w = self.points.popleft()
+            u = old_x - self.shift
+            self.sums -= (
+                old_w,
+                old_w * u,
+                old_w * u * u,
+                old_w * old_log_y,
+                old_w * u * old_log_y,
+            )
+            self.removals += 1
+            if self.removals >= self.window:
+                self._recompute()
+
+    def remove(self, x, y, weight: float = 1.0):
+        """Removes a previously added point (only without a window)."""
+        if self.window is not None:
+            raise ValueError("Points leave a windowed fit automatically.")
+        self.sums -= self._terms(
+            np.atleast_1d(float(x)),
+            np.log(np.atleast_1d(float(y))),
+            np.atleast_1d(weight),
+        )
+
+    @property
+    def count(self) -> float:
+        """Total weight of the points in the fit (their number for unit weights)."""
+        return self.sums[0]
+
+    def fit(self):
+        """
+        Returns:
+            A_fit (float): Fitted coefficient A.
+            B_fit (float): Fitted coefficient B.
+        """
+        s_w, s_u, s_uu, s_y, s_uy = self.sums
+        det = s_w * s_uu - s_u * s_u
+        if det <= 0:
+            raise ValueError("At least two distinct x values are needed to fit.")
+        B_fit = (s_w * s_uy - s_u * s_y) / det
+        lnA_fit = (s_y - B_fit * s_u) / s_w - B_fit * self.shift
+        return np.exp(lnA_fit), B_fit
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from tasks import fitting
+from tasks.fitting import LinearFitter, fit_model, get_fitter
+
+X = np.linspace(0.5, 4.0, 30)
+EXACT = {
+    "exponential": ({"A": 2.0, "B": -0.5}, lambda x: 2.0 * np.exp(-0.5 * x)),
+    "power": ({"A": 1.5, "B": 0.7}, lambda x: 1.5 * x**0.7),
+    "logarithmic": ({"A": 0.3, "B": 2.0}, lambda x: 0.3 + 2.0 * np.log(x)),
+    "saturating": ({"A": 4.0, "B": 1.2}, lambda x: 4.0 * x / (1.2 + x)),
+}
+
+
+@pytest.mark.parametrize("model", list(EXACT))
+def test_models_recover_parameters(model):
+    expected, function = EXACT[model]
+    params = fit_model(model, X, function(X))
+    for name, value in expected.items():
+        assert params[name] == pytest.approx(value, rel=1e-10)
+
+
+@pytest.mark.parametrize("degree", [0, 1, 3, 5])
+def test_polynomial_matches_polyfit(degree):
+    x = np.linspace(100.0, 110.0, 40)
+    y = np.random.default_rng(degree).normal(size=x.size)
+    params = fit_model("polynomial", x, y, degree)
+    fitter = get_fitter("polynomial", x, degree)
+    np.testing.assert_allclose(
+        fitter.evaluate(params, x),
+        np.polyval(np.polyfit(x - 105.0, y, degree), x - 105.0),
+        # Evaluating coefficients in powers of x ~ 100 loses a few digits
+        atol=1e-6,
+    )
+
+
+@pytest.mark.parametrize("model", ["polynomial", "power"])
+def test_multi_row_fit(model):
+    rng = np.random.default_rng(3)
+    Y = np.exp(rng.normal(size=(5, X.size)))
+    fitter = LinearFitter(model, X, degree=2)
+    batch = fitter.fit(Y)
+    values = fitter.evaluate(batch, X)
+    assert values.shape == (X.size, 5)
+    for i, row in enumerate(Y):
+        single = fitter.fit(row)
+        np.testing.assert_allclose(values[:, i], fitter.evaluate(single, X))
+
+
+def test_polynomial_coefficients_match_polyfit():
+    y = 1.0 - 2.0 * X + 0.5 * X**2
+    params = fit_model("polynomial", X, y, 2)
+    np.testing.assert_allclose(
+        params["coefficients"], np.polyfit(X, y, 2)[::-1], atol=1e-10
+    )
+
+
+@pytest.mark.parametrize(
+    "model, x, y",
+    [
+        ("power", [-1.0, 1.0, 2.0], [1.0, 2.0, 3.0]),
+        ("exponential", [0.0, 1.0, 2.0], [1.0, -2.0, 3.0]),
+        ("exponential", [1.0], [1.0]),
+        ("logarithmic", [2.0, 2.0, 2.0], [1.0, 2.0, 3.0]),
+        ("unknown", [1.0, 2.0], [1.0, 2.0]),
+    ],
+)
+def test_invalid_input(model, x, y):
+    with pytest.raises(ValueError):
+        fit_model(model, x, y)
+
+
+def test_fitter_cache():
+    fitting._FITTERS.clear()
+    fitter = get_fitter("exponential", X)
+    assert get_fitter("exponential", X.copy()) is fitter
+    assert get_fitter("exponential", X + 1.0) is not fitter
+    for shift in range(2 * fitting._MAX_CACHED_FITTERS):
+        get_fitter("power", X + shift)
+    assert len(fitting._FITTERS) == fitting._MAX_CACHED_FITTERS
+    assert get_fitter("exponential", X) is not fitter
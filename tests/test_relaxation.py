@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+import scipy.sparse as sp
+from scipy.sparse.linalg import spsolve
+
+from tasks.relaxation import (
+    jacobi_spectral_radius,
+    optimal_omega,
+    sor_solve,
+    sor_solve_multi,
+)
+
+
+def poisson_2d(m):
+    """5-point Laplacian on an m x m grid."""
+    T = sp.diags([-1.0, 2.0, -1.0], [-1, 0, 1], shape=(m, m))
+    I = sp.identity(m)
+    return sp.csr_matrix(sp.kron(I, T) + sp.kron(T, I))
+
+
+@pytest.fixture
+def system():
+    m = 12
+    A = poisson_2d(m)
+    b = np.random.default_rng(0).uniform(-1, 1, m * m)
+    return A, b, (m, m), spsolve(sp.csc_matrix(A), b)
+
+
+@pytest.mark.parametrize(
+    "method, omega", [("jacobi", 1.0), ("gauss-seidel", 1.0), ("sor", 1.6)]
+)
+@pytest.mark.parametrize("ordering", ["natural", "red-black"])
+def test_sor_solve_matches_spsolve(system, method, omega, ordering):
+    A, b, grid_shape, expected = system
+    result = sor_solve(
+        A,
+        b,
+        omega=omega,
+        method=method,
+        ordering=ordering,
+        grid_shape=grid_shape,
+        tol=1e-12,
+        max_iter=20000,
+    )
+    assert result["converged"]
+    np.testing.assert_allclose(result["x"], expected, rtol=1e-8, atol=1e-9)
+
+
+def test_sor_needs_fewer_iterations_than_gauss_seidel(system):
+    A, b, grid_shape, _ = system
+    iterations = {
+        method: sor_solve(A, b, omega=1.6, method=method, tol=1e-10, max_iter=5000)[
+            "iterations"
+        ]
+        for method in ("gauss-seidel", "sor")
+    }
+    assert iterations["sor"] < iterations["gauss-seidel"]
+
+
+def test_sor_solve_history(system):
+    A, b, _, _ = system
+    result = sor_solve(A, b, omega=1.5, history=True, tol=1e-8, max_iter=2000)
+    assert result["history"].shape == (result["iterations"], b.size)
+    np.testing.assert_array_equal(result["history"][-1], result["x"])
+
+
+def test_zero_diagonal_is_rejected():
+    A = sp.csr_matrix(np.array([[0.0, 1.0], [1.0, 2.0]]))
+    with pytest.raises(ValueError):
+        sor_solve(A, np.ones(2))
+
+
+def test_optimal_omega_1d_poisson():
+    n = 200
+    A = sp.diags([-1.0, 2.0, -1.0], [-1, 0, 1], shape=(n, n))
+    result = optimal_omega(A)
+    np.testing.assert_allclose(
+        result["spectral_radius"], np.cos(np.pi / (n + 1)), rtol=1e-8
+    )
+    np.testing.assert_allclose(
+        result["omega"], 2 / (1 + np.sin(np.pi / (n + 1))), rtol=1e-8
+    )
+
+
+def test_spectral_radius_nonsymmetric():
+    # Tridiagonal Toeplitz: rho(B) = 2 sqrt(a c) / d * cos(pi / (n + 1))
+    n, a, c = 50, 1.2, 0.8
+    A = sp.diags([-a, 2.0, -c], [-1, 0, 1], shape=(n, n))
+    expected = np.sqrt(a * c) * np.cos(np.pi / (n + 1))
+    assert jacobi_spectral_radius(A) == pytest.approx(expected, rel=1e-3)
+
+
+def test_optimal_omega_rejects_divergent_jacobi():
+    A = np.array([[1.0, 2.0], [2.0, 1.0]])
+    with pytest.raises(ValueError):
+        optimal_omega(A)
+
+
+@pytest.mark.parametrize("criterion", ["residual", "change"])
+def test_sor_solve_multi_matches_single_solves(system, criterion):
+    A, b, grid_shape, _ = system
+    B = np.column_stack([b, 2 * b, np.random.default_rng(1).uniform(-1, 1, b.size)])
+    B[:, 1] = 0.0
+    kwargs = dict(omega=1.6, tol=1e-10, max_iter=5000, criterion=criterion)
+    result = sor_solve_multi(A, B, **kwargs)
+    assert result["converged"].all()
+    assert result["iterations"][1] <= 1
+    for column in range(B.shape[1]):
+        single = sor_solve(A, B[:, column], **kwargs)
+        assert result["iterations"][column] == single["iterations"]
+        np.testing.assert_allclose(result["X"][:, column], single["x"], atol=1e-12)
+    np.testing.assert_allclose(
+        result["X"], spsolve(sp.csc_matrix(A), B), rtol=1e-6, atol=1e-8
+    )
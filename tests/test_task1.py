@@ -0,0 +1,83 @@
+import builtins
+
+import numpy as np
+import pytest
+
+from tasks import task1
+from tasks.task1 import biquadratic_roots, solve_task
+
+
+def real_roots(coefficients, n):
+    roots = np.roots(coefficients)
+    roots = np.real(roots[np.abs(np.imag(roots)) < 1e-9])
+    return np.unique(np.round(roots[np.abs(roots) <= n], 9))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_biquadratic_roots_match_np_roots(seed):
+    a, b, c = np.random.default_rng(seed).uniform(-5, 5, 3)
+    expected = real_roots([a, 0.0, -b, 0.0, c], 10.0)
+    roots = biquadratic_roots(10.0, a, b, c)
+    np.testing.assert_allclose(roots, expected, atol=1e-8)
+
+
+@pytest.mark.parametrize(
+    "a, b, c, expected",
+    [
+        (1.0, 2.0, 1.0, [-1.0, 1.0]),  # (x^2 - 1)^2: double roots
+        (1.0, 0.0, 0.0, [0.0]),  # x^4: root 0 once
+        (0.0, 4.0, 1.0, [-0.5, 0.5]),  # a = 0: -4x^2 + 1
+        (1.0, 5.0, 4.0, [-2.0, -1.0, 1.0, 2.0]),
+        (1.0, -1.0, 1.0, []),
+    ],
+)
+def test_biquadratic_roots_special_cases(a, b, c, expected):
+    np.testing.assert_allclose(biquadratic_roots(3.0, a, b, c), expected, atol=1e-12)
+
+
+def test_solve_task_analytic_skips_bisection():
+    result = solve_task(2, 1, 5, 4)
+    np.testing.assert_allclose(result["roots"], [-2.0, -1.0, 1.0, 2.0])
+    assert result["roots_bis"] is None
+    assert result["exact_errors"] is None
+
+
+def test_solve_task_cross_check():
+    result = solve_task(2, 1, 5, 4, cross_check=True)
+    np.testing.assert_allclose(result["roots_bis"], result["roots"], atol=1e-9)
+    assert np.max(result["exact_errors"]) < 1e-9
+
+
+def test_solve_task_bisection():
+    result = solve_task(2, 1, 5, 4, method="bisection")
+    np.testing.assert_allclose(result["roots"], [-2.0, -1.0, 1.0, 2.0], atol=1e-9)
+    assert result["roots_exact"] is None
+
+
+def test_main_smoke(monkeypatch, capsys):
+    answers = iter(["2", "1", "5", "4"])
+    monkeypatch.setattr(builtins, "input", lambda prompt="": next(answers))
+    result = task1.main()
+    for key in (
+        "roots",
+        "roots_exact",
+        "roots_graph",
+        "roots_bis",
+        "iterations_all",
+        "abs_errors",
+        "exact_errors",
+    ):
+        assert key in result
+    assert "#4" in capsys.readouterr().out
+
+
+def test_solve_batch_matches_closed_form():
+    rng = np.random.default_rng(0)
+    a, b, c = rng.uniform(-5, 5, (3, 200))
+    result = task1.solve_batch(3.0, a, b, c, num_points=2000, chunk_size=64)
+    for k in range(a.size):
+        expected = biquadratic_roots(3.0, a[k], b[k], c[k])
+        roots = result["roots_bis"][k]
+        assert result["root_counts"][k] == expected.size
+        np.testing.assert_allclose(roots[: expected.size], expected, atol=1e-9)
+        assert np.isnan(roots[expected.size :]).all()
@@ -0,0 +1,122 @@
+import numpy as np
+import pytest
+
+from tasks.rootfinding import newton, secant
+from tasks.task2 import (
+    basin_map,
+    cubic_roots,
+    cubic_roots_batch,
+    estimated_order,
+    newton_batch,
+)
+
+
+def real_roots(coefficients):
+    roots = np.roots(coefficients)
+    return np.sort(np.real(roots[np.abs(np.imag(roots)) < 1e-9]))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_cubic_roots_match_np_roots(seed):
+    coefficients = np.random.default_rng(seed).uniform(-5, 5, 4)
+    np.testing.assert_allclose(
+        cubic_roots(*coefficients), real_roots(coefficients), atol=1e-8
+    )
+
+
+@pytest.mark.parametrize(
+    "coefficients, expected",
+    [
+        ((1.0, -4.0, 5.0, -2.0), [1.0, 1.0, 2.0]),  # (x - 1)^2 (x - 2)
+        ((1.0, -3.0, 3.0, -1.0), [1.0, 1.0, 1.0]),  # (x - 1)^3
+        ((1.0, 0.0, 0.0, 0.0), [0.0, 0.0, 0.0]),
+        ((0.0, 1.0, -3.0, 2.0), [1.0, 2.0]),  # a = 0: quadratic
+        ((1.0, 0.0, 1.0, 0.0), [0.0]),  # one real root
+    ],
+)
+def test_cubic_roots_degenerate(coefficients, expected):
+    np.testing.assert_allclose(cubic_roots(*coefficients), expected, atol=1e-6)
+
+
+def test_cubic_roots_batch_matches_scalar():
+    coeffs = np.random.default_rng(0).uniform(-5, 5, (200, 4))
+    batch = cubic_roots_batch(coeffs)
+    for row, roots in zip(coeffs, batch):
+        expected = cubic_roots(*row)
+        np.testing.assert_allclose(roots[: expected.size], expected, atol=1e-8)
+        assert np.all(np.isnan(roots[expected.size :]))
+
+
+def test_basin_map_keeps_double_roots():
+    # (x - 1)^2 (x - 2): every real start point converges to 1 or 2
+    result = basin_map(1, -4, 5, -2, (-1, 4), resolution=(400, 1), workers=1)
+    np.testing.assert_allclose(result["roots"], [1.0, 2.0], atol=1e-6)
+    assert np.all(result["root_index"] >= 0)
+
+
+def test_basin_map_complex_plane():
+    # x^3 - 1: three roots on the unit circle, start points near each go there
+    result = basin_map(1, 0, 0, -1, (-2, 2), (-2, 2), resolution=(41, 41), workers=1)
+    assert len(result["roots"]) == 3
+    for k, root in enumerate(result["roots"]):
+        column = np.argmin(np.abs(result["x"] - np.real(root)))
+        row = np.argmin(np.abs(result["y"] - np.imag(root)))
+        assert result["root_index"][row, column] == k
+
+
+def test_basin_map_without_roots():
+    with pytest.raises(ValueError):
+        basin_map(0, 0, 0, 1, (-1, 1), resolution=(10, 1), workers=1)
+
+
+def test_newton_batch_finds_roots():
+    rng = np.random.default_rng(0)
+    coeffs = rng.uniform(-5, 5, (50, 4))
+    x0 = rng.uniform(-3, 3, (50, 8))
+    result = newton_batch(x0, coeffs[:, None, :], tol=1e-12, max_iter=200)
+    assert result["roots"].shape == x0.shape
+    for row, roots, converged in zip(coeffs, result["roots"], result["converged"]):
+        exact = cubic_roots(*row)
+        for root in roots[converged]:
+            assert np.min(np.abs(exact - root)) <= 1e-8 * max(1.0, abs(root))
+    assert result["converged"].mean() > 0.9
+
+
+def test_newton_batch_complex_starts():
+    # x^3 - 1: complex starting points reach all three cube roots of unity
+    x0 = np.array([1.0 + 0.1j, -0.5 + 0.9j, -0.5 - 0.9j])
+    result = newton_batch(x0, [1.0, 0.0, 0.0, -1.0])
+    assert result["converged"].all()
+    np.testing.assert_allclose(result["roots"] ** 3, 1.0, atol=1e-10)
+    assert np.unique(np.round(result["roots"], 8)).size == 3
+
+
+def test_newton_batch_zero_derivative():
+    result = newton_batch([0.0, 2.0], [1.0, 0.0, 0.0, -8.0])
+    np.testing.assert_array_equal(result["failed"], [True, False])
+    assert result["roots"][1] == pytest.approx(2.0)
+
+
+def cubic(x):
+    return x**3 - 2 * x - 5
+
+
+@pytest.mark.parametrize(
+    "method, expected",
+    [
+        (lambda: newton(cubic, lambda x: 3 * x * x - 2, 3.0, 1e-15, 100), 2.0),
+        (lambda: secant(cubic, 3.0, 2.5, 1e-15, 100), (1 + 5**0.5) / 2),
+    ],
+)
+def test_estimated_order(method, expected):
+    root = cubic_roots(1.0, 0.0, -2.0, -5.0)[0]
+    assert estimated_order(method()["iterations"], root) == pytest.approx(
+        expected, rel=0.05
+    )
+
+
+def test_estimated_order_needs_two_records():
+    root = cubic_roots(1.0, 0.0, -2.0, -5.0)[0]
+    assert estimated_order([3.0, root], root) is None
+    # Iterates at the root (rounding noise) are not used
+    assert estimated_order([3.0, 2.5, root, root, root], root) is None
@@ -0,0 +1,209 @@
+import numpy as np
+import pytest
+import scipy.sparse as sp
+from scipy.sparse.linalg import aslinearoperator
+
+from tasks.eigen import ShiftInvertSolver, krylov_eigenpairs
+from tasks.task4 import (
+    PowerSession,
+    benchmark,
+    solve_batch,
+    solve_out_of_core,
+    solve_task,
+)
+
+EIGENVALUES = np.array([10.0, -6.0, 4.0, 2.5, 1.0, 0.5, -0.25, 0.1])
+
+
+@pytest.fixture
+def symmetric():
+    n = EIGENVALUES.size
+    Q, _ = np.linalg.qr(np.random.default_rng(0).standard_normal((n, n)))
+    return Q @ np.diag(EIGENVALUES) @ Q.T
+
+
+@pytest.fixture
+def nonsymmetric():
+    n = EIGENVALUES.size
+    V = np.random.default_rng(1).standard_normal((n, n)) + 3 * np.eye(n)
+    return V @ np.diag(EIGENVALUES) @ np.linalg.inv(V)
+
+
+def dominant_eigenvalues(matrix, k):
+    values = np.linalg.eig(matrix)[0]
+    return values[np.argsort(-np.abs(values))][:k]
+
+
+def assert_eigenvectors(matrix, values, vectors, rtol=1e-6):
+    vectors = np.atleast_2d(vectors.T).T
+    for value, vector in zip(np.atleast_1d(values), vectors.T):
+        residual = matrix @ vector - value * vector
+        assert np.linalg.norm(residual) <= rtol * np.linalg.norm(vector)
+
+
+@pytest.mark.parametrize("matrix_type", ["dense", "sparse", "operator"])
+def test_power_method(symmetric, matrix_type):
+    matrix = {
+        "dense": symmetric,
+        "sparse": sp.csr_matrix(symmetric),
+        "operator": aslinearoperator(symmetric),
+    }[matrix_type]
+    result = solve_task(matrix, tol=1e-12, max_iter=2000)
+    expected = dominant_eigenvalues(symmetric, 1)[0]
+    assert result["lambda_approx"] == pytest.approx(expected, rel=1e-8)
+    # The eigenvalue change tol bounds the eigenvector error only by about sqrt(tol)
+    assert_eigenvectors(
+        symmetric, result["lambda_approx"], result["eigenvector"], rtol=1e-5
+    )
+
+
+@pytest.mark.parametrize("method", ["subspace", "lanczos", "arnoldi"])
+def test_top_k_methods(symmetric, method):
+    k = 3
+    result = solve_task(symmetric, tol=1e-12, max_iter=2000, method=method, k=k)
+    expected = dominant_eigenvalues(symmetric, k)
+    np.testing.assert_allclose(result["eigenvalues"], expected, rtol=1e-8)
+    assert result["lambda_approx"] == pytest.approx(expected[0], rel=1e-8)
+    assert_eigenvectors(symmetric, result["eigenvalues"], result["eigenvectors"])
+
+
+@pytest.mark.parametrize("k", [2, EIGENVALUES.size])
+def test_arnoldi_nonsymmetric(nonsymmetric, k):
+    result = solve_task(nonsymmetric, method="arnoldi", k=k)
+    np.testing.assert_allclose(
+        result["eigenvalues"], dominant_eigenvalues(nonsymmetric, k), rtol=1e-8
+    )
+
+
+def test_lanczos_rejects_nonsymmetric(nonsymmetric):
+    with pytest.raises(ValueError):
+        krylov_eigenpairs(nonsymmetric, 2, "lanczos")
+
+
+@pytest.mark.parametrize("shift", [3.7, -5.0, 0.6])
+@pytest.mark.parametrize("sparse", [False, True])
+def test_shift_invert(nonsymmetric, shift, sparse):
+    matrix = sp.csr_matrix(nonsymmetric) if sparse else nonsymmetric
+    result = solve_task(matrix, method="shift-invert", shift=shift, max_iter=500)
+    values = np.linalg.eig(nonsymmetric)[0]
+    expected = values[np.argmin(np.abs(values - shift))]
+    assert result["lambda_approx"] == pytest.approx(expected, rel=1e-8)
+    assert result["residual_norm"] < 1e-6
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+def test_shift_at_eigenvalue(sparse):
+    matrix = np.diag([1.0, 2.0, 3.0])
+    if sparse:
+        matrix = sp.csr_matrix(matrix)
+    result = ShiftInvertSolver(matrix).solve(2.0, x0=np.array([1.0, 1.0, 1.0]))
+    assert result["eigenvalue"] == pytest.approx(2.0)
+    assert np.isfinite(result["eigenvector"]).all()
+
+
+def test_shift_invert_rejects_operators(symmetric):
+    with pytest.raises(TypeError):
+        ShiftInvertSolver(aslinearoperator(symmetric))
+
+
+def test_session_reuses_shift_factorization(symmetric):
+    session = PowerSession(symmetric)
+    first = session.solve_shifted(3.7)
+    second = session.solve_shifted(3.7)
+    assert not first["reused"] and second["reused"]
+    assert second["lambda_approx"] == pytest.approx(4.0, rel=1e-8)
+    session.matrix_edited()
+    assert not session.solve_shifted(3.7)["reused"]
+
+
+@pytest.fixture
+def slow_matrix():
+    """Symmetric matrix with |lambda2 / lambda1| = 0.98."""
+    n = 50
+    Q, _ = np.linalg.qr(np.random.default_rng(0).standard_normal((n, n)))
+    values = np.r_[1.0, 0.98, np.linspace(0.9, -0.9, n - 2)]
+    return Q @ np.diag(values) @ Q.T
+
+
+@pytest.mark.parametrize("acceleration", ["aitken", "chebyshev"])
+def test_acceleration(slow_matrix, acceleration):
+    plain = solve_task(slow_matrix, tol=1e-12, max_iter=5000)
+    result = solve_task(
+        slow_matrix, tol=1e-12, max_iter=5000, acceleration=acceleration
+    )
+    assert result["lambda_approx"] == pytest.approx(1.0, rel=1e-9)
+    assert len(result["iter_numbers"]) < len(plain["iter_numbers"])
+    assert result["ratio_estimate"] == pytest.approx(0.98, rel=0.02)
+
+
+@pytest.mark.parametrize("max_iter", [3, 500])
+def test_solve_batch_matches_solve_task(max_iter):
+    matrices = np.random.default_rng(2).uniform(0, 1, (20, 5, 5))
+    batch = solve_batch(matrices, tol=1e-12, max_iter=max_iter, chunk_size=8)
+    assert batch["converged"].all() == (max_iter == 500)
+    for i, matrix in enumerate(matrices):
+        result = solve_task(matrix, tol=1e-12, max_iter=max_iter)
+        assert batch["eigenvalues"][i] == pytest.approx(result["lambda_approx"])
+        np.testing.assert_allclose(batch["eigenvectors"][i], result["eigenvector"])
+        assert batch["iterations"][i] == len(result["iter_numbers"])
+    if max_iter == 500:
+        expected = [dominant_eigenvalues(matrix, 1)[0] for matrix in matrices]
+        np.testing.assert_allclose(batch["eigenvalues"], expected, rtol=1e-10)
+
+
+@pytest.mark.parametrize("input_dtype", [np.float64, np.float32])
+def test_mixed_precision(symmetric, input_dtype):
+    matrix = symmetric.astype(input_dtype)
+    result = solve_task(matrix, tol=1e-12, max_iter=2000, dtype=np.float32)
+    expected = dominant_eigenvalues(matrix.astype(float), 1)[0]
+    assert result["lambda_approx"] == pytest.approx(expected, rel=1e-10)
+
+    timings = benchmark(matrix, tol=1e-12, max_iter=2000, number=1)
+    assert timings["eigenvalue_difference"] <= 1e-9 * abs(expected)
+
+
+@pytest.mark.parametrize("raw", [False, True])
+def test_out_of_core(tmp_path, symmetric, raw):
+    path = tmp_path / ("matrix.bin" if raw else "matrix.npy")
+    if raw:
+        symmetric.tofile(path)
+    else:
+        np.save(path, symmetric)
+    # Two rows per block, so every product streams several blocks
+    result = solve_out_of_core(
+        path,
+        shape=symmetric.shape if raw else None,
+        tol=1e-12,
+        max_iter=2000,
+        memory_budget=2 * 2 * symmetric.shape[1] * 8,
+        workers=2,
+    )
+    assert result["block_rows"] == 2
+    assert result["converged"]
+    expected = solve_task(symmetric, tol=1e-12, max_iter=2000)
+    assert result["lambda_approx"] == pytest.approx(expected["lambda_approx"])
+    assert result["throughput"].size == result["iterations"]
+    assert np.all(result["throughput"] > 0)
+
+
+def test_session_warm_start(symmetric):
+    session = PowerSession(symmetric)
+    cold = session.solve(tol=1e-12, max_iter=2000)
+    assert not cold["warm_start"] and cold["iterations_saved"] == 0
+
+    # A small symmetric edit, given as entry updates and as a low-rank term
+    u = np.zeros(symmetric.shape[0])
+    u[[1, 3]] = 1.0
+    session.update_entries([0, 2], [0, 2], symmetric[[0, 2], [0, 2]] + 0.01)
+    session.add_low_rank(0.01 * u, u)
+    edited = symmetric.copy()
+    edited[[0, 2], [0, 2]] += 0.01
+    edited += 0.01 * np.outer(u, u)
+
+    warm = session.solve(tol=1e-12, max_iter=2000)
+    assert warm["warm_start"] and warm["iterations_saved"] > 0
+    expected = dominant_eigenvalues(edited, 1)[0]
+    assert warm["lambda_approx"] == pytest.approx(expected, rel=1e-8)
+
+    session.set_matrix(edited)
+    assert not session.solve(tol=1e-12, max_iter=2000)["warm_start"]
@@ -0,0 +1,203 @@
+import numpy as np
+import pytest
+from scipy.optimize import curve_fit
+
+from tasks.task5 import (
+    IncrementalExponentialFit,
+    bootstrap_fit,
+    exponential_fit,
+    exponential_fit_batch,
+    exponential_fit_lm,
+    solve_task,
+)
+
+A_TRUE, B_TRUE = 2.5, -0.7
+
+
+@pytest.fixture
+def data():
+    x = np.linspace(0, 4, 40)
+    noise = np.random.default_rng(0).normal(0, 0.01, x.size)
+    return x, A_TRUE * np.exp(B_TRUE * x) * (1 + noise)
+
+
+def test_exact_data():
+    x = np.linspace(-1, 3, 25)
+    y = A_TRUE * np.exp(B_TRUE * x)
+    for fit in (exponential_fit, exponential_fit_lm):
+        A, B = fit(x, y)
+        assert A == pytest.approx(A_TRUE, rel=1e-9)
+        assert B == pytest.approx(B_TRUE, rel=1e-9)
+
+
+@pytest.mark.parametrize("fit", [exponential_fit, exponential_fit_lm])
+def test_noisy_data(data, fit):
+    A, B = fit(*data)
+    assert A == pytest.approx(A_TRUE, rel=1e-2)
+    assert B == pytest.approx(B_TRUE, rel=1e-2)
+
+
+def test_lm_negative_amplitude():
+    x = np.linspace(0, 2, 30)
+    A, B = exponential_fit_lm(x, -A_TRUE * np.exp(B_TRUE * x))
+    assert A == pytest.approx(-A_TRUE, rel=1e-9)
+    assert B == pytest.approx(B_TRUE, rel=1e-9)
+
+
+def test_lm_matches_curve_fit():
+    # Noise large enough for some y to be zero or negative
+    x = np.linspace(0, 6, 50)
+    y = A_TRUE * np.exp(B_TRUE * x) + np.random.default_rng(2).normal(0, 0.05, x.size)
+    y[-1] = 0.0
+    assert np.any(y <= 0)
+    expected, _ = curve_fit(lambda x, A, B: A * np.exp(B * x), x, y, p0=(1.0, -1.0))
+    np.testing.assert_allclose(exponential_fit_lm(x, y), expected, rtol=1e-6)
+
+
+@pytest.mark.parametrize("fit", [exponential_fit, exponential_fit_lm])
+def test_weights(data, fit):
+    x, y = data
+    # An outlier with zero weight does not change the fit
+    y_outlier = y.copy()
+    y_outlier[10] *= 5
+    weights = np.ones(x.size)
+    weights[10] = 0.0
+    mask = weights > 0
+    np.testing.assert_allclose(
+        fit(x, y_outlier, weights), fit(x[mask], y[mask]), rtol=1e-8
+    )
+    # Integer weights repeat the points
+    weights = np.arange(x.size) % 3 + 1
+    np.testing.assert_allclose(
+        fit(x, y, weights), fit(np.repeat(x, weights), np.repeat(y, weights)), rtol=1e-8
+    )
+
+
+def test_batch_matches_single_fits(data):
+    x, y = data
+    rng = np.random.default_rng(1)
+    amplitudes = rng.uniform(0.5, 5, 6)
+    rates = rng.uniform(-1, 1, 6)
+    Y = amplitudes[:, None] * np.exp(rates[:, None] * x) + rng.normal(
+        0, 0.01, (6, x.size)
+    )
+    result = exponential_fit_batch(x, Y)
+    assert result["converged"].all()
+    np.testing.assert_allclose(result["A_fit"], amplitudes, rtol=5e-2)
+    np.testing.assert_allclose(result["B_fit"], rates, atol=5e-2)
+    for row, A, B in zip(Y, result["A_fit"], result["B_fit"]):
+        np.testing.assert_allclose(exponential_fit_lm(x, row), (A, B), rtol=1e-8)
+
+
+@pytest.mark.parametrize("method", ["log-linear", "lm"])
+def test_solve_task_uses_weights(data, method):
+    x, y = data
+    weights = np.linspace(1, 3, x.size)
+    fit = exponential_fit if method == "log-linear" else exponential_fit_lm
+    result = solve_task(x, y, method=method, weights=weights)
+    np.testing.assert_allclose(
+        (result["A_fit"], result["B_fit"]), fit(x, y, weights), rtol=1e-12
+    )
+
+
+def test_solve_task_rejects_weights_of_other_models(data):
+    with pytest.raises(ValueError):
+        solve_task(*data, model="power", weights=np.ones(40))
+
+
+def test_incremental_fit_matches_exponential_fit(data):
+    x, y = data
+    stream = IncrementalExponentialFit()
+    stream.extend(x[:15], y[:15])
+    for xi, yi in zip(x[15:], y[15:]):
+        stream.add(xi, yi)
+    assert stream.count == x.size
+    np.testing.assert_allclose(stream.fit(), exponential_fit(x, y), rtol=1e-10)
+
+    stream.remove(x[0], y[0])
+    np.testing.assert_allclose(stream.fit(), exponential_fit(x[1:], y[1:]), rtol=1e-10)
+
+
+@pytest.mark.parametrize("window", [2, 7])
+def test_incremental_fit_window(data, window):
+    x, y = data
+    stream = IncrementalExponentialFit(window=window)
+    for i, (xi, yi) in enumerate(zip(x, y)):
+        if i % 2:
+            stream.add(xi, yi)
+        else:
+            stream.extend([xi], [yi])
+        if i >= 1:
+            start = max(0, i + 1 - window)
+            np.testing.assert_allclose(
+                stream.fit(),
+                exponential_fit(x[start : i + 1], y[start : i + 1]),
+                rtol=1e-8,
+            )
+    with pytest.raises(ValueError):
+        stream.remove(x[-1], y[-1])
+
+
+def test_incremental_fit_weights(data):
+    x, y = data
+    weights = np.arange(x.size) % 3 + 1.0
+    stream = IncrementalExponentialFit()
+    stream.extend(x, y, weights)
+    np.testing.assert_allclose(stream.fit(), exponential_fit(x, y, weights), rtol=1e-10)
+
+
+def test_incremental_fit_needs_two_x_values():
+    stream = IncrementalExponentialFit()
+    stream.add(1.0, 2.0)
+    with pytest.raises(ValueError):
+        stream.fit()
+    with pytest.raises(ValueError):
+        stream.add(2.0, -1.0)
+
+
+@pytest.mark.parametrize("max_rows", [None, 5])
+def test_error_table(data, max_rows):
+    x, y = data
+    result = solve_task(x, y, max_rows=max_rows)
+    y_model = result["A_fit"] * np.exp(result["B_fit"] * x)
+    errors = result["errors"]
+    rows = x.size if max_rows is None else max_rows
+    assert errors.size == rows and result["rows_total"] == x.size
+    np.testing.assert_array_equal(errors["x"], x[:rows])
+    np.testing.assert_allclose(errors["y_fit"], y_model[:rows])
+    np.testing.assert_allclose(errors["error"], y[:rows] - y_model[:rows])
+
+    residuals = y - y_model
+    summary = result["summary"]
+    assert summary["rmse"] == pytest.approx(np.sqrt(np.mean(residuals**2)))
+    assert summary["max_error"] == pytest.approx(np.max(np.abs(residuals)))
+    assert summary["r2"] == pytest.approx(
+        1 - np.sum(residuals**2) / np.sum((y - y.mean()) ** 2)
+    )
+
+
+def test_bootstrap_intervals(data):
+    x, y = data
+    result = bootstrap_fit(x, y, resamples=1000, workers=1)
+    np.testing.assert_allclose(
+        (result["A_fit"], result["B_fit"]), exponential_fit(x, y), rtol=1e-10
+    )
+    assert result["A_ci"][0] < A_TRUE < result["A_ci"][1]
+    assert result["B_ci"][0] < B_TRUE < result["B_ci"][1]
+    assert result["A_samples"].size == 1000
+    assert result["B_std"] == pytest.approx(np.std(result["B_samples"], ddof=1))
+
+
+def test_bootstrap_does_not_depend_on_workers(data):
+    x, y = data
+    weights = np.linspace(1, 2, x.size)
+    # About 10 resamples per chunk
+    kwargs = dict(resamples=300, weights=weights, memory_budget=10 * 16 * x.size)
+    serial = bootstrap_fit(x, y, workers=1, **kwargs)
+    parallel = bootstrap_fit(x, y, workers=2, **kwargs)
+    np.testing.assert_allclose(
+        (serial["A_fit"], serial["B_fit"]), exponential_fit(x, y, weights), rtol=1e-10
+    )
+    assert serial["A_samples"].size == 300
+    np.testing.assert_array_equal(serial["A_samples"], parallel["A_samples"])
+    np.testing.assert_array_equal(serial["B_samples"], parallel["B_samples"])